@@ -11,31 +11,41 @@ r"""step_5_update_roster_file.py
     This script requires the following files to be placed in the "utilities" folder alongside it, meaning in 
     os.path.join(os.path.dirname(os.path.abspath(__file__)), r"utilities\") : 
         1) The main helper file, "roster_manager.py"
-        2) The individual position helper files, like "_center.py", etc.
-        3) The file 'player_roles.py', used to decide which roles to assign to players
-        4) The file 'randomizer_functions.py', which is used when generating psuedo-random numbers
-        5) The folder and file "tdbaccess\new\tdbaccess.dll"
-        6) colleges_and_ids.csv
-        7) teams_and_ids.csv
+        2) The folder "positions", with the spec of each position, like "center.json", etc.
+        3) The file 'distributions.json', with the weighted distributions shared by the specs (see 'distributions.py')
+        4) The file 'player_roles.py', used to decide which roles to assign to players
+        5) The file 'overall_ratings.py', with each position's formula for its players' overall ratings
+        6) The file 'pay_tiers.py', which scales players' salaries and bonuses by the season's pay adjustments
+        7) The file 'college_resolver.py', which finds players' college IDs by name (from colleges_and_ids.csv)
+        8) The file 'team_matcher.py', which finds players' team IDs by name (from teams_and_ids.csv)
+        9) The file 'position_specs.py', which compiles the position specs into the functions that create the players
+        10) The file 'player_attributes.py', which loads the player attributes CSV file into typed columns
+        11) The file 'player_streams.py', which gives each player his own stream of random numbers
+        12) The file 'roster_manifest.py', which records what current.ros was made from, for incremental runs
+        13) The folder and file "tdbaccess\new\tdbaccess.dll" (only needed when ROSTER_BACKEND is "dll")
+        14) colleges_and_ids.csv
+        15) teams_and_ids.csv
     Additionally, the base Madden roster file to update, named "base.ros", must be in the "process\inputs\step5" 
     folder, and the final version of the current player attributes file must be in "process\inputs\step5" as a CSV file 
     named "Current Player Attributes.csv."
     
     This script (or, more accurately, its helper, "roster_manager.py") will generate the file "current.ros" in the 
-    folder "outputs\step5\".
+    folder "outputs\step5\", along with "current.ros.manifest.json", which lets the next run only recreate the players 
+    whose rows have changed.
 """
 
 # ----------------------------------------------------- SECTION 1 -----------------------------------------------------
 # ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
 # 1 - Standard library imports
 
-import csv, logging, os
+import logging, os
 #from importlib import reload
 
 # 2 - Third-party imports
 
 # 3 - Application-specific imports
 
+from utilities.player_attributes import load_player_attributes
 from utilities.roster_manager import RosterManager
 
 # 4 - Global settings
@@ -51,6 +61,26 @@ logging.basicConfig(level=logging.INFO)
 # This will be the directory above the directory this file is in.
 BASE_MADDEN_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# The RosterManager backend to use. With "image", all the player records are packed into an in-memory copy of 
+# base.ros and current.ros is written in one go; with "dll", every field is set through the TDBAccess DLL (Windows 
+# only, and much slower).
+ROSTER_BACKEND = "image"
+
+# The seed for the players' random picks. With None, a new seed is picked (and logged) on each full run, and an 
+# incremental run carries on with the seed current.ros was made with; set it to a logged seed to create exactly the 
+# same players again.
+RUN_SEED = None
+
+# Whether to patch the existing current.ros, creating only the players whose rows of the player attributes file have 
+# changed (or are new) since it was made. This only happens with the "image" backend, only if nothing else that goes 
+# into the players (the position specs, their code, the lookup files, or base.ros) has changed, and only if current.ros 
+# itself hasn't been replaced or edited since; see "roster_manifest.py". Otherwise every player is created.
+INCREMENTAL = True
+
+# The season whose pay adjustments ("docs\Pay Calculations\[year]\pay_adjustments.csv") scale the players' salaries 
+# and bonuses. Change it when moving on to a new season's roster (or set it back to rerun a past season with its own).
+PAY_YEAR = 2019
+
 
 # ----------------------------------------------------- SECTION 2 -----------------------------------------------------
 # ------------------------------------------------ Class Declarations -------------------------------------------------
@@ -63,83 +93,35 @@ BASE_MADDEN_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 # ----------------------------------------------------- SECTION 4 -----------------------------------------------------
 # ------------------------------------------------ Main Functionality -------------------------------------------------
 
-# Open the CSV file with all the players and their current attributes.
-with open(os.path.join(
-    BASE_MADDEN_PATH, 
-    r"process\inputs\step5\Current Player Attributes.csv")
-         ) as PLAYER_ATTRIBUTES_FILE: 
-    # Get a DictReader to read the rows into dicts using the header row as keys.
-    ATTRIBUTES_DICT_READER = csv.DictReader(PLAYER_ATTRIBUTES_FILE)
-    # Pull our records into a list so we can count them and iterate over them as often as needed.
-    NEW_PLAYER_LIST = list(ATTRIBUTES_DICT_READER)
-
-# Get the number of new players, ie. the count of dicts in the list.
-NEW_PLAYER_COUNT = len(NEW_PLAYER_LIST)
-logging.info("NEW_PLAYER_COUNT = %d", NEW_PLAYER_COUNT)
-
-try:
+# The workers that create_players starts import this script (on Windows), so only run it when it is the main script.
+if __name__ == "__main__":
     
-    # Instantiate our RosterManager object.
-    ROSTERMANAGER = RosterManager()
-    
-    # Size our player table.
-    ROSTERMANAGER.size_player_table(NEW_PLAYER_COUNT)
-    
-    # Loop over each element in the list and process the player's attributes for inserting into our roster file.
-    for i, player_dict in enumerate(NEW_PLAYER_LIST):
+    # Load the CSV file with all the players and their current attributes, parsing each column just once.
+    NEW_PLAYER_ATTRIBUTES = load_player_attributes(os.path.join(
+        BASE_MADDEN_PATH, 
+        "process", "inputs", "step5", "Current Player Attributes.csv"))
+
+    # Get the number of new players, ie. the count of rows in the file.
+    NEW_PLAYER_COUNT = len(NEW_PLAYER_ATTRIBUTES)
+    logging.info("NEW_PLAYER_COUNT = %d", NEW_PLAYER_COUNT)
+
+    try:
         
-        # Determine which function to call based on the 'position' field value.
-        if player_dict["position"].upper() == "QB":
-            ROSTERMANAGER.create_quarterback(player_dict, i)
-        elif player_dict["position"].upper() == "HB":
-            ROSTERMANAGER.create_halfback(player_dict, i)
-        elif player_dict["position"].upper() == "FB":
-            ROSTERMANAGER.create_fullback(player_dict, i)
-        elif player_dict["position"].upper() == "WR":
-            ROSTERMANAGER.create_wide_receiver(player_dict, i)
-        elif player_dict["position"].upper() == "TE":
-            ROSTERMANAGER.create_tight_end(player_dict, i)
-        elif player_dict["position"].upper() == "LT":
-            ROSTERMANAGER.create_left_tackle(player_dict, i)
-        elif player_dict["position"].upper() == "LG":
-            ROSTERMANAGER.create_left_guard(player_dict, i)
-        elif player_dict["position"].upper() == "C":
-            ROSTERMANAGER.create_center(player_dict, i)
-        elif player_dict["position"].upper() == "RG":
-            ROSTERMANAGER.create_right_guard(player_dict, i)
-        elif player_dict["position"].upper() == "RT":
-            ROSTERMANAGER.create_right_tackle(player_dict, i)
-        elif player_dict["position"].upper() == "LE":
-            ROSTERMANAGER.create_left_end(player_dict, i)
-        elif player_dict["position"].upper() == "RE":
-            ROSTERMANAGER.create_right_end(player_dict, i)
-        elif player_dict["position"].upper() == "DT":
-            ROSTERMANAGER.create_defensive_tackle(player_dict, i)
-        elif player_dict["position"].upper() == "LOLB":
-            ROSTERMANAGER.create_left_outside_linebacker(player_dict, i)
-        elif player_dict["position"].upper() == "MLB":
-            ROSTERMANAGER.create_middle_linebacker(player_dict, i)
-        elif player_dict["position"].upper() == "ROLB":
-            ROSTERMANAGER.create_right_outside_linebacker(player_dict, i)
-        elif player_dict["position"].upper() == "CB":
-            ROSTERMANAGER.create_cornerback(player_dict, i)
-        elif player_dict["position"].upper() == "FS":
-            ROSTERMANAGER.create_free_safety(player_dict, i)
-        elif player_dict["position"].upper() == "SS":
-            ROSTERMANAGER.create_strong_safety(player_dict, i)
-        elif player_dict["position"].upper() == "K":
-            ROSTERMANAGER.create_kicker(player_dict, i)
-        elif player_dict["position"].upper() == "P":
-            ROSTERMANAGER.create_punter(player_dict, i)
-        else:
-            logging.error("Player %d's position was not recognized: %s", i, player_dict["position"].upper())
-    
-    # Compact, save, and close the DB.
-    ROSTERMANAGER.compact_save_close_db()
-    
-except SystemExit:
-    logging.critical("Unable to open file 'current.ros'. TDBOpen returned -1. Exiting.")
+        # Instantiate our RosterManager object.
+        ROSTERMANAGER = RosterManager(PAY_YEAR, ROSTER_BACKEND, INCREMENTAL)
+        
+        # Size our player table.
+        ROSTERMANAGER.size_player_table(NEW_PLAYER_COUNT)
+        
+        # Create all of the players, computing them in a pool of worker processes.
+        ROSTERMANAGER.create_players(NEW_PLAYER_ATTRIBUTES, RUN_SEED)
+        
+        # Compact, save, and close the DB.
+        ROSTERMANAGER.compact_save_close_db()
+        
+    except SystemExit:
+        logging.critical("Unable to open file 'current.ros'. TDBOpen returned -1. Exiting.")
 
-except RuntimeError:
-    # This makes sure that, in case of an error, we correctly close the DB file.
-    ROSTERMANAGER.__del__()
+    except RuntimeError:
+        # This makes sure that, in case of an error, we correctly close the DB file.
+        ROSTERMANAGER.__del__()
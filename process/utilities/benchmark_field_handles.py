@@ -0,0 +1,98 @@
+r"""benchmark_field_handles.py
+
+    This script measures what RosterManager saves per DLL call by passing prepared c_wchar_p handles for the PLAY table
+    name and its field names (see RosterManager.prepare_player_field_handles) instead of fresh Python strings, which
+    ctypes has to marshal into new c_wchar_p objects on every call.
+
+    The TDBAccess DLL only runs on Windows, so instead of TDBFieldSetValueAsInteger we call the C library's wcsncmp,
+    which takes the same kind of arguments (two wide strings and an integer) and does almost no work itself. That
+    leaves the time spent crossing the ctypes boundary, which is what the handles change. It runs 110 fields' worth of
+    calls for each player in a full roster, the way step 5 does.
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import ctypes, ctypes.util, os, sys, timeit
+
+
+# 1.2 - Third-party imports
+
+
+# 1.3 - Application-specific imports
+
+from tdb_file import TDBFile
+
+
+# 1.4 - Global settings
+
+
+# 1.5 - Global constants
+
+PLAYERS_TABLE = 'PLAY'
+
+# The number of players to time the calls for; about the size of a full roster.
+PLAYER_COUNT = 3000
+
+# How many times to repeat each measurement (we report the best).
+REPEAT_COUNT = 5
+
+# Set the base path we will use to keep other paths relative, and shorter :^)
+# This will be the directory above the directory above the directory this file is in.
+BASE_MADDEN_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BASE_ROSTER_PATH = os.path.join(BASE_MADDEN_PATH, "process", "inputs", "step5", "base.ros")
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def load_wcsncmp():
+    """ Returns the C library's wcsncmp function, with its argtypes set like those of the DLL's field functions. """
+    if sys.platform == "win32":
+        c_library = ctypes.cdll.msvcrt
+    else:
+        c_library = ctypes.CDLL(ctypes.util.find_library("c"))
+    wcsncmp = c_library.wcsncmp
+    wcsncmp.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_size_t]
+    wcsncmp.restype = ctypes.c_int
+    return wcsncmp
+
+def time_calls(function, table_argument, field_arguments):
+    """ Returns the best time, in seconds, to call the function once per field for each of PLAYER_COUNT players. """
+    def run():
+        for _ in range(PLAYER_COUNT):
+            for field_argument in field_arguments:
+                function(table_argument, field_argument, 4)
+    return min(timeit.repeat(run, number=1, repeat=REPEAT_COUNT))
+
+
+# ----------------------------------------------------- SECTION 4 -----------------------------------------------------
+# -------------------------------------------------- Main Function ----------------------------------------------------
+
+# Get the PLAY table's field names from the base roster.
+with TDBFile(BASE_ROSTER_PATH) as base_roster:
+    FIELD_NAMES = [field.name for field in base_roster.get_table(PLAYERS_TABLE).fields]
+
+# Build our handles the same way RosterManager does.
+PLAYERS_TABLE_HANDLE = ctypes.c_wchar_p(PLAYERS_TABLE)
+FIELD_HANDLES = [ctypes.c_wchar_p(field_name) for field_name in FIELD_NAMES]
+
+WCSNCMP = load_wcsncmp()
+CALL_COUNT = PLAYER_COUNT * len(FIELD_NAMES)
+
+STRING_SECONDS = time_calls(WCSNCMP, PLAYERS_TABLE, FIELD_NAMES)
+HANDLE_SECONDS = time_calls(WCSNCMP, PLAYERS_TABLE_HANDLE, FIELD_HANDLES)
+
+print("{0:,} calls ({1:,} players x {2} fields), best of {3}:".format(
+    CALL_COUNT, PLAYER_COUNT, len(FIELD_NAMES), REPEAT_COUNT))
+print("    Python strings:   {0:.3f} s ({1:.0f} ns per call)".format(STRING_SECONDS, 1e9 * STRING_SECONDS / CALL_COUNT))
+print("    prepared handles: {0:.3f} s ({1:.0f} ns per call)".format(HANDLE_SECONDS, 1e9 * HANDLE_SECONDS / CALL_COUNT))
+print("    saving:           {0:.0f} ns per call ({1:.0%})".format(
+    1e9 * (STRING_SECONDS - HANDLE_SECONDS) / CALL_COUNT, 1 - (HANDLE_SECONDS / STRING_SECONDS)))
@@ -0,0 +1,95 @@
+r"""benchmark_player_attributes.py
+
+    This script compares the two ways step 5 has loaded "Current Player Attributes.csv" for the compute phase:
+        1) As a list of dicts of strings (one dict per player, from csv.DictReader), which the position specs then had
+            to parse with int() every time they used a numeric attribute. We time the load plus one int() of each
+            numeric cell, which is the least that approach ever did.
+        2) As a PlayerAttributes (see "player_attributes.py"), in which each column is parsed just once, into a typed
+            NumPy array, with the empty cells masked and the -1s tracked in a bitmask.
+    For each, it reports the best time, the peak memory allocated while loading (from tracemalloc), and the memory
+    still held by the loaded players afterwards.
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import csv, os, timeit, tracemalloc
+
+
+# 1.2 - Third-party imports
+
+import numpy as np
+
+
+# 1.3 - Application-specific imports
+
+from player_attributes import load_player_attributes
+
+
+# 1.4 - Global settings
+
+
+# 1.5 - Global constants
+
+# How many times to repeat each timing (we report the best).
+REPEAT_COUNT = 5
+
+# Set the base path we will use to keep other paths relative, and shorter :^)
+# This will be the directory above the directory above the directory this file is in.
+BASE_MADDEN_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ATTRIBUTES_PATH = os.path.join(BASE_MADDEN_PATH, "process", "inputs", "step5", "Current Player Attributes.csv")
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def load_player_dicts(csv_path, numeric_columns):
+    """ Loads the CSV the old way, into a list of dicts of strings, then parses each numeric cell once with int(). """
+    with open(csv_path) as attributes_file:
+        player_dicts = list(csv.DictReader(attributes_file))
+    for player_dict in player_dicts:
+        for column_name in numeric_columns:
+            if player_dict[column_name]:
+                int(player_dict[column_name])
+    return player_dicts
+
+def measure_memory(function, *arguments):
+    """ Returns the peak memory allocated while running the function, and the memory its result still holds. """
+    tracemalloc.start()
+    result = function(*arguments)
+    held_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak_bytes, held_bytes
+
+
+# ----------------------------------------------------- SECTION 4 -----------------------------------------------------
+# -------------------------------------------------- Main Function ----------------------------------------------------
+
+# Find out which columns are numeric the same way the loader does.
+PLAYER_ATTRIBUTES = load_player_attributes(ATTRIBUTES_PATH)
+NUMERIC_COLUMNS = [
+    column_name for column_name in PLAYER_ATTRIBUTES.column_names
+    if isinstance(PLAYER_ATTRIBUTES[column_name], np.ma.MaskedArray)
+]
+
+DICT_SECONDS = min(timeit.repeat(
+    lambda: load_player_dicts(ATTRIBUTES_PATH, NUMERIC_COLUMNS), number=1, repeat=REPEAT_COUNT))
+COLUMN_SECONDS = min(timeit.repeat(
+    lambda: load_player_attributes(ATTRIBUTES_PATH), number=1, repeat=REPEAT_COUNT))
+DICT_PEAK, DICT_HELD = measure_memory(load_player_dicts, ATTRIBUTES_PATH, NUMERIC_COLUMNS)
+COLUMN_PEAK, COLUMN_HELD = measure_memory(load_player_attributes, ATTRIBUTES_PATH)
+
+print("{0:,} players, {1} columns ({2} numeric), best of {3}:".format(
+    len(PLAYER_ATTRIBUTES), len(PLAYER_ATTRIBUTES.column_names), len(NUMERIC_COLUMNS), REPEAT_COUNT))
+print("    list of dicts:    {0:.3f} s, peak {1:.1f} MB, held {2:.1f} MB".format(
+    DICT_SECONDS, DICT_PEAK / 2**20, DICT_HELD / 2**20))
+print("    typed columns:    {0:.3f} s, peak {1:.1f} MB, held {2:.1f} MB".format(
+    COLUMN_SECONDS, COLUMN_PEAK / 2**20, COLUMN_HELD / 2**20))
@@ -0,0 +1,116 @@
+r"""benchmark_samplers.py
+
+    This script measures the cost of one weighted random pick, for every distinct distribution in the position specs,
+    made each of these ways:
+        1) The old get_weighted_random: build an array from the weights, normalize it, and call numpy.random.choice
+            (which checks the probabilities and builds their cumulative sums again on every call).
+        2) The new get_weighted_random, which looks up the distribution's cached AliasSampler (see "samplers.py").
+        3) A binary search of the distribution's cumulative weights, built once (how the specs picked before).
+        4) AliasSampler.pick, with the sampler already in hand (how the compiled specs pick for one player).
+        5) samplers.sample, making a block of picks (about a position group's worth) from one distribution at once
+            (how the batch specs pick for a whole group of players).
+    The picks (or blocks) go round the distributions in turn, as they do when players are created. Run it from the
+    "process" folder with:
+        > python -m utilities.benchmark_samplers
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import timeit
+
+
+# 1.2 - Third-party imports
+
+import numpy as np
+
+
+# 1.3 - Application-specific imports
+
+from .position_specs import load_position_specs
+from .randomizer_functions import get_weighted_random
+from .samplers import SAMPLERS, sample
+
+
+# 1.4 - Global settings
+
+
+# 1.5 - Global constants
+
+# The number of picks to time each way (the old way gets a tenth as many, since it is so much slower).
+PICK_COUNT = 200000
+
+# The number of picks in each block, for samplers.sample; about the number of players at a position like WR.
+BLOCK_SIZE = 300
+
+# How many times to repeat each measurement (we report the best).
+REPEAT_COUNT = 5
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def old_weighted_random(values_list, weights_list):
+    """ get_weighted_random as it was before the samplers: normalizes the weights and calls numpy.random.choice. """
+    weights_array = np.array(weights_list)
+    normalized_weights = weights_array / weights_array.sum()
+    return np.random.choice(values_list, p=normalized_weights)
+
+def time_picks(pick, arguments, pick_count):
+    """ Returns the best time, in nanoseconds per pick, to call pick(*arguments[i]) going round the arguments. """
+    call_arguments = [arguments[pick_number % len(arguments)] for pick_number in range(pick_count)]
+    def run():
+        for pick_arguments in call_arguments:
+            pick(*pick_arguments)
+    return 1e9 * min(timeit.repeat(run, number=1, repeat=REPEAT_COUNT)) / pick_count
+
+
+# ----------------------------------------------------- SECTION 4 -----------------------------------------------------
+# -------------------------------------------------- Main Function ----------------------------------------------------
+
+if __name__ == "__main__":
+
+    # Compiling the specs builds (and caches) a sampler for each of their distinct distributions.
+    POSITION_SPECS = load_position_specs()
+    DISTRIBUTIONS = [(sampler.value_list, sampler.probabilities.tolist(), sampler) for sampler in SAMPLERS]
+    CUMULATIVE_WEIGHTS = [np.cumsum(weights) for _, weights, _ in DISTRIBUTIONS]
+    UNIFORMS = np.random.random_sample(PICK_COUNT).tolist()
+    GENERATOR = np.random.default_rng()
+
+    RESULTS = [
+        ("old get_weighted_random", time_picks(
+            old_weighted_random, [(values, weights) for values, weights, _ in DISTRIBUTIONS], PICK_COUNT // 10)),
+        ("cached get_weighted_random", time_picks(
+            get_weighted_random, [(values, weights) for values, weights, _ in DISTRIBUTIONS], PICK_COUNT)),
+        ("cumulative weights search", time_picks(
+            lambda values, cumulative_weights, uniform: values[int(np.searchsorted(cumulative_weights, uniform))],
+            [
+                (values, cumulative_weights, UNIFORMS[number])
+                for number, ((values, _, _), cumulative_weights) in enumerate(zip(DISTRIBUTIONS, CUMULATIVE_WEIGHTS))
+            ],
+            PICK_COUNT
+        )),
+        ("AliasSampler.pick", time_picks(
+            lambda sampler, uniform: sampler.pick(uniform),
+            [(sampler, UNIFORMS[number]) for number, (_, _, sampler) in enumerate(DISTRIBUTIONS)],
+            PICK_COUNT
+        )),
+        ("sample, blocks of {0}".format(BLOCK_SIZE), time_picks(
+            sample,
+            [(sampler.content_hash, BLOCK_SIZE, GENERATOR) for _, _, sampler in DISTRIBUTIONS],
+            PICK_COUNT // BLOCK_SIZE
+        ) / BLOCK_SIZE),
+    ]
+
+    print("{0} distinct distributions in {1} position specs, best of {2}:".format(
+        len(DISTRIBUTIONS), len(POSITION_SPECS), REPEAT_COUNT))
+    OLD_NANOSECONDS = RESULTS[0][1]
+    for method_name, nanoseconds in RESULTS:
+        print("    {0:<28}{1:>8.0f} ns per pick ({2:.0f}x)".format(
+            method_name + ":", nanoseconds, OLD_NANOSECONDS / nanoseconds))
@@ -0,0 +1,195 @@
+r"""college_resolver.py
+
+    This module contains the CollegeResolver class, which finds the Madden ID of a player's college (PCOL) from its
+    name in the player attributes CSV, using the names and IDs in "colleges_and_ids.csv". It is built once (by
+    RosterLookups; see "roster_manager.py"), and the position specs look a player's college up with
+    "roster.colleges.college_id(player['college'])", which works on a single name, or just as well on a NumPy array
+    of them (one element per player).
+
+    Names are matched by a normalized key, so that case, punctuation, curly apostrophes, and "St." for "State" don't
+    matter: "Stephen F. Austin St." finds "Stephen F. Austin State", and "st johns" finds "St. John's" (a leading "St."
+    is "Saint"). A name with no such match may still be a near miss, like "Tennesee": the colleges' keys are indexed by
+    their trigrams (three-letter pieces), so the few keys that share most of the name's trigrams can be checked for
+    being just one edit (a letter added, dropped, changed, or swapped with its neighbour) away from it. Only a single
+    such college is taken; two or more are as good as none. (Two edits, we found, are enough to turn one real college
+    into another, like "Bowie State" into "Boise State", or "South Alabama" into "North Alabama".)
+
+    A name that matches no college gets DEFAULT_COLLEGE_ID ("N/A"). Each name is only resolved once (they are cached),
+    and RosterManager logs a summary of the names that missed, or were taken as near misses, rather than each player.
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import collections, csv, functools, os, re, unicodedata
+
+
+# 1.2 - Third-party imports
+
+import numpy as np
+
+
+# 1.3 - Application-specific imports
+
+
+# 1.4 - Global settings
+
+# The most names to remember the college ID of.
+CACHE_SIZE = 4096
+
+# The most edits a near miss can be from a college's name, and the shortest key (in letters) we look for them with.
+MAX_EDITS = 1
+MIN_NEAR_MISS_LENGTH = 5
+
+
+# 1.5 - Global constants
+
+# The file of colleges' names and IDs.
+COLLEGES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "colleges_and_ids.csv")
+
+# The college ID of a player whose college we can't find ("N/A").
+DEFAULT_COLLEGE_ID = 265
+
+# The characters that can stand for an apostrophe.
+APOSTROPHES = "'‘’ʼ`"
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+class CollegeResolver:
+    """ Finds colleges' IDs by their (normalized) names, allowing for near misses, and counts the names it can't. """
+
+    def __init__(self, colleges, default_id=DEFAULT_COLLEGE_ID):
+        self.default_id = default_id
+        # Each college's name and ID, by its key.
+        self.colleges_by_key = {}
+        for name, college_id in colleges:
+            key = normalized_name(name)
+            if key in self.colleges_by_key:
+                raise ValueError("colleges {0!r} and {1!r} have the same key, {2!r}".format(
+                    self.colleges_by_key[key][0], name, key))
+            self.colleges_by_key[key] = (name, college_id)
+        # The keys with each trigram in them.
+        self.keys_by_trigram = collections.defaultdict(list)
+        for key in self.colleges_by_key:
+            for trigram in trigrams(key):
+                self.keys_by_trigram[trigram].append(key)
+        self.cached_college_id = functools.lru_cache(maxsize=CACHE_SIZE)(self.find_college_id)
+
+    def __repr__(self):
+        return "CollegeResolver(colleges={0})".format(len(self.colleges_by_key))
+
+    def __getstate__(self):
+        # The cache can't be pickled (to send to the worker processes); they each start their own.
+        state = self.__dict__.copy()
+        del state["cached_college_id"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.cached_college_id = functools.lru_cache(maxsize=CACHE_SIZE)(self.find_college_id)
+
+    @classmethod
+    def from_csv(cls, colleges_path=COLLEGES_PATH):
+        """ Reads a CSV file with a "name" and an "id" column. """
+        with open(colleges_path) as colleges_file:
+            return cls([(row["name"], int(row["id"])) for row in csv.DictReader(colleges_file)])
+
+    def resolve(self, college_name):
+        """ Returns the name and ID of a college (or None and the default ID), and whether it was a near miss. """
+        key = normalized_name(college_name)
+        if key in self.colleges_by_key:
+            return self.colleges_by_key[key] + (False,)
+        near_misses = self.near_misses(key)
+        if len(near_misses) == 1:
+            return self.colleges_by_key[near_misses[0]] + (True,)
+        return None, self.default_id, False
+
+    def near_misses(self, key):
+        """ Returns the keys that are within MAX_EDITS of a key with no college of its own. """
+        if len(key) < MIN_NEAR_MISS_LENGTH:
+            return []
+        # Each edit changes at most four of a key's trigrams, so a near miss must share the rest of them.
+        key_trigrams = trigrams(key)
+        shared_counts = collections.Counter(
+            other_key for trigram in key_trigrams for other_key in self.keys_by_trigram.get(trigram, ()))
+        least_shared = len(key_trigrams) - 4 * MAX_EDITS
+        return [
+            other_key for other_key, shared_count in shared_counts.items()
+            if shared_count >= least_shared and edit_distance(key, other_key) <= MAX_EDITS
+        ]
+
+    def find_college_id(self, college_name):
+        """ Returns the ID of a college, by its name; see resolve. """
+        return self.resolve(college_name)[1]
+
+    def college_id(self, college_names):
+        """ Returns the ID of a college by its name, or, given an array of names, an array of their IDs. """
+        if np.ndim(college_names) == 0:
+            return self.cached_college_id(str(college_names))
+        # Each different name is looked up once.
+        unique_names, inverse = np.unique(np.asarray(college_names, dtype=str), return_inverse=True)
+        unique_ids = np.array([self.cached_college_id(name) for name in unique_names.tolist()], dtype=np.int64)
+        return unique_ids[inverse.reshape(-1)]
+
+    def summary(self, college_names):
+        """ Returns a description of the names (of a column of them) that missed, or were near misses; or None. """
+        misses = collections.Counter()
+        near_misses = {}
+        for college_name, count in collections.Counter(np.asarray(college_names, dtype=str).tolist()).items():
+            name, _, near_miss = self.resolve(college_name)
+            if name is None:
+                misses[college_name] += count
+            elif near_miss:
+                near_misses[college_name] = (name, count)
+        lines = []
+        if misses:
+            lines.append("{0} players' colleges ({1} names) were not found, so got college ID {2}: {3}".format(
+                sum(misses.values()), len(misses), self.default_id,
+                ", ".join("{0!r} ({1})".format(name, count) for name, count in misses.most_common())))
+        if near_misses:
+            lines.append("{0} players' colleges were taken to be misspellings: {1}".format(
+                sum(count for _, count in near_misses.values()),
+                ", ".join("{0!r} as {1!r} ({2})".format(college_name, name, count)
+                          for college_name, (name, count) in sorted(near_misses.items()))))
+        return "\n".join(lines) or None
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def normalized_name(name):
+    """ Returns a college name's key: lowercase words, without punctuation, with "St." for "State" spelled out. """
+    name = unicodedata.normalize("NFKC", name).casefold()
+    for apostrophe in APOSTROPHES:
+        name = name.replace(apostrophe, "")
+    words = re.sub(r"[^\w&]+", " ", name.replace("&", " & ")).split()
+    # "St." is "State" unless it begins the name ("St. Francis"); "Saint" is always "St.".
+    return " ".join(
+        "st" if word == "saint" else "state" if word == "st" and number > 0 else word
+        for number, word in enumerate(words)
+    )
+
+def trigrams(key):
+    """ Returns the set of three-character pieces of a key (padded, so its start and end count too). """
+    padded = "  {0} ".format(key)
+    return {padded[start:start + 3] for start in range(len(padded) - 2)}
+
+def edit_distance(first, second):
+    """ Returns the fewest one-letter insertions, deletions, changes, and swaps that turn one string into another. """
+    previous_row, row = None, list(range(len(second) + 1))
+    for first_index in range(1, len(first) + 1):
+        previous_row, row, before = row, [first_index] + [0] * len(second), previous_row
+        for second_index in range(1, len(second) + 1):
+            row[second_index] = min(
+                previous_row[second_index] + 1,
+                row[second_index - 1] + 1,
+                previous_row[second_index - 1] + (first[first_index - 1] != second[second_index - 1])
+            )
+            if (first_index > 1 and second_index > 1 and first[first_index - 1] == second[second_index - 2]
+                    and first[first_index - 2] == second[second_index - 1]):
+                row[second_index] = min(row[second_index], before[second_index - 2] + 1)
+    return row[len(second)]
@@ -0,0 +1,95 @@
+r"""distributions.py
+
+    This module contains the Distribution class, which holds one weighted distribution (a list of values, and a weight
+    for each) from the position specs, along with its sampler (see "samplers.py"), and the registry of the named
+    distributions that more than one spec (or step) uses. These are defined just once, in "distributions.json" next to
+    this file, eg.
+        "PMOR_all_but_specialists": {"range": [50, 99], "weights": [1, 1, 2, ...]}
+    and a spec picks from one by name, with {"distribution": "PMOR_all_but_specialists"} (see "position_specs.py").
+
+    The registry is loaded, and each distribution's sampler built, once, on import. A name says which field, and which
+    players (and, if it matters, which kind of player), it is for, eg. "PSTR_defensive_ends_pass_rushers". Two names may
+    hold the same distribution (the same values with the same chances, as found by a hash of its contents), so that
+    changing one field's doesn't change another's; they share a single sampler.
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import json, os
+
+
+# 1.2 - Third-party imports
+
+
+# 1.3 - Application-specific imports
+
+from .samplers import distribution_hash, sampler_for
+
+
+# 1.4 - Global settings
+
+
+# 1.5 - Global constants
+
+# The file of named distributions.
+DISTRIBUTIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "distributions.json")
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+class Distribution:
+    """ One weighted distribution from the specs (named, or listed in a step), with the sampler that picks from it. """
+
+    def __init__(self, values, weights, name=None):
+        if len(values) != len(weights):
+            raise ValueError("{0} values but {1} weights".format(len(values), len(weights)))
+        self.name = name
+        self.values = values
+        self.weights = weights
+        # Values that depend on earlier steps (eg. "left_elbow") can only be worked out as they are picked, so their
+        # sampler picks which one of them to use.
+        self.constant_values = all(isinstance(value, (int, float)) for value in values)
+        self.sampler = sampler_for(values if self.constant_values else range(len(values)), weights)
+        self.content_hash = distribution_hash(values, weights)
+
+    def __repr__(self):
+        return "Distribution({0!r}, values={1})".format(self.name, len(self.values))
+
+    @classmethod
+    def from_choice(cls, choice, name=None):
+        """ Returns the Distribution of a spec's choice (or registry entry) with "values" or "range", and "weights". """
+        weights = choice["weights"]
+        if isinstance(weights, str):
+            # A short expression for a long list, like "[100 / 517] * 517".
+            weights = eval(weights, {"__builtins__": {}})
+        if "range" in choice:
+            first_value, last_value = choice["range"]
+            values = list(range(first_value, last_value + 1))
+        else:
+            values = choice["values"]
+        return cls(values, weights, name)
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def load_distributions(distributions_path=DISTRIBUTIONS_PATH):
+    """ Reads and compiles the named distributions in a file; returns a dict of {name: Distribution}. """
+    with open(distributions_path) as distributions_file:
+        entries = json.load(distributions_file)
+    distributions = {}
+    for name, entry in entries.items():
+        try:
+            distribution = Distribution.from_choice(entry, name)
+        except (ValueError, KeyError, TypeError) as error:
+            raise ValueError("{0}: distribution {1!r}: {2}".format(os.path.basename(distributions_path), name, error))
+        distributions[name] = distribution
+    return distributions
+
+
+# The named distributions, by name.
+DISTRIBUTIONS = load_distributions()
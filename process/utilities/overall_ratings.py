@@ -0,0 +1,220 @@
+r"""overall_ratings.py
+
+    This module contains the formula for each position's overall rating (POVR), from "04 - FORMULA for Calculating
+    Overall Rating.txt", as a table of the ratings it uses, with the weight of each and the range its value is clamped
+    to first, and the functions that work it out. The position specs (see "position_specs.py") set POVR with:
+        "overall_ratings.overall_rating('WR', break_tackles=break_tackles, acceleration=acceleration, ...)"
+    (passing the ratings by name), and check, as they are compiled, that they clamp each of the ratings to the range
+    given here. The pay-curve fitter (see "test_curve_fit.py") clamps and rates its players with the same table, so
+    there is just one copy of the formulas, and their ranges, to keep up to date.
+
+    overall_rating works on the ratings of a single player, or just as well on NumPy arrays of them (one element per
+    player), in which case it rates the whole group in one go. Single players' ratings are cached, since so many
+    players share the same few values. overall_ratings rates players of any mix of positions at once, from a dict of
+    columns (eg. for analysis).
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import functools
+
+
+# 1.2 - Third-party imports
+
+import numpy as np
+
+
+# 1.3 - Application-specific imports
+
+
+# 1.4 - Global settings
+
+
+# 1.5 - Global constants
+
+# The lowest and highest POVR a player can have.
+LOWEST_RATING = 40
+HIGHEST_RATING = 99
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+class RatingFormula:
+    """ One position's overall rating formula: a weighted sum of some of a player's ratings, plus an offset. """
+
+    def __init__(self, ratings, offset=0, intercept=0.0, centered=True):
+        # The names of the ratings the formula uses, in order, the weight of each, and the (lowest, highest) value
+        # each is clamped to before it goes into the formula, by name.
+        self.names = tuple(name for name, _, _, _ in ratings)
+        self.weights = tuple(weight for _, weight, _, _ in ratings)
+        self.ranges = {name: (low, high) for name, _, low, high in ratings}
+        # The number added to the rounded sum.
+        self.offset = offset
+        # The number the sum starts from.
+        self.intercept = intercept
+        # Whether each term is (rating - 50) / 10 * weight, as in most formulas, or just rating * weight (for K and P).
+        self.centered = centered
+
+    def __repr__(self):
+        return "RatingFormula({0})".format(", ".join(self.names))
+
+    def with_ranges(self, **ranges):
+        """ Returns a copy of the formula with the ranges of some of its ratings replaced, eg. speed=(60, 95). """
+        unknown_names = sorted(set(ranges) - set(self.names))
+        if unknown_names:
+            raise ValueError("the formula has no rating named {0}".format(", ".join(unknown_names)))
+        ratings = [
+            (name, weight) + tuple(ranges.get(name, self.ranges[name]))
+            for name, weight in zip(self.names, self.weights)
+        ]
+        return RatingFormula(ratings, self.offset, self.intercept, self.centered)
+
+    def values_of(self, ratings):
+        """ Returns the values of the formula's ratings, in its order, from a dict of {rating name: value}. """
+        if set(ratings) != set(self.names):
+            raise ValueError("expected the ratings {0}, not {1}".format(
+                ", ".join(self.names), ", ".join(sorted(ratings))))
+        return tuple(ratings[name] for name in self.names)
+
+    def weighted_sum(self, values):
+        """ Returns the (unrounded) sum of the formula's terms, for single ratings or arrays of them. """
+        if len(values) != len(self.names):
+            raise ValueError("expected {0} ratings ({1}), not {2}".format(
+                len(self.names), ", ".join(self.names), len(values)))
+        # The terms are added up one at a time, in the formula's order, so the sums match it to the last bit (and so
+        # round the same way).
+        total = self.intercept
+        for value, weight in zip(values, self.weights):
+            if self.centered:
+                total = total + (value - 50.0) / 10.0 * weight
+            else:
+                total = total + weight * value
+        return total
+
+    def rating(self, values):
+        """ Returns the POVR for a single player's ratings. """
+        return int(max(min(round(self.weighted_sum(values)) + self.offset, HIGHEST_RATING), LOWEST_RATING))
+
+    def ratings(self, columns):
+        """ Returns the POVRs for arrays of ratings (one element per player), as an array. """
+        totals = self.weighted_sum([np.asarray(column) for column in columns])
+        # (np.round, like round(), rounds halves to even.)
+        return np.clip(np.round(totals).astype(np.int64) + self.offset, LOWEST_RATING, HIGHEST_RATING)
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def tackle_formula():
+    """ Returns the formula shared by LT and RT. """
+    return RatingFormula(
+        (("speed", 0.8, 45, 85), ("strength", 3.3, 70, 99), ("awareness", 3.3, 40, 99), ("agility", 0.8, 40, 85),
+         ("acceleration", 0.8, 60, 90), ("pass_block", 4.75, 60, 99), ("run_block", 3.75, 60, 99)), offset=26)
+
+def interior_line_formula():
+    """ Returns the formula shared by LG, RG, and C (with ranges of its own). """
+    return RatingFormula(
+        (("speed", 1.7, 45, 85), ("strength", 3.25, 70, 99), ("awareness", 3.25, 40, 99), ("agility", 0.8, 40, 85),
+         ("acceleration", 1.7, 60, 90), ("pass_block", 3.25, 65, 99), ("run_block", 4.8, 65, 99)), offset=28)
+
+def end_formula():
+    """ Returns the formula shared by LE and RE. """
+    return RatingFormula(
+        (("speed", 3.75, 55, 90), ("strength", 3.75, 60, 99), ("awareness", 1.75, 40, 99), ("agility", 1.75, 45, 90),
+         ("acceleration", 3.8, 65, 95), ("tackle", 5.5, 60, 99)), offset=30)
+
+def outside_linebacker_formula():
+    """ Returns the formula shared by LOLB and ROLB. """
+    return RatingFormula(
+        (("speed", 3.75, 70, 95), ("strength", 2.4, 60, 99), ("awareness", 3.6, 40, 99), ("agility", 2.4, 65, 95),
+         ("acceleration", 1.3, 75, 95), ("catching", 1.3, 20, 90), ("tackle", 4.8, 60, 99)), offset=29)
+
+# Each position's formula, by its abbreviation (as in the "position" column of the player attributes CSV).
+FORMULAS = {
+    "QB": RatingFormula(
+        (("throw_power", 4.9, 70, 99), ("throw_accuracy", 5.8, 60, 99), ("break_tackles", 0.8, 20, 90),
+         ("agility", 0.8, 45, 98), ("awareness", 4.0, 40, 99), ("speed", 2.0, 55, 95)), offset=28),
+    "HB": RatingFormula(
+        (("pass_block", 0.33, 25, 70), ("break_tackles", 0.8, 50, 99), ("carrying", 2.0, 60, 99),
+         ("acceleration", 1.8, 80, 99), ("agility", 2.8, 70, 99), ("awareness", 2.0, 45, 99), ("strength", 0.6, 45, 90),
+         ("speed", 3.3, 80, 99), ("catching", 1.4, 50, 95)), offset=27),
+    "FB": RatingFormula(
+        (("pass_block", 1.0, 40, 75), ("run_block", 7.2, 45, 85), ("break_tackles", 1.8, 55, 99),
+         ("carrying", 1.8, 60, 99), ("acceleration", 1.8, 65, 95), ("agility", 1.0, 55, 95), ("awareness", 2.8, 45, 99),
+         ("strength", 1.8, 60, 95), ("speed", 1.8, 60, 95), ("catching", 5.2, 45, 95)), offset=39),
+    "WR": RatingFormula(
+        (("break_tackles", 0.8, 35, 80), ("acceleration", 2.3, 75, 99), ("agility", 2.3, 75, 99),
+         ("awareness", 2.3, 35, 99), ("strength", 0.8, 35, 85), ("speed", 2.3, 80, 99), ("catching", 4.75, 65, 99),
+         ("jumping", 1.4, 65, 99)), offset=26),
+    "TE": RatingFormula(
+        (("speed", 2.65, 60, 95), ("strength", 2.65, 55, 90), ("awareness", 2.65, 35, 99), ("agility", 1.25, 55, 95),
+         ("acceleration", 1.25, 60, 95), ("catching", 5.4, 45, 99), ("break_tackles", 1.2, 25, 95),
+         ("pass_block", 1.2, 35, 80), ("run_block", 5.4, 35, 85)), offset=35),
+    "LT": tackle_formula(),
+    "RT": tackle_formula(),
+    "LG": interior_line_formula(),
+    "RG": interior_line_formula(),
+    "C": interior_line_formula().with_ranges(strength=(65, 99), agility=(45, 85), pass_block=(60, 99),
+                                             run_block=(60, 99)),
+    "LE": end_formula(),
+    "RE": end_formula(),
+    "DT": RatingFormula(
+        (("speed", 1.8, 45, 90), ("strength", 5.5, 70, 99), ("awareness", 3.8, 40, 99), ("agility", 1.0, 40, 90),
+         ("acceleration", 2.8, 65, 95), ("tackle", 4.55, 65, 99)), offset=29),
+    "LOLB": outside_linebacker_formula(),
+    "ROLB": outside_linebacker_formula(),
+    "MLB": RatingFormula(
+        (("speed", 0.75, 65, 95), ("strength", 3.4, 60, 99), ("awareness", 5.2, 35, 99), ("agility", 1.65, 65, 95),
+         ("acceleration", 1.75, 75, 95), ("tackle", 5.2, 65, 99)), offset=27),
+    "CB": RatingFormula(
+        (("speed", 3.85, 80, 99), ("strength", 0.9, 40, 85), ("awareness", 3.85, 35, 99), ("agility", 1.55, 75, 99),
+         ("acceleration", 2.35, 80, 99), ("catching", 3.0, 40, 95), ("jumping", 1.55, 65, 99),
+         ("tackle", 1.55, 30, 85)), offset=28),
+    "FS": RatingFormula(
+        (("speed", 3.0, 75, 99), ("strength", 0.9, 45, 85), ("awareness", 4.85, 40, 99), ("agility", 1.5, 70, 99),
+         ("acceleration", 2.5, 80, 99), ("catching", 3.0, 35, 95), ("jumping", 1.5, 65, 99),
+         ("tackle", 2.5, 45, 90)), offset=30),
+    "SS": RatingFormula(
+        (("speed", 3.2, 75, 99), ("strength", 1.7, 45, 90), ("awareness", 4.75, 40, 99), ("agility", 1.7, 70, 99),
+         ("acceleration", 1.7, 80, 99), ("catching", 3.2, 35, 95), ("jumping", 0.9, 65, 99),
+         ("tackle", 3.2, 45, 90)), offset=30),
+    "K": RatingFormula(
+        (("awareness", 0.218, 35, 85), ("kick_power", 1.28, 80, 99), ("kick_accuracy", 1.47, 70, 99)),
+        intercept=-177.0, centered=False),
+    "P": RatingFormula(
+        (("awareness", 0.218, 40, 85), ("kick_power", 1.5, 80, 99), ("kick_accuracy", 1.33, 70, 99)),
+        intercept=-183.0, centered=False),
+}
+
+def formula_for(position):
+    """ Returns the RatingFormula of a position, by its abbreviation. """
+    try:
+        return FORMULAS[position.upper()]
+    except KeyError:
+        raise ValueError("there is no overall rating formula for position {0!r}".format(position))
+
+@functools.lru_cache(maxsize=None)
+def cached_rating(position, values):
+    """ Returns the POVR for a single player's ratings (a tuple), remembering it for the next player with the same. """
+    return formula_for(position).rating(values)
+
+def overall_rating(position, **ratings):
+    """ Returns the POVR of a player at a position from his ratings (by name), or of each player, given arrays. """
+    values = formula_for(position).values_of(ratings)
+    if all(np.ndim(value) == 0 for value in values):
+        return cached_rating(position, values)
+    return formula_for(position).ratings(values)
+
+def overall_ratings(positions, columns):
+    """ Returns the POVR of each of a group of players at any positions, from a dict of {rating name: array}. """
+    positions = np.char.upper(np.asarray(positions, dtype=str))
+    result = np.zeros(len(positions), dtype=np.int64)
+    for position in np.unique(positions).tolist():
+        rows = np.flatnonzero(positions == position)
+        formula = formula_for(position)
+        result[rows] = formula.ratings([np.asarray(columns[name])[rows] for name in formula.names])
+    return result
@@ -0,0 +1,113 @@
+r"""pay_tiers.py
+
+    This module contains the PayTiers class, which holds one season's pay adjustments, read from
+        docs\Pay Calculations\[year]\pay_adjustments.csv
+    which has a row of rates for salaries and one for signing bonuses, each with a column per tier:
+        type,first,second,third,fourth
+        salary,0.65,0.53,0.41,0.00
+        bonus,0.25,0.41,0.58,0.75
+    The rates scale real contract numbers down (in units of $10,000) to allow for how much NFL pay has grown since
+    Madden '08. A salary over $10M is in the first tier, one over $1M in the second, and any other in the third; a
+    signing bonus over $10M is in the first tier, one over $1M in the second, one over $100K in the third, and any other
+    in the fourth.
+
+    The file is read once (by RosterLookups; see "roster_manager.py"), and the position specs scale a player's pay with
+    "roster.pay_tiers.salary(total_salary)" and "roster.pay_tiers.bonus(signing_bonus)", which work on single values,
+    or just as well on NumPy arrays with one element per player (picking every player's tier in one np.select).
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import csv, os
+
+
+# 1.2 - Third-party imports
+
+import numpy as np
+
+
+# 1.3 - Application-specific imports
+
+
+# 1.4 - Global settings
+
+
+# 1.5 - Global constants
+
+# The folder with a folder of pay helper files for each season, like "2019".
+PAY_CALCULATIONS_FOLDER = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "docs", "Pay Calculations")
+
+# The tiers, in the order of the columns of pay_adjustments.csv.
+TIERS = ("first", "second", "third", "fourth")
+
+# The amounts a salary or a signing bonus must be over to be in each tier but the last.
+SALARY_THRESHOLDS = (10000000, 1000000)
+BONUS_THRESHOLDS = (10000000, 1000000, 100000)
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+class PayTiers:
+    """ One season's rates for scaling down salaries and signing bonuses, by tier. """
+
+    def __init__(self, salary_rates, bonus_rates):
+        # The rate of each tier, in the order of TIERS.
+        self.salary_rates = tuple(float(rate) for rate in salary_rates)
+        self.bonus_rates = tuple(float(rate) for rate in bonus_rates)
+
+    def __repr__(self):
+        return "PayTiers(salary_rates={0}, bonus_rates={1})".format(self.salary_rates, self.bonus_rates)
+
+    @classmethod
+    def from_csv(cls, pay_adjustments_path):
+        """ Reads a pay_adjustments.csv; a type with no row gets rates of 0.0. """
+        rates = {"SALARY": [0.0] * len(TIERS), "BONUS": [0.0] * len(TIERS)}
+        with open(pay_adjustments_path) as pay_adjustments_file:
+            for row in csv.DictReader(pay_adjustments_file):
+                pay_type = row["type"].upper()
+                if pay_type in rates:
+                    try:
+                        rates[pay_type] = [float(row[tier]) for tier in TIERS]
+                    except (KeyError, TypeError, ValueError):
+                        raise ValueError("{0}: the {1} row needs a rate for each of the tiers {2}".format(
+                            pay_adjustments_path, row["type"], ", ".join(TIERS)))
+        return cls(rates["SALARY"], rates["BONUS"])
+
+    def salary_rate(self, tier):
+        """ Returns the rate for salaries in a tier, by its name. """
+        return self.salary_rates[TIERS.index(tier)]
+
+    def bonus_rate(self, tier):
+        """ Returns the rate for signing bonuses in a tier, by its name. """
+        return self.bonus_rates[TIERS.index(tier)]
+
+    def salary(self, total_salary):
+        """ Returns the scaled-down salary (in $10,000s) for a salary in dollars, or for each of an array of them. """
+        return scale_pay(total_salary, SALARY_THRESHOLDS, self.salary_rates)
+
+    def bonus(self, signing_bonus):
+        """ Returns the scaled-down bonus (in $10,000s) for a bonus in dollars, or for each of an array of them. """
+        return scale_pay(signing_bonus, BONUS_THRESHOLDS, self.bonus_rates)
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def pay_adjustments_path(year):
+    """ Returns the path of a season's pay_adjustments.csv. """
+    return os.path.join(PAY_CALCULATIONS_FOLDER, str(year), "pay_adjustments.csv")
+
+def scale_pay(amounts, thresholds, rates):
+    """ Returns round(amount / 10000 * rate), with the rate of the amount's tier, for an amount or an array of them. """
+    if np.ndim(amounts) == 0:
+        rate = next((rate for threshold, rate in zip(thresholds, rates) if amounts > threshold), rates[len(thresholds)])
+        return round(amounts / 10000 * rate)
+    amounts = np.asarray(amounts)
+    tier_rates = np.select(
+        [amounts > threshold for threshold in thresholds], rates[:len(thresholds)], rates[len(thresholds)])
+    return np.round(amounts / 10000 * tier_rates).astype(np.int64)
@@ -0,0 +1,117 @@
+r"""player_attributes.py
+
+    This module contains the PlayerAttributes class, which holds the contents of "Current Player Attributes.csv" (found
+    in "[BASE_MADDEN_PATH]\process\inputs\step5\") as one typed NumPy array per column, with one element per player.
+    Each cell is parsed just once, when the file is loaded:
+        1) Columns whose cells are all whole numbers (or empty) become int64 masked arrays, in which the empty cells are
+            masked. The cells holding -1 (which the CSV uses to say "generate this for me") are also tracked, in a
+            bitmask with one bit per numeric column for each player; see PlayerAttributes.is_unset.
+        2) Every other column (names, team, college, etc.) becomes an array of strings.
+
+    Step 5 creates the players a position at a time, from these arrays (see "position_specs.py"), so it no longer needs
+    a dict of strings for each player, and no longer parses the same cell again each time a player's spec uses it.
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import csv
+
+
+# 1.2 - Third-party imports
+
+import numpy as np
+
+
+# 1.3 - Application-specific imports
+
+
+# 1.4 - Global settings
+
+
+# 1.5 - Global constants
+
+# The value the CSV uses for a numeric attribute we should generate rather than copy.
+UNSET_VALUE = -1
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+class PlayerAttributes:
+    """ The columns of a player attributes CSV file, each as a typed NumPy array with one element per player. """
+
+    def __init__(self, column_names, columns, unset_bits, bit_indexes):
+        self.column_names = column_names
+        self.columns = columns
+        # Bit i of row r (counting from the high bit of the row's first byte) is set if the numeric column with bit
+        # index i held -1 for player r.
+        self.unset_bits = unset_bits
+        self.bit_indexes = bit_indexes
+
+    @classmethod
+    def from_rows(cls, column_names, rows):
+        """ Builds a PlayerAttributes from a list of rows, each a list of cell strings in column order. """
+        # Transpose the rows, so each column's cells can be parsed (and sized) on their own.
+        column_cells = zip(*rows) if rows else [()] * len(column_names)
+        columns = {}
+        bit_indexes = {}
+        unset_flags = []
+        for column_name, cells in zip(column_names, column_cells):
+            column = parse_column(cells)
+            columns[column_name] = column
+            if isinstance(column, np.ma.MaskedArray):
+                bit_indexes[column_name] = len(unset_flags)
+                unset_flags.append(column.filled(0) == UNSET_VALUE)
+        unset_bits = np.packbits(np.array(unset_flags, dtype=bool).reshape(len(unset_flags), len(rows)).T, axis=1)
+        return cls(list(column_names), columns, unset_bits, bit_indexes)
+
+    def __repr__(self):
+        return "PlayerAttributes(players={0}, columns={1}, numeric={2})".format(
+            len(self), len(self.column_names), len(self.bit_indexes))
+
+    def __len__(self):
+        return len(self.unset_bits)
+
+    def __contains__(self, column_name):
+        return column_name in self.columns
+
+    def __getitem__(self, column_name):
+        return self.columns[column_name]
+
+    def is_unset(self, column_name):
+        """ Returns a boolean array that is True for each player whose cell in a numeric column held -1. """
+        bit_index = self.bit_indexes[column_name]
+        return ((self.unset_bits[:, bit_index // 8] >> (7 - bit_index % 8)) & 1).astype(bool)
+
+    def take(self, indexes):
+        """ Returns a new PlayerAttributes with just the players at the given indexes, in that order. """
+        return PlayerAttributes(
+            self.column_names,
+            {column_name: column[indexes] for column_name, column in self.columns.items()},
+            self.unset_bits[indexes],
+            self.bit_indexes
+        )
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def parse_column(cells):
+    """ Parses a column of cell strings into an int64 masked array (with empty cells masked), or a str array. """
+    try:
+        values = np.array([int(cell) if cell else 0 for cell in cells], dtype=np.int64)
+    except ValueError:
+        return np.array(cells, dtype=str)
+    return np.ma.MaskedArray(values, mask=np.array([not cell for cell in cells], dtype=bool))
+
+def load_player_attributes(csv_path):
+    """ Reads a player attributes CSV file (with a header row) into a PlayerAttributes. """
+    with open(csv_path, newline='') as attributes_file:
+        attributes_reader = csv.reader(attributes_file)
+        column_names = next(attributes_reader)
+        # Pad out any short rows with empty cells.
+        rows = [row + [""] * (len(column_names) - len(row)) for row in attributes_reader]
+    return PlayerAttributes.from_rows(column_names, rows)
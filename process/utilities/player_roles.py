@@ -1,486 +1,391 @@
 r""" player_roles.py
-    
-    This module contains only the helper functions that determine if a player is a match for a certain role.
+
+    This module contains the helper functions that determine if a player is a match for a certain role, and the
+    RoleRules class, which uses them to give players their PROL and PRL2 values.
+
+    Each is_* function takes the player's role_one first: a player can't be given a role that conflicts with the one he
+    already has (see ROLES). The functions work on single values, or just as well on NumPy arrays with one element per
+    player, in which case they return a boolean array (a mask) of the players that qualify.
 """
 
-import math
+import numpy as np
+
+# The role value that means a player has no role (yet).
+NO_ROLE = 45
+
+# Each role's value (for PROL and PRL2), and the values of role_one that rule it out as a player's role_two.
+ROLES = {
+    "big_hitter": (31, (31,)),
+    "cannon_arm": (18, (18,)),
+    "containment_corner": (29, (29, 38)),
+    "coverage_safety": (32, (32,)),
+    "deep_threat": (36, (35, 36, 37)),
+    "defensive_enforcer": (41, (41, 42, 27, 39, 40, 28)),
+    "elusive_back": (22, (21, 22, 23)),
+    "fan_favorite": (13, (8, 13)),
+    "feature_back": (34, (34, 14, 15)),
+    "first_round_pick": (12, (12,)),
+    "force_of_nature": (27, (27, 28, 39, 40)),
+    "franchise_qb": (20, (8, 14, 20)),
+    "fumble_prone": (15, (15,)),
+    "game_manager": (10, (10,)),
+    "go_to_guy": (35, (35, 36, 37)),
+    "heavy_hitter": (28, (28, 27)),
+    "hitman": (33, (33,)),
+    "injury_prone": (14, (14,)),
+    "pass_blocker": (25, (25, 24, 26)),
+    "pass_rusher": (39, (39, 40)),
+    "playmaker": (42, (42, 41, 27, 39, 40, 28)),
+    "possession_receiver": (37, (35, 36, 37)),
+    "power_back": (21, (21, 22, 23)),
+    "precision_passer": (17, (17,)),
+    "project_player": (7, (7,)),
+    "qb_of_the_future": (0, (0,)),
+    "quick_corner": (30, (30, 38, 29)),
+    "return_specialist": (11, (11, 33, 34, 35, 38)),
+    "road_blocker": (26, (26, 24, 25)),
+    "run_blocker": (24, (24, 25, 26)),
+    "run_stopper": (40, (40, 39)),
+    "scrambler": (19, (19,)),
+    "shutdown_corner": (38, (38,)),
+    "speed_back": (23, (21, 22, 23)),
+    "team_distraction": (8, (8, 5, 6)),
+    "team_leader": (6, (6, 5, 8)),
+    "team_mentor": (5, (5, 6, 8)),
+    "underachiever": (4, (4,)),
+}
+
+def allowed(role_one, role_name):
+    """ Determines whether a player with the given role_one can still be given a role. """
+    if np.ndim(role_one) == 0:
+        return role_one not in ROLES[role_name][1]
+    return ~np.isin(role_one, ROLES[role_name][1])
+
+def is_one_of(values, options):
+    """ Like 'value in options', for a single value or an array of them. """
+    if np.ndim(values) == 0:
+        return values in options
+    return np.isin(values, options)
+
+def is_none_of(values, options):
+    """ Like 'value not in options', for a single value or an array of them. """
+    if np.ndim(values) == 0:
+        return values not in options
+    return ~np.isin(values, options)
 
 def is_big_hitter(role_one, acceleration, strength, tackle):
     """ Determines whether the given values qualify a player to be labeled as a 'big hitter'. """
-    if role_one == 31:
-        return False
-    if acceleration > 88 and strength > 60 and tackle > 74:
-        return True
-    return False
+    return allowed(role_one, "big_hitter") & (acceleration > 88) & (strength > 60) & (tackle > 74)
 
 def is_cannon_arm(role_one, throw_power):
     """ Determines whether the given values qualify a player to be labeled as a 'cannon arm'. """
-    if role_one == 18:
-        return False
-    if throw_power > 92:
-        return True
-    return False
+    return allowed(role_one, "cannon_arm") & (throw_power > 92)
 
 def is_containment_corner(role_one, agility, awareness):
     """ Determines whether the given values qualify a player to be labeled as a 'containment corner'. """
-    if role_one in [29, 38]:
-        return False
-    if agility > 89 and awareness > 79:
-        return True
-    return False
+    return allowed(role_one, "containment_corner") & (agility > 89) & (awareness > 79)
 
 def is_coverage_safety(role_one, speed, acceleration, agility):
     """ Determines whether the given values qualify a player to be labeled as a 'coverage safety'. """
-    if role_one == 32:
-        return False
-    if speed > 88 and acceleration > 89 and agility > 86:
-        return True
-    return False
+    return allowed(role_one, "coverage_safety") & (speed > 88) & (acceleration > 89) & (agility > 86)
 
 def is_deep_threat(role_one, position, speed, acceleration):
     """ Determines whether the given values qualify a player to be labeled as a 'deep threat'. """
-    if role_one in [35, 36, 37]:
-        return False
-    # WRs
-    if position == 3:
-        if (speed > 89 and acceleration > 93) or (speed > 92 and acceleration > 89):
-            return True
-    # TEs
-    elif position == 4:
-        if (speed > 86 and acceleration > 89) or (speed > 89 and acceleration > 86):
-            return True
-    return False
+    return allowed(role_one, "deep_threat") & (
+        # WRs
+        ((position == 3) & (((speed > 89) & (acceleration > 93)) | ((speed > 92) & (acceleration > 89))))
+        # TEs
+        | ((position == 4) & (((speed > 86) & (acceleration > 89)) | ((speed > 89) & (acceleration > 86))))
+    )
 
 def is_defensive_enforcer(role_one, speed, strength):
     """ Determines whether the given values qualify a player to be labeled as a 'defensive enforcer'. """
-    if role_one in [41, 42, 27, 39, 40, 28]:
-        return False
-    if speed > 85 and strength > 79:
-        return True
-    return False
+    return allowed(role_one, "defensive_enforcer") & (speed > 85) & (strength > 79)
 
 def is_elusive_back(role_one, acceleration, agility):
     """ Determines whether the given values qualify a player to be labeled as an 'elusive back'. """
-    if role_one in [21, 22, 23]:
-        return False
-    if acceleration > 90 and agility > 90:
-        return True
-    return False
+    return allowed(role_one, "elusive_back") & (acceleration > 90) & (agility > 90)
 
 def is_fan_favorite(role_one, years_pro, morale, overall_rating):
     """ Determines whether the given values qualify a player to be labeled as a 'fan favorite'. """
-    if role_one in [8, 13]:
-        return False
-    if years_pro > 5 and morale > 80 and overall_rating > 90:
-        return True
-    return False
+    return allowed(role_one, "fan_favorite") & (years_pro > 5) & (morale > 80) & (overall_rating > 90)
 
 def is_feature_back(role_one, awareness, speed, acceleration, agility, break_tackles, carrying, overall_rating):
     """ Determines whether the given values qualify a player to be labeled as a 'feature back'. """
-    if role_one in [34, 14, 15]:
-        return False
-    if (awareness > 75 and speed > 88 and acceleration > 90 and agility > 88 and break_tackles > 70 and carrying > 74 
-            and overall_rating > 88):
-        return True
-    return False
+    return (allowed(role_one, "feature_back") & (awareness > 75) & (speed > 88) & (acceleration > 90) & (agility > 88)
+            & (break_tackles > 70) & (carrying > 74) & (overall_rating > 88))
 
 def is_first_round_pick(role_one, draft_round):
     """ Determines whether the given values qualify a player to be labeled as a 'first round pick'. """
-    if role_one == 12:
-        return False
-    if draft_round == 1:
-        return True
-    return False
+    return allowed(role_one, "first_round_pick") & (draft_round == 1)
 
 def is_force_of_nature(role_one, position, acceleration, strength):
     """ Determines whether the given values qualify a player to be labeled as a 'force of nature'. """
-    if role_one in [27, 28, 39, 40]:
-        return False
-    if position in [10, 11]: #L/REs
-        if acceleration > 85 and strength > 85:
-            return True
-    if position == 12: #DTs
-        if acceleration > 83 and strength > 88:
-            return True
-    if position in [13, 14, 15]: #LBs
-        if acceleration > 87 and strength > 82:
-            return True
-    return False
+    return allowed(role_one, "force_of_nature") & (
+        # L/REs
+        (is_one_of(position, (10, 11)) & (acceleration > 85) & (strength > 85))
+        # DTs
+        | ((position == 12) & (acceleration > 83) & (strength > 88))
+        # LBs
+        | (is_one_of(position, (13, 14, 15)) & (acceleration > 87) & (strength > 82))
+    )
 
 def is_franchise_qb(role_one, awareness, overall_rating):
     """ Determines whether the given values qualify a player to be labeled as a 'franchise QB'. """
-    if role_one in [8, 14, 20]:
-        return False
-    if awareness > 79 and overall_rating > 87:
-        return True
-    return False
+    return allowed(role_one, "franchise_qb") & (awareness > 79) & (overall_rating > 87)
 
 def is_fumble_prone(role_one, carrying):
     """ Determines whether the given values qualify a player to be labeled as 'fumble prone'. """
-    if role_one == 15:
-        return False
-    if carrying < 70:
-        return True
-    return False
+    return allowed(role_one, "fumble_prone") & (carrying < 70)
 
 def is_game_manager(role_one, years_pro, awareness, throw_power, throw_accuracy, overall_rating):
     """ Determines whether the given values qualify a player to be labeled as a 'game manager'. """
-    if role_one == 10:
-        return False
-    if years_pro > 4 and awareness > 74 and throw_power < 92 and throw_accuracy > 80 and overall_rating < 88:
-        return True
-    return False
+    return (allowed(role_one, "game_manager") & (years_pro > 4) & (awareness > 74) & (throw_power < 92)
+            & (throw_accuracy > 80) & (overall_rating < 88))
 
 def is_go_to_guy(role_one, position, speed, catching, overall_rating):
     """ Determines whether the given values qualify a player to be labeled as a 'go-to guy'. """
-    if role_one in [35, 36, 37]:
-        return False
-    # WRs
-    if position == 3:
-        if speed > 88 and catching > 90 and overall_rating > 79:
-            return True
-    # TEs
-    elif position == 4:
-        if speed > 84 and catching > 85 and overall_rating > 79:
-            return True
-    return False
+    return allowed(role_one, "go_to_guy") & (
+        # WRs
+        ((position == 3) & (speed > 88) & (catching > 90) & (overall_rating > 79))
+        # TEs
+        | ((position == 4) & (speed > 84) & (catching > 85) & (overall_rating > 79))
+    )
 
 def is_heavy_hitter(role_one, position, tackle):
     """ Determines whether the given values qualify a player to be labeled as a 'heavy hitter'. """
-    if role_one in [28, 27]:
-        return False
-    # L/REs
-    if position in [10, 11]:
-        if tackle > 83:
-            return True
-    # DTs
-    if position == 12:
-        if tackle > 89:
-            return True
-    # LBs
-    if position in [13, 14, 15]:
-        if tackle > 84:
-            return True
-    return False
+    return allowed(role_one, "heavy_hitter") & (
+        # L/REs
+        (is_one_of(position, (10, 11)) & (tackle > 83))
+        # DTs
+        | ((position == 12) & (tackle > 89))
+        # LBs
+        | (is_one_of(position, (13, 14, 15)) & (tackle > 84))
+    )
 
 def is_hitman(role_one, overall_rating, awareness, speed, acceleration, tackle):
     """ Determines whether the given values qualify a player to be labeled as a 'hit man'. """
-    if role_one == 33:
-        return False
-    if overall_rating > 84 and awareness > 70 and speed > 86 and acceleration > 88 and tackle > 69:
-        return True
-    return False
+    return (allowed(role_one, "hitman") & (overall_rating > 84) & (awareness > 70) & (speed > 86)
+            & (acceleration > 88) & (tackle > 69))
 
 def is_injury_prone(role_one, injury, toughness):
     """ Determines whether the given values qualify a player to be labeled as 'injury prone'. """
-    if role_one == 14:
-        return False
-    if injury < 71 and toughness < 81:
-        return True
-    return False
+    return allowed(role_one, "injury_prone") & (injury < 71) & (toughness < 81)
 
 def is_pass_blocker(role_one, position, pass_block):
     """ Determines whether the given values qualify a player to be labeled as a 'pass blocker'. """
-    if role_one in [25, 24, 26]:
-        return False
-    # FBs
-    if position == 2:
-        if pass_block > 65:
-            return True
-    # TEs
-    elif position == 4:
-        if pass_block > 65:
-            return True
-    # L/RTs
-    elif position in [5, 9]:
-        if pass_block > 87:
-            return True
-    # L/RGs
-    elif position in [6, 8]:
-        if pass_block > 84:
-            return True
-    # Cs
-    elif position == 7:
-        if pass_block > 84:
-            return True
-    return False
+    return allowed(role_one, "pass_blocker") & (
+        # FBs and TEs
+        (is_one_of(position, (2, 4)) & (pass_block > 65))
+        # L/RTs
+        | (is_one_of(position, (5, 9)) & (pass_block > 87))
+        # L/RGs and Cs
+        | (is_one_of(position, (6, 7, 8)) & (pass_block > 84))
+    )
 
 def is_pass_rusher(role_one, position, speed, acceleration):
     """ Determines whether the given values qualify a player to be labeled as a 'pass rusher'. """
-    if role_one in [39, 40]:
-        return False
-    # L/REs
-    if position in [10, 11]:
-        if speed > 79 and acceleration > 86:
-            return True
-    # DTs
-    if position == 12:
-        if speed > 72 and acceleration > 83:
-            return True
-    # LBs
-    if position in [13, 14, 15]:
-        if speed > 84 and acceleration > 88:
-            return True
-    return False
+    return allowed(role_one, "pass_rusher") & (
+        # L/REs
+        (is_one_of(position, (10, 11)) & (speed > 79) & (acceleration > 86))
+        # DTs
+        | ((position == 12) & (speed > 72) & (acceleration > 83))
+        # LBs
+        | (is_one_of(position, (13, 14, 15)) & (speed > 84) & (acceleration > 88))
+    )
 
 def is_playmaker(role_one, speed, awareness):
     """ Determines whether the given values qualify a player to be labeled as a 'playmaker'. """
-    if role_one in [42, 41, 27, 39, 40, 28]:
-        return False
-    if speed > 83 and awareness > 81:
-        return True
-    return False
+    return allowed(role_one, "playmaker") & (speed > 83) & (awareness > 81)
 
 def is_possession_receiver(role_one, position, catching, awareness):
     """ Determines whether the given values qualify a player to be labeled as a 'possession receiver'. """
-    if role_one in [35, 36, 37]:
-        return False
-    # WRs
-    if position == 3:
-        if catching > 88 and awareness > 85:
-            return True
-    # TEs
-    elif position == 4:
-        if catching > 85 and awareness > 85:
-            return True
-    return False
+    return allowed(role_one, "possession_receiver") & (
+        # WRs
+        ((position == 3) & (catching > 88) & (awareness > 85))
+        # TEs
+        | ((position == 4) & (catching > 85) & (awareness > 85))
+    )
 
 def is_power_back(role_one, strength, break_tackles):
     """ Determines whether the given values qualify a player to be labeled as a 'power back'. """
-    if role_one in [21, 22, 23]:
-        return False
-    if strength > 69 and break_tackles > 89:
-        return True
-    return False
+    return allowed(role_one, "power_back") & (strength > 69) & (break_tackles > 89)
 
 def is_precision_passer(role_one, throw_accuracy):
     """ Determines whether the given values qualify a player to be labeled as a 'precision passer'. """
-    if role_one == 17:
-        return False
-    if throw_accuracy > 89:
-        return True
-    return False
+    return allowed(role_one, "precision_passer") & (throw_accuracy > 89)
 
-def is_project_player(role_one, overall_rating, years_pro, awareness, position, throw_power, throw_accuracy, speed, 
+def is_project_player(role_one, overall_rating, years_pro, awareness, position, throw_power, throw_accuracy, speed,
                       acceleration, break_tackles, agility, strength, kick_power):
     """ Determines whether the given values qualify a player to be labeled as a 'project player'. """
-    if role_one == 7:
-        return False
-    if overall_rating > 87 or years_pro > 4 or awareness > 79:
-        return False
-    # QBs
-    if position == 0:
-        if (throw_power > 90 and throw_accuracy < 80) or (speed > 80 and acceleration > 82 and break_tackles > 57):
-            return True
-    # HBs
-    elif position == 1:
-        if (speed > 90 and acceleration > 90 and agility > 90) or (strength > 80 and break_tackles > 82):
-            return True
-    # FBs
-    elif position == 2:
-        if (speed > 82 and acceleration > 85 and strength > 70) or (strength > 80):
-            return True
-    # WRs
-    elif position == 3:
-        if speed > 89 and acceleration > 89 and agility > 89:
-            return True
-    # TEs
-    elif position == 4:
-        if (speed > 84 and acceleration > 86 and agility > 80) or strength > 80:
-            return True
-    # L/RTs
-    elif position in [5, 9]:
-        if (speed > 70 and acceleration > 80 and agility > 70 and strength > 86) or strength > 90:
-            return True
-    # L/RGs
-    elif position in [6, 8]:
-        if (speed > 66 and acceleration > 79 and agility > 65 and strength > 84) or strength > 90:
-            return True
-    # Cs
-    elif position == 7:
-        if (speed > 66 and acceleration > 79 and agility > 65 and strength > 84) or strength > 90:
-            return True
-    # L/REs
-    elif position in [10, 11]:
-        if (speed > 77 and acceleration > 84 and agility > 79 and strength > 75) or strength > 87:
-            return True
-    # DTs
-    elif position == 12:
-        if (speed > 69 and acceleration > 81 and agility > 67 and strength > 84) or strength > 88:
-            return True
-    # LBs
-    elif position in [13, 14, 15]:
-        if (speed > 82 and acceleration > 86 and agility > 79 and strength > 75) or strength > 83:
-            return True
-    # CBs
-    elif position == 16:
-        if (speed > 90 and acceleration > 91 and agility > 89) or speed > 93:
-            return True
-    # FSs
-    elif position == 17:
-        if (speed > 88 and acceleration > 90 and agility > 87) or speed > 91:
-            return True
-    # SSs
-    elif position == 18:
-        if (speed > 87 and acceleration > 90 and agility > 86) or speed > 90:
-            return True
-    # Ks
-    elif position == 19:
-        if kick_power > 93:
-            return True
-    # Ps
-    elif position == 20:
-        if kick_power > 92:
-            return True
-    return False
+    return (allowed(role_one, "project_player") & (overall_rating <= 87) & (years_pro <= 4) & (awareness <= 79) & (
+        # QBs
+        ((position == 0) & (((throw_power > 90) & (throw_accuracy < 80))
+                            | ((speed > 80) & (acceleration > 82) & (break_tackles > 57))))
+        # HBs
+        | ((position == 1) & (((speed > 90) & (acceleration > 90) & (agility > 90))
+                              | ((strength > 80) & (break_tackles > 82))))
+        # FBs
+        | ((position == 2) & (((speed > 82) & (acceleration > 85) & (strength > 70)) | (strength > 80)))
+        # WRs
+        | ((position == 3) & (speed > 89) & (acceleration > 89) & (agility > 89))
+        # TEs
+        | ((position == 4) & (((speed > 84) & (acceleration > 86) & (agility > 80)) | (strength > 80)))
+        # L/RTs
+        | (is_one_of(position, (5, 9))
+           & (((speed > 70) & (acceleration > 80) & (agility > 70) & (strength > 86)) | (strength > 90)))
+        # L/RGs and Cs
+        | (is_one_of(position, (6, 7, 8))
+           & (((speed > 66) & (acceleration > 79) & (agility > 65) & (strength > 84)) | (strength > 90)))
+        # L/REs
+        | (is_one_of(position, (10, 11))
+           & (((speed > 77) & (acceleration > 84) & (agility > 79) & (strength > 75)) | (strength > 87)))
+        # DTs
+        | ((position == 12)
+           & (((speed > 69) & (acceleration > 81) & (agility > 67) & (strength > 84)) | (strength > 88)))
+        # LBs
+        | (is_one_of(position, (13, 14, 15))
+           & (((speed > 82) & (acceleration > 86) & (agility > 79) & (strength > 75)) | (strength > 83)))
+        # CBs
+        | ((position == 16) & (((speed > 90) & (acceleration > 91) & (agility > 89)) | (speed > 93)))
+        # FSs
+        | ((position == 17) & (((speed > 88) & (acceleration > 90) & (agility > 87)) | (speed > 91)))
+        # SSs
+        | ((position == 18) & (((speed > 87) & (acceleration > 90) & (agility > 86)) | (speed > 90)))
+        # Ks
+        | ((position == 19) & (kick_power > 93))
+        # Ps
+        | ((position == 20) & (kick_power > 92))
+    ))
 
 def is_qb_of_the_future(role_one, draft_round, years_pro, throw_power, throw_accuracy, overall_rating):
     """ Determines whether the given values qualify a player to be labeled as a 'QB of the future'. """
-    if role_one == 0:
-        return False
-    if draft_round < 6 and years_pro < 5 and throw_power > 86 and throw_accuracy > 76 and overall_rating > 74:
-        return True
-    return False
+    return (allowed(role_one, "qb_of_the_future") & (draft_round < 6) & (years_pro < 5) & (throw_power > 86)
+            & (throw_accuracy > 76) & (overall_rating > 74))
 
 def is_quick_corner(role_one, speed, acceleration):
     """ Determines whether the given values qualify a player to be labeled as a 'quick corner'. """
-    if role_one in [30, 38, 29]:
-        return False
-    if speed > 92 and acceleration > 90:
-        return True
-    return False
+    return allowed(role_one, "quick_corner") & (speed > 92) & (acceleration > 90)
 
 def is_return_specialist(role_one, speed, acceleration, agility, kick_return, overall_rating):
     """ Determines whether the given values qualify a player to be labeled as a 'return specialist'. """
-    if role_one in [11, 33, 34, 35, 38]:
-        return False
-    if (overall_rating < 86 and speed > 89 and acceleration > 89 and agility > 89 and kick_return > 79 
-            and math.ceil((speed + acceleration + agility) / 3) > 91):
-        return True
-    return False
+    return (allowed(role_one, "return_specialist") & (overall_rating < 86) & (speed > 89) & (acceleration > 89)
+            & (agility > 89) & (kick_return > 79) & (np.ceil((speed + acceleration + agility) / 3) > 91))
 
 def is_road_blocker(role_one, position, run_block, pass_block):
     """ Determines whether the given values qualify a player to be labeled as a 'road blocker'. """
-    if role_one in [26, 24, 25]:
-        return False
-    # FBs
-    if position == 2:
-        if run_block > 69 and pass_block > 65:
-            return True
-    # TEs
-    elif position == 4:
-        if run_block > 69 and pass_block > 65:
-            return True
-    # L/RTs
-    elif position in [5, 9]:
-        if run_block > 84 and pass_block > 87:
-            return True
-    # L/RGs
-    elif position in [6, 8]:
-        if run_block > 87 and pass_block > 84:
-            return True
-    # Cs
-    elif position == 7:
-        if run_block > 84 and pass_block > 84:
-            return True
-    return False
+    return allowed(role_one, "road_blocker") & (
+        # FBs and TEs
+        (is_one_of(position, (2, 4)) & (run_block > 69) & (pass_block > 65))
+        # L/RTs
+        | (is_one_of(position, (5, 9)) & (run_block > 84) & (pass_block > 87))
+        # L/RGs
+        | (is_one_of(position, (6, 8)) & (run_block > 87) & (pass_block > 84))
+        # Cs
+        | ((position == 7) & (run_block > 84) & (pass_block > 84))
+    )
 
 def is_run_blocker(role_one, position, run_block):
     """ Determines whether the given values qualify a player to be labeled as a 'run blocker'. """
-    if role_one in [24, 25, 26]:
-        return False
-    # FBs
-    if position == 2:
-        if run_block > 69:
-            return True
-    # TEs
-    elif position == 4:
-        if run_block > 69:
-            return True
-    #L/RTs
-    elif position in [5, 9]:
-        if run_block > 84:
-            return True
-    #L/RGs
-    elif position in [6, 8]:
-        if run_block > 87:
-            return True
-    #Cs
-    elif position == 7:
-        if run_block > 84:
-            return True
-    return False
+    return allowed(role_one, "run_blocker") & (
+        # FBs and TEs
+        (is_one_of(position, (2, 4)) & (run_block > 69))
+        # L/RTs and Cs
+        | (is_one_of(position, (5, 7, 9)) & (run_block > 84))
+        # L/RGs
+        | (is_one_of(position, (6, 8)) & (run_block > 87))
+    )
 
 def is_run_stopper(role_one, position, strength, tackle):
     """ Determines whether the given values qualify a player to be labeled as a 'run stopper'. """
-    if role_one in [40, 39]:
-        return False
-    # L/REs
-    if position in [10, 11]:
-        if strength > 84 and tackle > 84:
-            return True
-    # DTs
-    if position == 12:
-        if strength > 89 and tackle > 86:
-            return True
-    # DTs
-    if position in [13, 14, 15]:
-        if strength > 79 and tackle > 80:
-            return True
-    return False
+    return allowed(role_one, "run_stopper") & (
+        # L/REs
+        (is_one_of(position, (10, 11)) & (strength > 84) & (tackle > 84))
+        # DTs
+        | ((position == 12) & (strength > 89) & (tackle > 86))
+        # LBs
+        | (is_one_of(position, (13, 14, 15)) & (strength > 79) & (tackle > 80))
+    )
 
 def is_scrambler(role_one, speed, acceleration, agility):
     """ Determines whether the given values qualify a player to be labeled as a 'scrambler'. """
-    if role_one == 19:
-        return False
-    if speed > 80 and acceleration > 80 and agility > 80:
-        return True
-    return False
+    return allowed(role_one, "scrambler") & (speed > 80) & (acceleration > 80) & (agility > 80)
 
 def is_shutdown_corner(role_one, speed, acceleration, agility, awareness):
     """ Determines whether the given values qualify a player to be labeled as a 'shutdown corner'. """
-    if role_one == 38:
-        return False
-    if speed > 91 and acceleration > 89 and agility > 85 and awareness > 75:
-        return True
-    return False
+    return (allowed(role_one, "shutdown_corner") & (speed > 91) & (acceleration > 89) & (agility > 85)
+            & (awareness > 75))
 
 def is_speed_back(role_one, speed, acceleration):
     """ Determines whether the given values qualify a player to be labeled as a 'speed back'. """
-    if role_one in [21, 22, 23]:
-        return False
-    if speed > 94 or (speed > 92 and acceleration > 88) or (speed > 91 and acceleration > 90):
-        return True
-    return False
+    return allowed(role_one, "speed_back") & (
+        (speed > 94) | ((speed > 92) & (acceleration > 88)) | ((speed > 91) & (acceleration > 90)))
 
 def is_team_distraction(role_one, morale, importance):
     """ Determines whether the given values qualify a player to be labeled as a 'team distraction'. """
-    if role_one in [8, 5, 6]:
-        return False
-    if morale < 55 and importance > 60:
-        return True
-    return False
+    return allowed(role_one, "team_distraction") & (morale < 55) & (importance > 60)
 
 def is_team_leader(role_one, position, awareness, morale, years_pro, overall_rating):
     """ Determines whether the given values qualify a player to be labeled as a 'team leader'. """
-    if role_one in [6, 5, 8] or position in [19, 20]:
-        return False
-    if awareness > 90 and morale > 74 and years_pro > 6 and overall_rating > 90:
-        return True
-    return False
+    return (allowed(role_one, "team_leader") & is_none_of(position, (19, 20)) & (awareness > 90) & (morale > 74)
+            & (years_pro > 6) & (overall_rating > 90))
 
 def is_team_mentor(role_one, position, awareness, morale, years_pro, overall_rating):
     """ Determines whether the given values qualify a player to be labeled as a 'team mentor'. """
-    if role_one in [5, 6, 8] or position in [19, 20]:
-        return False
-    if awareness > 87 and morale > 80 and years_pro > 8 and overall_rating > 85:
-        return True
-    return False
+    return (allowed(role_one, "team_mentor") & is_none_of(position, (19, 20)) & (awareness > 87) & (morale > 80)
+            & (years_pro > 8) & (overall_rating > 85))
 
 def is_underachiever(role_one, draft_round, draft_pick, years_pro, overall_rating):
     """ Determines whether the given values qualify a player to be labeled as an 'underachiever'. """
-    if role_one == 4:
-        return False
-    if draft_round == 1 and draft_pick < 16 and years_pro > 3 and years_pro < 10 and overall_rating < 83:
-        return True
-    return False
+    return (allowed(role_one, "underachiever") & (draft_round == 1) & (draft_pick < 16) & (years_pro > 3)
+            & (years_pro < 10) & (overall_rating < 83))
+
+class RoleRules:
+    """ The roles a position's players are checked for, in order, compiled to give each player his role_one and
+        role_two (if the CSV doesn't already) from a single evaluation of each role's is_* function. """
+
+    def __init__(self, first_roles, second_roles):
+        # The index (in the list of conditions passed to assign) and value of each role, for role_one and role_two.
+        self.first_indexes = [condition_index for condition_index, _ in first_roles]
+        self.first_values = np.array([ROLES[role_name][0] for _, role_name in first_roles], dtype=np.int64)
+        self.second_indexes = [condition_index for condition_index, _ in second_roles]
+        self.second_values = np.array([ROLES[role_name][0] for _, role_name in second_roles], dtype=np.int64)
+        self.second_conflicts = [ROLES[role_name][1] for _, role_name in second_roles]
+        self.first_list = list(zip(self.first_indexes, self.first_values.tolist()))
+        self.second_list = list(zip(self.second_indexes, self.second_values.tolist(), self.second_conflicts))
+
+    def __repr__(self):
+        return "RoleRules(first_roles={0}, second_roles={1})".format(len(self.first_list), len(self.second_list))
+
+    def assign(self, role_one, role_two, conditions):
+        """ Returns role_one and role_two, each either as given or, if it is NO_ROLE, the first role in order whose
+            condition is true (and, for role_two, that doesn't conflict with role_one, if he has one). The conditions
+            are the results of the is_* functions (called with NO_ROLE), as booleans or boolean arrays. """
+        if np.ndim(role_one) == 0 and np.ndim(role_two) == 0:
+            if role_one == NO_ROLE:
+                role_one = next((value for index, value in self.first_list if conditions[index]), NO_ROLE)
+            if role_two == NO_ROLE and role_one != NO_ROLE:
+                role_two = next(
+                    (value for index, value, conflicts in self.second_list
+                     if conditions[index] and role_one not in conflicts),
+                    NO_ROLE
+                )
+            return role_one, role_two
+
+        # For a whole group of players: one row of the matrix per condition, and one column per player.
+        role_one, role_two = np.asarray(role_one), np.asarray(role_two)
+        matrix = np.array(np.broadcast_arrays(*conditions, role_one)[:-1], dtype=bool).reshape(
+            len(conditions), -1)
+        role_one = np.where(role_one == NO_ROLE, first_true(matrix[self.first_indexes], self.first_values), role_one)
+        second_matrix = matrix[self.second_indexes]
+        for row, conflicts in enumerate(self.second_conflicts):
+            second_matrix[row] &= ~np.isin(role_one, conflicts)
+        role_two = np.where(
+            (role_two == NO_ROLE) & (role_one != NO_ROLE), first_true(second_matrix, self.second_values), role_two)
+        return role_one, role_two
+
+def first_true(matrix, values):
+    """ Returns, for each column of a boolean matrix, the value for its first true row (or NO_ROLE if it has none). """
+    if len(values) == 0:
+        return np.full(matrix.shape[1], NO_ROLE, dtype=np.int64)
+    return np.where(matrix.any(axis=0), values[matrix.argmax(axis=0)], NO_ROLE)
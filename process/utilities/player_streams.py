@@ -0,0 +1,101 @@
+r"""player_streams.py
+
+    This module contains the PlayerStreams class, which gives each player his own stream of random numbers, so that
+    the values picked for him (face_id, PEGO, body shape, etc.) depend only on the run's seed and on who he is, and not
+    on how many players were created before him, how they were split into chunks, or which worker process made him.
+
+    Each player's stream comes from a NumPy Generator using the counter-based Philox bit generator, keyed by a hash of
+    the run seed and the player's identity (see player_keys). The position specs (see "position_specs.py") turn the
+    next number from a player's stream into a weighted pick with the distribution's sampler (see "samplers.py"). A
+    player uses at most one number per distribution in his position's spec, so we draw all of them at once.
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import hashlib
+
+
+# 1.2 - Third-party imports
+
+import numpy as np
+
+
+# 1.3 - Application-specific imports
+
+
+# 1.4 - Global settings
+
+
+# 1.5 - Global constants
+
+# The columns of "Current Player Attributes.csv" that say who a player is. (His team, position, and ratings can all
+# change without changing his stream.)
+IDENTITY_COLUMNS = ("first_name", "last_name", "birthdate", "college")
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+class PlayerStreams:
+    """ The random numbers for a group of players: each row holds the numbers for one player, used in order. """
+
+    def __init__(self, run_seed, player_keys, draw_count):
+        self.uniforms = np.empty((len(player_keys), draw_count))
+        for row, player_key in enumerate(player_keys):
+            generator = np.random.Generator(np.random.Philox(key=stream_key(run_seed, player_key)))
+            self.uniforms[row] = generator.random(draw_count)
+        # How many numbers each player has used so far.
+        self.used_counts = np.zeros(len(player_keys), dtype=np.int64)
+
+    def __repr__(self):
+        return "PlayerStreams(players={0}, draws={1})".format(*self.uniforms.shape)
+
+    def next_uniforms(self, rows):
+        """ Returns the next number (in [0, 1)) from the stream of each player in a list of rows. """
+        uniforms = self.uniforms[rows, self.used_counts[rows]]
+        self.used_counts[rows] += 1
+        return uniforms
+
+    def next_uniform(self):
+        """ Returns the next number from the stream of a lone player (row 0). """
+        return self.next_uniforms([0])[0]
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def player_keys(player_attributes):
+    """ Returns the identity of each player in a PlayerAttributes, numbering any repeats so each key is unique. """
+    keys = [
+        "|".join(cell.strip().upper() for cell in cells)
+        for cells in zip(*(cell_strings(player_attributes[column_name]) for column_name in IDENTITY_COLUMNS))
+    ]
+    indexes_by_key = {}
+    for index, key in enumerate(keys):
+        indexes_by_key.setdefault(key, []).append(index)
+    repeats = [indexes for indexes in indexes_by_key.values() if len(indexes) > 1]
+    if repeats:
+        # Players who share an identity are numbered in the order of their whole rows, rather than where the rows are
+        # in the file, so that reordering the CSV doesn't swap their streams. (Editing one of their rows still can, if
+        # it changes their order; rows that are exactly alike can't be told apart, but then neither can their players.)
+        columns = [cell_strings(player_attributes[column_name]) for column_name in player_attributes.column_names]
+        for indexes in repeats:
+            ordered_indexes = sorted(indexes, key=lambda index: [column[index] for column in columns])
+            for number, index in enumerate(ordered_indexes[1:], 2):
+                keys[index] = "{0}#{1}".format(keys[index], number)
+    return keys
+
+def cell_strings(column):
+    """ Returns a column of a PlayerAttributes as a list of strings, as its cells were in the CSV file. """
+    if isinstance(column, np.ma.MaskedArray):
+        # A column of numbers, like the birthdate in some files; its empty cells go back to being empty.
+        column = np.where(np.ma.getmaskarray(column), "", column.data.astype(str))
+    return column.tolist()
+
+def stream_key(run_seed, player_key):
+    """ Returns the 128-bit Philox key for a player's stream in a given run. """
+    digest = hashlib.blake2b("{0}:{1}".format(run_seed, player_key).encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest, "little")
@@ -0,0 +1,646 @@
+r"""position_specs.py
+
+    This module contains the PositionSpec class, which turns the spec of one position (read from a JSON file in the
+    "positions" folder next to this file, eg. "positions\quarterback.json") into a function that works out the value
+    of every PLAY field for a player at that position. RosterManager loads and compiles all of them once, at startup.
+
+    A spec has the position's abbreviation (as used in the "position" column of "Current Player Attributes.csv"), its
+    PPOS value, and a list of steps, which are worked through in order. Each step sets a "name" (a variable that later
+    steps can use), a "field" (or a list of fields), or both, to the result of one of:
+
+        {"value": 999}                                      A number, or an expression (as a string), eg.
+        {"value": "int(player['age'])"}                     "int(player['age'])" or "(elusiveness + trucking) / 2".
+        {"values": [0, 1, 2], "weights": [80, 15, 5]}       A weighted random pick. "range": [54, 79] (inclusive)
+        {"range": [54, 79], "weights": [1, 2, ...]}         stands in for a list of consecutive values.
+        {"distribution": "PMOR_all_but_specialists"}        A weighted random pick from one of the distributions
+                                                            named in "distributions.json" (see "distributions.py").
+        {"column": "speed", "clamp": [45, 85],              The column's value clamped to the range, or the fallback
+         "fallback": {...}}                                 if the column is empty.
+        {"column": "visor", "missing": -1,                  The column's value, or the fallback if the column holds
+         "fallback": {...}}                                 the "missing" value.
+        {"cases": [{"when": "speed > 81", ...},             The first case whose "when" expression is true (a last
+                   {...}]}                                  case without a "when" is the default).
+
+    Any of those (including each case and fallback) may also have a "set" dict of other names to set first, and a
+    "note" describing it. Expressions can use the names set by earlier steps, the player's CSV row (as "player"), his
+    record index ("index"), his PPOS value ("position"), the RosterLookups ("roster"), "math", "player_roles", and
+    "overall_ratings" (which has every position's POVR formula). A spec passes overall_rating its ratings by name, and
+    each must have been clamped (by a "clamp", or a value like "int(max(min(..., 99), 60))") to the range the formula
+    gives it; this is checked as the spec is compiled.
+
+    A step may instead give the player his roles (once "role_one" and "role_two" are set from the CSV), listing the
+    roles his position checks for, in order, each with the arguments of its is_* function (see "player_roles.py"):
+
+        {"roles": ["injury_prone(injury, toughness)",       Any role_one or role_two that is still 45 (none) becomes
+                   "team_distraction(morale, importance)",  the first of the roles he qualifies for (and, for role_two,
+                   ...],                                    that doesn't conflict with his role_one). "second_roles",
+         "second_roles": [...]}                             if given, is the list for role_two instead.
+
+    Each spec is compiled into the source code of two Python functions. The first (PositionSpec.evaluate) creates one
+    player, running about the same code the old hand-written "_[position].py" modules did, but with the weighted
+    distributions built once, when the spec is compiled, rather than on every pick. The second (evaluate_batch, used
+    through PositionSpec.evaluate_players) creates a whole group of players at the same position at once, from their
+    columns in a PlayerAttributes (see "player_attributes.py"): every name holds a NumPy array with one element per
+    player, each case or fallback only applies to the rows (players) in its mask, and each weighted pick draws the
+    values for all of the rows that need one in a single call. Both make their picks from each player's own stream of
+    random numbers (see "player_streams.py"), taking the next number from it for each pick he needs, so a player gets
+    the same values from either function, whichever group he is created in.
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import ast, builtins, functools, glob, json, math, os
+
+
+# 1.2 - Third-party imports
+
+import numpy as np
+
+
+# 1.3 - Application-specific imports
+
+from . import overall_ratings, player_roles
+from .distributions import DISTRIBUTIONS, Distribution
+from .player_attributes import UNSET_VALUE
+
+
+# 1.4 - Global settings
+
+
+# 1.5 - Global constants
+
+# The folder with one spec file per position.
+POSITIONS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "positions")
+
+# The names every spec's expressions can use without setting them first.
+SPEC_GLOBAL_NAMES = {"math", "overall_ratings", "player", "player_roles", "position", "roster", "index"}
+
+# The keys that say what a step (or case, or fallback) gives its name or fields.
+CHOICE_KEYS = ("value", "weights", "distribution", "column", "cases")
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+class PositionSpec:
+    """ The spec of one position, compiled into a function returning a player's {field name: value} dict. """
+
+    def __init__(self, spec, spec_name="<spec>"):
+        self.spec_name = spec_name
+        self.position = spec["position"].upper()
+        self.position_id = spec["position_id"]
+        self.steps = spec["steps"]
+
+        # The distributions' samplers (see "samplers.py"), which the compiled function refers to by name. Each
+        # distribution uses up (at most) one number from a player's stream, so this also counts the numbers he needs.
+        self.constants = {}
+        self.distribution_count = 0
+        self.distribution_names = {}
+        # The RoleRules of each roles step, and the code of each of the conditions it takes, by the id of the step.
+        self.role_rules = {}
+        # The ranges each name's values are clamped to (None for a value that isn't), by name, so the overall rating
+        # can check them against its formula's.
+        self.clamps = {}
+        # The names set so far, as we compile the steps in order.
+        self.defined_names = set(SPEC_GLOBAL_NAMES)
+        lines = ["def evaluate(roster, player, index, streams):", "    fields = {}", "    position = {0!r}".format(
+            self.position_id)]
+        for step_number, step in enumerate(self.steps, 1):
+            self.step_number = step_number
+            lines.extend(self.compile_step(step, "    "))
+        lines.append("    return fields")
+        self.source = "\n".join(lines) + "\n"
+
+        namespace = {
+            "math": math, "overall_ratings": overall_ratings, "player_roles": player_roles,
+            "random_choice": random_choice
+        }
+        namespace.update(self.constants)
+        exec(compile(self.source, "<{0}>".format(spec_name), "exec"), namespace)
+        self.evaluate = namespace["evaluate"]
+
+        # Compile the same steps again into a function that works on a whole group of players at once, with a NumPy
+        # array (one element per player) wherever the function above has a single value.
+        self.batch_names = set()
+        self.mask_count = 0
+        lines = [
+            "def evaluate_batch(roster, player, index, streams):",
+            "    fields = {}",
+            "    all_rows = np.ones(len(index), dtype=bool)",
+            "    position = {0!r}".format(self.position_id)
+        ]
+        for step_number, step in enumerate(self.steps, 1):
+            self.step_number = step_number
+            lines.extend(self.compile_batch_step(step))
+        lines.append("    return fields")
+        self.batch_source = "\n".join(lines) + "\n"
+
+        namespace = dict(BATCH_FUNCTIONS)
+        namespace.update({"np": np, "math": math, "overall_ratings": overall_ratings, "player_roles": player_roles})
+        namespace.update(self.constants)
+        exec(compile(self.batch_source, "<{0} batch>".format(spec_name), "exec"), namespace)
+        self.evaluate_batch = namespace["evaluate_batch"]
+
+    def __repr__(self):
+        return "PositionSpec({0!r}, position_id={1}, steps={2})".format(
+            self.position, self.position_id, len(self.steps))
+
+    def spec_error(self, message):
+        """ Returns a ValueError for a problem with the current step of this spec. """
+        return ValueError("{0}, step {1}: {2}".format(self.spec_name, self.step_number, message))
+
+    def compile_step(self, step, indent):
+        """ Returns the lines of code for one step: working out its value, then setting its name and/or fields. """
+        if "roles" in step:
+            rules_name, conditions = self.compile_roles(step)
+            return [
+                "{0}if role_one == {1} or role_two == {1}:".format(indent, player_roles.NO_ROLE),
+                "{0}    role_one, role_two = {1}.assign(role_one, role_two, ({2},))".format(
+                    indent, rules_name, ", ".join(conditions))
+            ]
+        name = step.get("name")
+        field_names = step.get("field", [])
+        if isinstance(field_names, str):
+            field_names = [field_names]
+        field_targets = " = ".join("fields[{0!r}]".format(field_name) for field_name in field_names)
+        if name is None and not field_targets:
+            raise self.spec_error("a step needs a name, a field, or both")
+
+        if name is None:
+            return self.compile_choice(step, field_targets, indent)
+        lines = self.compile_choice(step, name, indent)
+        self.define_name(name)
+        if field_targets:
+            lines.append("{0}{1} = {2}".format(indent, field_targets, name))
+        return lines
+
+    def compile_choice(self, choice, target, indent):
+        """ Returns the lines of code that set the target (a name, or fields) to the result of a choice. """
+        lines = []
+        for name, value in choice.get("set", {}).items():
+            lines.append("{0}{1} = {2}".format(indent, name, self.expression(value)))
+            self.define_name(name)
+
+        if "column" in choice:
+            if "fallback" not in choice:
+                raise self.spec_error("a column needs a fallback")
+            column_value = "player[{0!r}]".format(choice["column"])
+            if "clamp" in choice:
+                low, high = choice["clamp"]
+                self.clamps.setdefault(target, set()).add((low, high))
+                lines.append("{0}if {1}:".format(indent, column_value))
+                lines.append("{0}    {1} = int(max(min(int({2}), {3!r}), {4!r}))".format(
+                    indent, target, column_value, high, low))
+                lines.append("{0}else:".format(indent))
+                lines.extend(self.compile_choice(choice["fallback"], target, indent + "    "))
+            elif "missing" in choice:
+                lines.append("{0}if int({1}) == {2}:".format(indent, column_value, self.expression(choice["missing"])))
+                lines.extend(self.compile_choice(choice["fallback"], target, indent + "    "))
+                lines.append("{0}else:".format(indent))
+                lines.append("{0}    {1} = int({2})".format(indent, target, column_value))
+            else:
+                raise self.spec_error("a column needs a clamp range or a missing value")
+        elif "cases" in choice:
+            cases = choice["cases"]
+            for case_number, case in enumerate(cases):
+                if "when" in case:
+                    keyword = "if" if case_number == 0 else "elif"
+                    lines.append("{0}{1} {2}:".format(indent, keyword, self.expression(case["when"])))
+                elif case_number == len(cases) - 1 and case_number > 0:
+                    lines.append("{0}else:".format(indent))
+                else:
+                    raise self.spec_error("only the last of several cases can leave out 'when'")
+                case_lines = self.compile_choice(case, target, indent + "    ")
+                lines.extend(case_lines or ["{0}    pass".format(indent)])
+        elif "weights" in choice or "distribution" in choice:
+            lines.append("{0}{1} = {2}".format(indent, target, self.distribution(choice)))
+        elif "value" in choice:
+            lines.append("{0}{1} = {2}".format(indent, target, self.expression(choice["value"])))
+            if isinstance(choice["value"], str):
+                self.clamps.setdefault(target, set()).add(clamp_range(choice["value"]))
+        elif "set" not in choice:
+            raise self.spec_error("expected one of {0}".format(", ".join(CHOICE_KEYS)))
+        return lines
+
+    def distribution(self, choice):
+        """ Returns the code for a weighted random pick, from a named distribution or one listed in the choice. """
+        if "distribution" in choice:
+            distribution = DISTRIBUTIONS.get(choice["distribution"])
+            if distribution is None:
+                raise self.spec_error("there is no distribution named {0!r}".format(choice["distribution"]))
+        else:
+            try:
+                distribution = Distribution.from_choice(choice)
+            except ValueError as error:
+                raise self.spec_error(str(error))
+        constant_number = self.distribution_count
+        self.distribution_count += 1
+
+        sampler_name = "SAMPLER_{0}".format(constant_number)
+        self.constants[sampler_name] = distribution.sampler
+        self.distribution_names[id(choice)] = (sampler_name, distribution)
+        if distribution.constant_values:
+            return "random_choice({0}, streams)".format(sampler_name)
+        # Values that depend on earlier steps (eg. "left_elbow") are listed as they are picked, and the sampler picks
+        # which one of them to use.
+        values_code = "[{0}]".format(", ".join(self.expression(value) for value in distribution.values))
+        return "random_choice({0}, streams, {1})".format(sampler_name, values_code)
+
+    def compile_roles(self, step):
+        """ Builds the RoleRules for a roles step; returns its name and the code of each of the conditions it takes. """
+        if not {"role_one", "role_two"} <= self.defined_names:
+            raise self.spec_error("role_one and role_two must be set before the roles")
+        # Each role (with the same arguments) is only checked once, even if it is in both lists.
+        conditions = []
+        role_lists = []
+        for role_list in (step["roles"], step.get("second_roles", step["roles"])):
+            roles = []
+            for role in role_list:
+                try:
+                    call = ast.parse(role, mode="eval").body
+                except SyntaxError as error:
+                    raise self.spec_error("bad role {0!r}: {1}".format(role, error.msg))
+                if not isinstance(call, ast.Call) or not isinstance(call.func, ast.Name) or call.keywords:
+                    raise self.spec_error("expected a role like 'injury_prone(injury, toughness)', not {0!r}".format(
+                        role))
+                if call.func.id not in player_roles.ROLES:
+                    raise self.spec_error("there is no role named {0!r}".format(call.func.id))
+                arguments = [self.expression(ast.unparse(argument)) for argument in call.args]
+                condition = "player_roles.is_{0}({1})".format(
+                    call.func.id, ", ".join([str(player_roles.NO_ROLE)] + arguments))
+                if condition not in conditions:
+                    conditions.append(condition)
+                roles.append((conditions.index(condition), call.func.id))
+            role_lists.append(roles)
+
+        rules_name = "ROLE_RULES_{0}".format(len(self.role_rules))
+        self.constants[rules_name] = player_roles.RoleRules(*role_lists)
+        self.role_rules[id(step)] = (rules_name, conditions)
+        return rules_name, conditions
+
+    def expression(self, value):
+        """ Returns the code for a number or an expression, after checking that it only uses names already set. """
+        if not isinstance(value, str):
+            return repr(value)
+        try:
+            tree = ast.parse(value, mode="eval")
+        except SyntaxError as error:
+            raise self.spec_error("bad expression {0!r}: {1}".format(value, error.msg))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and node.id not in self.defined_names and not hasattr(builtins, node.id):
+                raise self.spec_error("{0!r} uses {1!r} before it is set".format(value, node.id))
+            if isinstance(node, ast.Call) and ast.unparse(node.func) == "overall_ratings.overall_rating":
+                self.check_overall_rating(node)
+        return value
+
+    def check_overall_rating(self, call):
+        """ Checks that an overall_rating call passes its formula's ratings, each clamped to the formula's range. """
+        if len(call.args) != 1 or not isinstance(call.args[0], ast.Constant):
+            raise self.spec_error("expected overall_ratings.overall_rating('POSITION', rating_name=rating, ...)")
+        try:
+            formula = overall_ratings.formula_for(call.args[0].value)
+            formula.values_of({keyword.arg: None for keyword in call.keywords})
+        except ValueError as error:
+            raise self.spec_error(str(error))
+        for keyword in call.keywords:
+            clamps = self.clamps.get(keyword.value.id) if isinstance(keyword.value, ast.Name) else None
+            if clamps != {formula.ranges[keyword.arg]}:
+                raise self.spec_error(
+                    "the {0} overall rating needs {1} clamped to {2} (see \"overall_ratings.py\"), not {3}".format(
+                        call.args[0].value, keyword.arg, list(formula.ranges[keyword.arg]),
+                        " and ".join(sorted(str(list(clamp)) if clamp else "unclamped" for clamp in clamps or [None]))))
+
+    def define_name(self, name):
+        """ Records that a name has been set, so later expressions can use it. """
+        if not name.isidentifier() or name.startswith("_") or name in ("fields", "random_choice", "streams"):
+            raise self.spec_error("{0!r} cannot be used as a name".format(name))
+        self.defined_names.add(name)
+
+    def compile_batch_step(self, step):
+        """ Returns the lines of code for one step of the batch function. """
+        if "roles" in step:
+            rules_name, conditions = self.role_rules[id(step)]
+            return ["    role_one, role_two = {0}.assign(role_one, role_two, ({1},))".format(
+                rules_name, ", ".join(self.batch_expression(condition, "all_rows") for condition in conditions))]
+        name = step.get("name")
+        field_names = step.get("field", [])
+        if isinstance(field_names, str):
+            field_names = [field_names]
+        target = "step_value" if name is None else name
+
+        lines = []
+        if target not in self.batch_names:
+            lines.append("    {0} = None".format(target))
+        lines.extend(self.compile_batch_choice(step, target, "all_rows"))
+        if name is not None:
+            self.batch_names.add(name)
+        for field_name in field_names:
+            lines.append("    fields[{0!r}] = {1}".format(field_name, target))
+        return lines
+
+    def compile_batch_choice(self, choice, target, mask):
+        """ Returns the lines of code that set the target to the result of a choice, for the rows in the mask. """
+        lines = []
+        for name, value in choice.get("set", {}).items():
+            lines.append(self.merge_line(name, mask, self.batch_expression(value, mask)))
+            self.batch_names.add(name)
+
+        if "column" in choice:
+            column_value = "player[{0!r}]".format(choice["column"])
+            if "clamp" in choice:
+                low, high = choice["clamp"]
+                present, absent = self.new_mask(), self.new_mask()
+                lines.append("    {0} = {1} & present({2})".format(present, mask, column_value))
+                lines.append("    {0} = {1} & ~present({2})".format(absent, mask, column_value))
+                lines.append(self.merge_line(
+                    target, present, "np.clip(to_int({0}), {1!r}, {2!r})".format(column_value, low, high)))
+                lines.extend(self.compile_batch_choice(choice["fallback"], target, absent))
+            else:
+                missing, present = self.new_mask(), self.new_mask()
+                if choice["missing"] == UNSET_VALUE:
+                    # The loader has already found all of the -1s.
+                    is_missing = "player.is_unset({0!r})".format(choice["column"])
+                else:
+                    missing_value = self.batch_expression(choice["missing"], mask)
+                    is_missing = "(to_int({0}) == {1})".format(column_value, missing_value)
+                lines.append("    {0} = {1} & {2}".format(missing, mask, is_missing))
+                lines.append("    {0} = {1} & ~{2}".format(present, mask, is_missing))
+                lines.extend(self.compile_batch_choice(choice["fallback"], target, missing))
+                lines.append(self.merge_line(target, present, "to_int({0})".format(column_value)))
+        elif "cases" in choice:
+            # Each case gets the rows that are still left and match its "when"; the rest go on to the next case.
+            remaining = mask
+            for case in choice["cases"]:
+                if "when" not in case:
+                    lines.extend(self.compile_batch_choice(case, target, remaining))
+                    break
+                matched, unmatched = self.new_mask(), self.new_mask()
+                when = "truthy({0})".format(self.batch_expression(case["when"], remaining))
+                lines.append("    {0} = {1} & ({2})".format(matched, remaining, when))
+                lines.append("    {0} = {1} & ~{2}".format(unmatched, remaining, matched))
+                lines.extend(self.compile_batch_choice(case, target, matched))
+                remaining = unmatched
+        elif "weights" in choice or "distribution" in choice:
+            sampler_name, distribution = self.distribution_names[id(choice)]
+            values_code = "None"
+            if not distribution.constant_values:
+                values_code = "[{0}]".format(", ".join(
+                    self.batch_expression(value, mask) for value in distribution.values))
+            draw_code = "draw({0}, {1}, streams, {2})".format(mask, sampler_name, values_code)
+            lines.append(self.merge_line(target, mask, draw_code))
+        elif "value" in choice:
+            lines.append(self.merge_line(target, mask, self.batch_expression(choice["value"], mask)))
+        return lines
+
+    def merge_line(self, target, mask, value_code):
+        """ Returns the line of code that sets the target to a value for the rows in the mask (only). """
+        if mask == "all_rows":
+            # The value replaces the whole of the target (and its type).
+            return "    {0} = merge(all_rows, {1}, None)".format(target, value_code)
+        return "    {0} = merge({1}, {2}, {0})".format(target, mask, value_code)
+
+    def new_mask(self):
+        """ Returns the name of a new variable to hold a boolean mask of rows. """
+        self.mask_count += 1
+        return "mask_{0}".format(self.mask_count)
+
+    def batch_expression(self, value, mask):
+        """ Returns the code for a number or an expression, rewritten to work on arrays of values. """
+        if not isinstance(value, str):
+            return repr(value)
+        tree = BatchExpressionTransformer(self, mask).visit(ast.parse(value, mode="eval"))
+        return ast.unparse(ast.fix_missing_locations(tree))
+
+    def evaluate_player_columns(self, roster, players, indexes, streams):
+        """ Works out the fields of a group of players (a PlayerAttributes) at once; returns a list per field. """
+        with np.errstate(all="ignore"):
+            # Rows that are not in a mask are still computed, so ignore any division by zero, etc. in them.
+            fields = self.evaluate_batch(roster, players, np.array(indexes, dtype=np.int64), streams)
+        return {field_name: values.tolist() for field_name, values in fields.items()}
+
+    def evaluate_players(self, roster, players, indexes, streams):
+        """ Works out the fields of a group of players (a PlayerAttributes) at once; returns a dict per player. """
+        field_lists = self.evaluate_player_columns(roster, players, indexes, streams)
+        return [
+            {field_name: values[row] for field_name, values in field_lists.items()}
+            for row in range(len(players))
+        ]
+
+class BatchExpressionTransformer(ast.NodeTransformer):
+    """ Rewrites a spec expression written for one player into one that works on arrays of values. """
+
+    # The calls we can replace with a NumPy equivalent (or one of the BATCH_FUNCTIONS), by their names.
+    array_functions = {
+        "int": "to_int", "round": "to_round", "min": "minimum", "max": "maximum", "len": "str_len",
+        "math.ceil": "to_ceil", "math.pow": "np.power"
+    }
+
+    def __init__(self, position_spec, mask):
+        self.position_spec = position_spec
+        self.mask = mask
+
+    @staticmethod
+    def call(function_name, *arguments):
+        """ Returns the node for a call of a (possibly dotted) function name with the given argument nodes. """
+        return ast.Call(ast.parse(function_name, mode="eval").body, list(arguments), [])
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        function_name = ast.unparse(node.func)
+        if function_name in self.array_functions:
+            node.func = ast.parse(self.array_functions[function_name], mode="eval").body
+        elif isinstance(node.func, ast.Attribute) and node.func.attr == "upper" and not node.args:
+            node = self.call("upper", node.func.value)
+        elif function_name.startswith(
+                ("player_roles.", "overall_ratings.", "roster.pay_tiers.", "roster.colleges.", "roster.teams.")):
+            # The role, overall rating, pay tier, college, and team functions work on whole arrays as they are.
+            pass
+        elif function_name.startswith("roster."):
+            # Anything else is called once per player (in the mask).
+            node = self.call("elementwise", ast.Name(self.mask, ast.Load()), node.func, *node.args)
+        else:
+            raise self.position_spec.spec_error(
+                "cannot work out {0}() for a whole group of players".format(function_name))
+        return node
+
+    def visit_BoolOp(self, node):
+        self.generic_visit(node)
+        function_name = "np.logical_and" if isinstance(node.op, ast.And) else "np.logical_or"
+        values = [self.call("truthy", value) for value in node.values]
+        result = values[0]
+        for value in values[1:]:
+            result = self.call(function_name, result, value)
+        return result
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return self.call("np.logical_not", self.call("truthy", node.operand))
+        return node
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        if len(node.ops) == 1 and isinstance(node.ops[0], (ast.In, ast.NotIn)):
+            contains = self.call("contains", node.comparators[0], node.left)
+            if isinstance(node.ops[0], ast.NotIn):
+                return ast.UnaryOp(ast.Invert(), contains)
+            return contains
+        if len(node.ops) > 1:
+            raise self.position_spec.spec_error("cannot work out a chained comparison for a whole group of players")
+        return node
+
+    def visit_Subscript(self, node):
+        self.generic_visit(node)
+        if isinstance(node.slice, ast.Slice):
+            # Cutting strings down, like player['first_name'][:11].
+            bounds = [node.slice.lower or ast.Constant(None), node.slice.upper or ast.Constant(None)]
+            return self.call("slice_strings", node.value, *bounds)
+        return node
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+# These are the functions the batch functions call, each of which works on arrays with one element per player.
+
+def to_int(values):
+    """ Like int(), for arrays: parses strings (with empty ones as 0) and truncates floats. """
+    if isinstance(values, np.ma.MaskedArray):
+        # A numeric column from the CSV; its empty cells are masked.
+        return values.filled(0)
+    values = np.asarray(values)
+    if values.dtype.kind == "U":
+        return np.where(values == "", "0", values).astype(np.int64)
+    if values.dtype.kind == "f":
+        return np.trunc(values).astype(np.int64)
+    return values.astype(np.int64)
+
+def to_round(values):
+    """ Like round(), for arrays (which also rounds halves to even). """
+    return np.round(values).astype(np.int64)
+
+def to_ceil(values):
+    """ Like math.ceil(), for arrays. """
+    return np.ceil(values).astype(np.int64)
+
+def minimum(*values):
+    """ Like min(), for arrays, element by element. """
+    return functools.reduce(np.minimum, values)
+
+def maximum(*values):
+    """ Like max(), for arrays, element by element. """
+    return functools.reduce(np.maximum, values)
+
+def merge(mask, new_values, old_values):
+    """ Returns the new values in the rows in the mask and the old values (or 0, if there are none yet) elsewhere. """
+    if old_values is None:
+        old_values = "" if np.asarray(new_values).dtype.kind == "U" else 0
+    return np.where(mask, new_values, old_values)
+
+def random_choice(sampler, streams, values=None):
+    """ Returns a weighted random pick (of the sampler's values, or else the given ones), for a lone player. """
+    if values is None:
+        return sampler.pick(streams.next_uniform())
+    return values[sampler.pick_index(streams.next_uniform())]
+
+def draw(mask, sampler, streams, values=None):
+    """ Returns a weighted random pick (of the sampler's values, or else the given ones) for each row in the mask. """
+    rows = np.flatnonzero(mask)
+    uniforms = streams.next_uniforms(rows)
+    if values is None:
+        # The whole group's picks, in one go.
+        drawn = sampler.picks(uniforms)
+    else:
+        # Some of the values are themselves arrays, from earlier steps; pick each row's from its own.
+        drawn = np.stack([np.broadcast_to(value, mask.shape) for value in values])[sampler.pick_indexes(uniforms), rows]
+    result = np.zeros(len(mask), dtype=drawn.dtype)
+    result[rows] = drawn
+    return result
+
+def elementwise(mask, function, *arguments):
+    """ Calls a function for each row in the mask, with the row's element of each array argument. """
+    if not any(isinstance(argument, np.ndarray) for argument in arguments):
+        return function(*arguments)
+    rows = np.flatnonzero(mask)
+    columns = [
+        argument[rows] if isinstance(argument, np.ndarray) else [argument] * len(rows) for argument in arguments
+    ]
+    results = np.array([function(*row_arguments) for row_arguments in zip(*columns)])
+    result = np.zeros(len(mask), dtype=results.dtype if len(rows) else np.int64)
+    result[rows] = results
+    return result
+
+def present(values):
+    """ Returns a boolean array that is True where a column from the CSV has a non-empty cell. """
+    if isinstance(values, np.ma.MaskedArray):
+        return ~np.ma.getmaskarray(values)
+    return np.asarray(values) != ""
+
+def truthy(values):
+    """ Like bool(), for arrays: empty strings and zeros are False (as are empty cells, but not 0s, from the CSV). """
+    if isinstance(values, np.ma.MaskedArray):
+        # In the CSV, any cell with something in it (even a 0) was a non-empty, and so true, string.
+        return present(values)
+    values = np.asarray(values)
+    if values.dtype.kind == "U":
+        return values != ""
+    return values.astype(bool)
+
+def contains(strings, substring):
+    """ Like 'substring in string', for an array of strings. """
+    return np.char.find(strings, substring) >= 0
+
+def slice_strings(strings, start, stop):
+    """ Like string[start:stop], for an array of strings. """
+    return np.array([string[start:stop] for string in np.asarray(strings).tolist()], dtype=str)
+
+def upper(strings):
+    """ Like string.upper(), for an array of strings. """
+    return np.char.upper(strings)
+
+def str_len(strings):
+    """ Like len(string), for an array of strings. """
+    return np.char.str_len(strings)
+
+# The names the batch functions use for the functions above.
+BATCH_FUNCTIONS = {
+    function.__name__: function
+    for function in (
+        to_int, to_round, to_ceil, minimum, maximum, merge, draw, elementwise, present, truthy, contains, slice_strings,
+        upper, str_len)
+}
+
+def clamp_range(value):
+    """ Returns the (low, high) of an expression like "int(max(min(..., high), low))", or None for any other. """
+    node = ast.parse(value, mode="eval").body
+    if isinstance(node, ast.Call) and ast.unparse(node.func) == "int" and len(node.args) == 1:
+        node = node.args[0]
+    if not (isinstance(node, ast.Call) and ast.unparse(node.func) == "max" and len(node.args) == 2):
+        return None
+    inner, low = node.args
+    if not (isinstance(inner, ast.Call) and ast.unparse(inner.func) == "min" and len(inner.args) == 2):
+        return None
+    high = inner.args[1]
+    if not (isinstance(low, ast.Constant) and isinstance(high, ast.Constant)):
+        return None
+    return low.value, high.value
+
+def load_position_spec(spec_path):
+    """ Reads and compiles one position's spec file. """
+    with open(spec_path) as spec_file:
+        spec = json.load(spec_file)
+    return PositionSpec(spec, os.path.basename(spec_path))
+
+def load_position_specs(positions_folder=POSITIONS_FOLDER):
+    """ Reads and compiles every spec in a folder; returns a dict of {position abbreviation: PositionSpec}. """
+    position_specs = {}
+    for spec_path in sorted(glob.glob(os.path.join(positions_folder, "*.json"))):
+        position_spec = load_position_spec(spec_path)
+        if position_spec.position in position_specs:
+            raise ValueError("{0}: position {1} already has a spec".format(
+                os.path.basename(spec_path), position_spec.position))
+        position_specs[position_spec.position] = position_spec
+    return position_specs
@@ -4,10 +4,11 @@ r""" randomizer_functions.py
     separate files) to generate pseudo-random values (given certain options and porbability weightings).
 """
 
-from numpy import array, random
+from numpy import random
+
+from .samplers import sampler_for
 
 def get_weighted_random(values_list, weights_list):
     """ Gets a random value from a list of possible values where each value is assigned a weighted probability. """
-    weights_array = array(weights_list)
-    normalized_weights = weights_array / weights_array.sum()
-    return random.choice(values_list, p=normalized_weights)
+    # The alias table for each distinct distribution is only built the first time it is used (see "samplers.py").
+    return sampler_for(values_list, weights_list).pick(random.random_sample())
@@ -0,0 +1,167 @@
+r"""roster_diff.py
+
+    This file compares two roster files (by default "base.ros", found in "[BASE_MADDEN_PATH]\process\inputs\step5\",
+    and "current.ros", found in "[BASE_MADDEN_PATH]\process\outputs\step5\") table by table and record by record, and
+    writes a report of every field that changed to "[BASE_MADDEN_PATH]\docs\Roster dumps\base_vs_current.csv". If the
+    output path ends in ".json", the report is written as JSON instead.
+
+    Both files are read with the memory-mapped reader in "tdb_file.py". Each record's raw bytes are hashed first, and
+    only the records whose hashes differ are decoded (a field at a time, with the vectorized decoder in
+    "tdb_columns.py") to find which of their fields changed. Records past the end of one file's table are reported
+    once each, as added or removed, rather than field by field.
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import csv, hashlib, json, logging, os
+
+
+# 1.2 - Third-party imports
+
+import numpy as np
+
+
+# 1.3 - Application-specific imports
+
+# This module can be run as a script inside the utilities folder or imported from the utilities package.
+try:
+    from .tdb_columns import decode_column
+    from .tdb_file import TDBFile
+except ImportError:
+    from tdb_columns import decode_column
+    from tdb_file import TDBFile
+
+
+# 1.4 - Global settings
+
+logging.basicConfig(level=logging.INFO)
+
+
+# 1.5 - Global constants
+
+# Set the base path we will use to keep other paths relative, and shorter :^)
+# This will be the directory above the directory above the directory this file is in.
+BASE_MADDEN_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The two roster files we compare, and the report we write.
+OLD_ROSTER_PATH = os.path.join(BASE_MADDEN_PATH, "process", "inputs", "step5", "base.ros")
+NEW_ROSTER_PATH = os.path.join(BASE_MADDEN_PATH, "process", "outputs", "step5", "current.ros")
+OUTPUT_PATH = os.path.join(BASE_MADDEN_PATH, "docs", "Roster dumps", "base_vs_current.csv")
+
+# The columns of the report.
+REPORT_FIELD_NAMES = ["table", "record", "field", "change", "old", "new"]
+
+# The size, in bytes, of the hash we take of each record. We only compare hashes of records at the same index.
+RECORD_DIGEST_SIZE = 16
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def record_digests(table):
+    """ Returns a list with a hash of the raw bytes of each of the table's current records. """
+    records = table.records_view()
+    return [
+        hashlib.blake2b(records[start:start + table.record_bytes], digest_size=RECORD_DIGEST_SIZE).digest()
+        for start in range(0, len(records), table.record_bytes)
+    ]
+
+def table_records(table):
+    """ Returns the table's current records as a 2-D array of bytes, one row per record (without copying them). """
+    return np.frombuffer(table.records_view(), dtype=np.uint8).reshape(table.record_count, table.record_bytes)
+
+def diff_tables(old_table, new_table):
+    """ Returns a list of change dicts (with the keys in REPORT_FIELD_NAMES) between two versions of a table. """
+    changes = []
+    old_digests = record_digests(old_table)
+    new_digests = record_digests(new_table)
+
+    # Only decode the records whose hashes differ, and only if both tables lay their records out the same way.
+    changed_indexes = np.array([
+        record_index
+        for record_index, (old_digest, new_digest) in enumerate(zip(old_digests, new_digests))
+        if old_digest != new_digest
+    ], dtype=np.int64)
+    if len(changed_indexes) and old_table.get_schema() == new_table.get_schema():
+        old_records = table_records(old_table)[changed_indexes]
+        new_records = table_records(new_table)[changed_indexes]
+        field_changes = []
+        for field in new_table.fields:
+            old_values = decode_column(old_records, field)
+            new_values = decode_column(new_records, field)
+            for position in np.flatnonzero(old_values != new_values).tolist():
+                field_changes.append(
+                    (position, field.index, old_values[position].item(), new_values[position].item()))
+        # Report the changes record by record, with each record's fields in table order.
+        for position, field_index, old_value, new_value in sorted(field_changes):
+            changes.append({
+                "table": new_table.name,
+                "record": int(changed_indexes[position]),
+                "field": new_table.fields[field_index].name,
+                "change": "changed",
+                "old": old_value,
+                "new": new_value
+            })
+    elif len(changed_indexes):
+        # The tables' fields differ, so fall back on comparing whole decoded records by field name.
+        for record_index in changed_indexes.tolist():
+            old_record = old_table.get_record(record_index)
+            for field_name, new_value in new_table.get_record(record_index).items():
+                if old_record.get(field_name) != new_value:
+                    changes.append({
+                        "table": new_table.name,
+                        "record": record_index,
+                        "field": field_name,
+                        "change": "changed",
+                        "old": old_record.get(field_name),
+                        "new": new_value
+                    })
+
+    # Any records past the end of the shorter table were added or removed.
+    for record_index in range(len(old_digests), len(new_digests)):
+        changes.append({"table": new_table.name, "record": record_index, "change": "added"})
+    for record_index in range(len(new_digests), len(old_digests)):
+        changes.append({"table": old_table.name, "record": record_index, "change": "removed"})
+    return changes
+
+def diff_rosters(old_roster_path, new_roster_path):
+    """ Returns a list of change dicts (with the keys in REPORT_FIELD_NAMES) between two roster files. """
+    changes = []
+    with TDBFile(old_roster_path) as old_roster, TDBFile(new_roster_path) as new_roster:
+        for old_table in old_roster.tables:
+            if old_table.name in new_roster.tables_by_name:
+                changes.extend(diff_tables(old_table, new_roster.get_table(old_table.name)))
+            else:
+                changes.append({"table": old_table.name, "change": "removed"})
+        for new_table in new_roster.tables:
+            if new_table.name not in old_roster.tables_by_name:
+                changes.append({"table": new_table.name, "change": "added"})
+    return changes
+
+def write_report(changes, output_path):
+    """ Writes a list of change dicts to a CSV file, or to a JSON file if the path ends in '.json'. """
+    if output_path.lower().endswith(".json"):
+        with open(output_path, "w") as report_file:
+            json.dump(changes, report_file, indent=1)
+        return
+    with open(output_path, "w", newline='') as report_file:
+        report_dict_writer = csv.DictWriter(report_file, REPORT_FIELD_NAMES)
+        report_dict_writer.writeheader()
+        report_dict_writer.writerows(changes)
+
+
+# ----------------------------------------------------- SECTION 4 -----------------------------------------------------
+# -------------------------------------------------- Main Function ----------------------------------------------------
+
+if __name__ == "__main__":
+
+    ROSTER_CHANGES = diff_rosters(OLD_ROSTER_PATH, NEW_ROSTER_PATH)
+    write_report(ROSTER_CHANGES, OUTPUT_PATH)
+    logging.info("Wrote %d changes to %s.", len(ROSTER_CHANGES), OUTPUT_PATH)
@@ -7,14 +7,29 @@ r"""roster_manager.py
 # --------------------------------------------------- SECTION 1 -------------------------------------------------------
 # ---------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS -------------------------------------------
 # 1 - Standard library imports
-import csv, logging, os, sys
-from ctypes import ArgumentError, byref, cast, c_bool, c_wchar, c_wchar_p, c_int, POINTER, Structure, WinDLL
-from datetime import datetime
+import glob, logging, os, sys
+from concurrent.futures import ProcessPoolExecutor
+from ctypes import ArgumentError, byref, cast, c_bool, c_wchar, c_wchar_p, c_int, POINTER, Structure
+try:
+    from ctypes import WinDLL
+except ImportError:
+    # The TDBAccess DLL (and so the "dll" backend) is only available on Windows.
+    WinDLL = None
 from shutil import copyfile
 
 # 2 - Third-party imports
+import numpy as np
 
 # 3 - Application-specific imports
+from .college_resolver import CollegeResolver
+from .pay_tiers import PayTiers, pay_adjustments_path
+from .player_streams import PlayerStreams, player_keys
+from .position_specs import POSITIONS_FOLDER, load_position_specs
+from .roster_manifest import RosterManifest, remove_manifest, row_hashes, source_version
+from .tdb_columns import TDBColumns
+from .tdb_file import TDBFile
+from .tdb_image import TDBImage
+from .team_matcher import TeamMatcher
 
 # 4 - Global settings
 
@@ -46,6 +61,45 @@ class TDBTablePropertiesStruct(Structure):
         self.Name = cast((c_wchar * 8)(), c_wchar_p)
         Structure.__init__(self, *args)
 
+class RosterLookups:
+    """ The colleges, teams, and pay adjustments that the position specs (as "roster") look players' values up in. """
+    
+    # This will be the directory above the directory above the directory this file is in.
+    base_madden_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    
+    def __init__(self, pay_year):
+        # Index colleges_and_ids.csv by the colleges' normalized names (see "college_resolver.py").
+        self.colleges = CollegeResolver.from_csv(os.path.join(
+            RosterLookups.base_madden_path, 
+            "process", "utilities", "colleges_and_ids.csv"))
+        
+        # Compile the nicknames in teams_and_ids.csv into one pattern (see "team_matcher.py").
+        self.teams = TeamMatcher.from_csv(os.path.join(
+            RosterLookups.base_madden_path, 
+            "process", "utilities", "teams_and_ids.csv"))
+        
+        # Read the pay adjustments of the season we are making the roster for into their tiers, just once.
+        self.pay_year = int(pay_year)
+        self.pay_adjustments_path = pay_adjustments_path(self.pay_year)
+        logging.info("Using the %d pay adjustments in %s", self.pay_year, self.pay_adjustments_path)
+        self.pay_tiers = PayTiers.from_csv(self.pay_adjustments_path)
+    
+    def get_team_id(self, team_name):
+        """ Returns the Madden ID corresponding to a given team name. """
+        return self.teams.team_id(team_name)
+    
+    def get_college_id(self, college_name):
+        """ Returns the Madden ID corresponding to a given college name. """
+        return self.colleges.college_id(college_name)
+    
+    def get_salary_adjustment(self, tier):
+        """ Returns the decimal corresponding to the percentage by which to decrease salary for a given tier. """
+        return self.pay_tiers.salary_rate(tier)
+    
+    def get_bonus_adjustment(self, tier):
+        """ Returns the decimal corresponding to the percentage by which to decrease bonus for a given tier. """
+        return self.pay_tiers.bonus_rate(tier)
+
 class RosterManager:
     """ Class that encapsulates all of the properties and methods needed to work on the roster file. """
     
@@ -54,25 +108,116 @@ class RosterManager:
     # Set the base path we will use to keep other paths relative, and shorter :^)
     # This will be the directory above the directory above the directory this file is in.
     base_madden_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    
-    def __init__(self):
+    # The roster file we start from, and the one we create.
+    base_roster_path = os.path.join(base_madden_path, "process", "inputs", "step5", "base.ros")
+    current_roster_path = os.path.join(base_madden_path, "process", "outputs", "step5", "current.ros")
+    # The copy of base.ros the "dll" backend edits, which only replaces current.ros once it has been saved and closed.
+    working_roster_path = current_roster_path + ".tmp"
+    # The ways we can edit the roster file: "dll" copies base.ros to a working file and edits it field by field 
+    # through the TDBAccess DLL; "image" loads base.ros into memory, packs the whole PLAY table in one pass when we 
+    # are done, and writes current.ros with a single write (and works on any OS). Either way, current.ros is only 
+    # replaced (by renaming a finished file over it) at the end of a successful run.
+    backends = ("dll", "image")
+    # The compiled spec of each position (see "position_specs.py"), by the abbreviation used in the 'position' column 
+    # of "Current Player Attributes.csv". These are loaded from the "positions" folder just once, on import.
+    position_specs = load_position_specs()
+    # The number of worker processes create_players computes the players' fields in, and the most players (all at the 
+    # same position) each one is given at a time.
+    compute_workers = os.cpu_count() or 1
+    players_per_chunk = 128
+    
+    def __init__(self, pay_year, backend="dll", incremental=False):
+        
+        # Nothing is open yet (set first, so that __del__ has them even if we fail below).
+        self.db_index = -1
+        self.roster_image = None
+        
+        if backend not in RosterManager.backends:
+            raise ValueError("Unknown RosterManager backend: {0!r}".format(backend))
         
         # Define our instance attributes.
+        self.backend = backend
         self.player_table_properties = TDBTablePropertiesStruct()
+        # Player fields are staged here, as {player index: {field name: value}}, until flush_player_records writes 
+        # them all at once. The fields in each player's dict are the ones that have been set (ie. are dirty).
+        self.player_records = {}
+        # The manifest of the roster we are making (see "roster_manifest.py"), once create_players knows it.
+        self.manifest = None
+        
+        # Load the colleges, teams, and pay adjustments the position specs look things up in.
+        self.lookups = RosterLookups(pay_year)
+        
+        # Hash everything besides the player attributes that goes into the players' records, and, for an incremental 
+        # run, see whether current.ros was made from the same version (in which case we only patch it).
+        self.version = source_version(self.version_source_paths())
+        self.previous_manifest = None
+        if incremental:
+            self.previous_manifest = self.load_previous_manifest()
+        
+        if self.backend == "image":
+            # Load base.ros into memory.
+            self.roster_image = TDBImage(RosterManager.base_roster_path)
+            self.players_table_image = self.roster_image.get_table(RosterManager.players_table)
+            self.player_count = self.players_table_image.record_count
+        else:
+            self.open_dll_roster()
+        
+    def __del__(self):
+        # If we get here before compact_save_close_db has finished (eg. after an error), we close the DB without 
+        # saving it, and drop any roster image, so that current.ros is never replaced by a half-finished roster.
+        if self.db_index > -1:
+            self.close_db_without_saving()
+        self.roster_image = None
+    
+    def version_source_paths(self):
+        """ Returns the paths of all of the files, besides the player attributes CSV, that the players' records use. """
+        # Rather than a list of names to keep up to date, we take every module of ours that has been loaded (which, by 
+        # now, includes everything the position specs run), and every data file in the utilities folder. If none of 
+        # them (nor the pay adjustments, nor base.ros) has changed since current.ros was made, we can patch it.
+        utilities_path = os.path.dirname(os.path.abspath(__file__))
+        data_paths = [
+            data_path for extension in ("json", "csv") 
+            for data_path in glob.glob(os.path.join(utilities_path, "*." + extension))
+        ]
+        return (
+            loaded_module_paths(__package__) + 
+            sorted(data_paths) + 
+            sorted(glob.glob(os.path.join(POSITIONS_FOLDER, "*.json"))) + 
+            [self.lookups.pay_adjustments_path, RosterManager.base_roster_path]
+        )
+    
+    def load_previous_manifest(self):
+        """ Returns the manifest of current.ros if this run can patch it (it was made from our version), or None. """
+        if self.backend != "image":
+            logging.info("Only the image backend can patch current.ros; creating every player.")
+            return None
+        manifest = RosterManifest.load(RosterManager.current_roster_path)
+        if manifest is None or not os.path.exists(RosterManager.current_roster_path):
+            logging.info("current.ros has no manifest; creating every player.")
+            return None
+        if manifest.version != self.version:
+            logging.info("The specs, code, or lookups have changed since current.ros was made; creating every player.")
+            return None
+        # Patching copies the other players' records from current.ros, so it must still be the file we wrote.
+        if not manifest.describes(RosterManager.current_roster_path):
+            logging.warning(
+                "%s has been replaced or edited since its manifest was written; creating every player.", 
+                RosterManager.current_roster_path
+            )
+            return None
+        return manifest
+    
+    def open_dll_roster(self):
+        """ Copies base.ros to our working file and opens the copy through the DLL. """
         
         # Set up our DDL file.
         self.initialize_dll()
         
         # Copy the input file into our destination folder and rename on the way.
-        copyfile(
-            os.path.join(RosterManager.base_madden_path, r"process\inputs\step5\base.ros"), 
-            os.path.join(RosterManager.base_madden_path, r"process\outputs\step5\current.ros")
-        )
+        copyfile(RosterManager.base_roster_path, RosterManager.working_roster_path)
         
         # Open the roster file through the DLL and get its index.
-        self.db_index = self.tdbaccess_dll.TDBOpen(
-            os.path.join(RosterManager.base_madden_path, r"process\outputs\step5\current.ros")
-        )
+        self.db_index = self.tdbaccess_dll.TDBOpen(RosterManager.working_roster_path)
         if self.db_index == -1:
             sys.exit()
         logging.info("self.db_index = %d", self.db_index)
@@ -80,7 +225,7 @@ class RosterManager:
         # Get the number of existing players in the roster file via the getter for the PLAY table's properties.
         self.got_table_properties = self.tdbaccess_dll.TDBTableGetProperties(
             self.db_index, 
-            6, 
+            self.players_table_index, 
             byref(self.player_table_properties)
         )
         
@@ -88,44 +233,15 @@ class RosterManager:
             logging.critical("\tFailed to read properties of PLAY table! Exiting.")
             raise RuntimeError
         
-        # Read colleges_and_ids.csv into a list of dicts.
-        with open(os.path.join(
-                RosterManager.base_madden_path, 
-                r"process\utilities\colleges_and_ids.csv")
-                 ) as colleges_file:
-            # Get a DictReader to read the rows into dicts using the header row as keys.
-            colleges_dict_reader = csv.DictReader(colleges_file)
-            # Pull our records into a list so we can count them and iterate over them as often as needed.
-            self.colleges_list = list(colleges_dict_reader)
-        
-        # Read teams_and_ids.csv into a list of dicts.
-        with open(os.path.join(RosterManager.base_madden_path, r"process\utilities\teams_and_ids.csv")) as teams_file:
-            # Get a DictReader to read the rows into dicts using the header row as keys.
-            teams_dict_reader = csv.DictReader(teams_file)
-            # Pull our records into a list so we can count them and iterate over them as often as needed.
-            self.teams_list = list(teams_dict_reader)
-        
-        # Get the path to the per-year pay helper files specific to this year.
-        time_now = datetime.now()
-        pay_path = RosterManager.base_madden_path + r"\docs\Pay Calculations\{0}".format(time_now.year)
-        
-        # Read this year's pay_adjustments.csv into a list of dicts.
-        with open(os.path.join(pay_path, r"pay_adjustments.csv")) as pay_adjustments_file:
-            # Get a DictReader to read the rows into dicts using the header row as keys.
-            pay_adjustments_dict_reader = csv.DictReader(pay_adjustments_file)
-            # Pull our records into a list so we can count them and iterate over them as often as needed.
-            self.pay_adjustments_list = list(pay_adjustments_dict_reader)
-        
-    def __del__(self):
-        if self.db_index > -1:
-            self.compact_save_close_db()
+        # Until we resize the PLAY table, all of its records are as they were in base.ros.
+        self.unchanged_player_count = self.player_table_properties.RecordCount
     
     def initialize_dll(self):
         """ Gets a handle to the TDBAccess DLL and sets the DLL's functions' arg/restypes. """
         
          # Get a handle for our DLL.
         self.tdbaccess_dll = WinDLL(
-            os.path.join(RosterManager.base_madden_path, r"process\utilities\tdbaccess\new\tdbaccess.dll")
+            os.path.join(RosterManager.base_madden_path, "process", "utilities", "tdbaccess", "new", "tdbaccess.dll")
         )
         
         # Add the argtype and restype definitions here for the DLL functions we'll use.
@@ -161,9 +277,33 @@ class RosterManager:
         
         self.tdbaccess_dll.TDBTableRecordChangeDeleted.argtypes = [c_int, c_wchar_p, c_int, c_bool]
         self.tdbaccess_dll.TDBTableRecordChangeDeleted.restype = c_bool
+        
+        # Resolve the names we pass to those functions into prepared handles, once.
+        self.prepare_player_field_handles()
+    
+    def prepare_player_field_handles(self):
+        """ Converts the PLAY table's name and each of its field names into a c_wchar_p once, for reuse. """
+        
+        # When given a Python string for a c_wchar_p argument, ctypes builds a new c_wchar_p on every call; when 
+        # given a c_wchar_p, it passes it straight through. So we make one for the table and each field up front.
+        self.players_table_handle = c_wchar_p(RosterManager.players_table)
+        # The schema comes from base.ros (usually straight from its schema cache), which also tells us the index of 
+        # the PLAY table for the DLL functions that want one.
+        with TDBFile(RosterManager.base_roster_path) as base_roster:
+            players_table_schema = base_roster.get_table(RosterManager.players_table)
+            self.players_table_index = players_table_schema.index
+            self.player_field_handles = {
+                field.name: c_wchar_p(field.name) for field in players_table_schema.fields
+            }
     
     def size_player_table(self, new_player_count):
-        """ Sizes the PLAY table in the roster file to match the given number of players. """
+        """ Sizes the PLAY table in the roster file to match the given number of players, in a single operation. """
+        
+        if self.backend == "image":
+            logging.info("PLAY table has %d player records; sizing it to %d.", self.player_count, new_player_count)
+            self.roster_image.resize_table(RosterManager.players_table, new_player_count)
+            self.player_count = new_player_count
+            return
         
         logging.info(
             "self.player_table_properties.Name = %s", 
@@ -194,45 +334,56 @@ class RosterManager:
         existing_player_count = self.player_table_properties.RecordCount - self.player_table_properties.DeletedCount
         logging.info("existing_player_count = %d", existing_player_count)
         
-        # If we have fewer new players than existing players, delete the excess. If more, create records for them.
-        if new_player_count < existing_player_count:
-            self.delete_players(existing_player_count - new_player_count)
-        elif new_player_count > existing_player_count:
-            self.add_players(new_player_count - existing_player_count)
-    
-    def delete_players(self, number_to_delete):
-        """ Marks the given number of player records (from the end of the PLAY table) for deletion. """
-        
-        logging.info("Deleting %d player records.", number_to_delete)
-        for index in range(
-                self.player_table_properties.RecordCount - number_to_delete, 
-                self.player_table_properties.RecordCount):
-            record_was_marked_deleted = self.tdbaccess_dll.TDBTableRecordChangeDeleted(
-                self.db_index, 
-                RosterManager.players_table, 
-                index, 
-                True
-            )
-            if not record_was_marked_deleted:
-                logging.error("\tFailed to mark record #%d for deletion!", index)
+        if new_player_count != existing_player_count:
+            self.resize_working_roster(new_player_count)
     
-    def add_players(self, number_to_add):
-        """ Adds the given number of player records to the end of the PLAY table. """
-        
-        logging.info("Adding %d player records.", number_to_add)
-        for index in range(number_to_add):
-            added_player_record = self.tdbaccess_dll.TDBTableRecordAdd(
-                self.db_index, 
-                RosterManager.players_table,
-                False
-            )
-            if added_player_record == 65535:
-                logging.error("\tFailed to add record #%d!", index)
-        self.tdbaccess_dll.TDBTableGetProperties(self.db_index, 6, byref(self.player_table_properties))
+    def resize_working_roster(self, new_player_count):
+        """ Resizes the PLAY table of our working file in one step, outside of the DLL, then reopens it. """
+        
+        # The DLL can only add a record, or mark one deleted, per call. So instead we close our working file, resize 
+        # its PLAY table all at once as a TDBImage (which marks the whole range of records past the new count dropped, 
+        # or the whole range up to it live), and reopen it.
+        closed_database = self.tdbaccess_dll.TDBClose(self.db_index)
+        if not closed_database:
+            logging.critical("\tFailed to close the TDBDatabase to resize the PLAY table! Exiting.")
+            raise RuntimeError
+        self.db_index = -1
+        
+        # (The working file is only temporary, so we don't leave a schema cache for it next to it.)
+        working_roster_image = TDBImage(RosterManager.working_roster_path, use_schema_cache=False)
+        # Records cut off by a shrink come back blank if we grow again, so they no longer match base.ros.
+        self.unchanged_player_count = min(
+            self.unchanged_player_count, 
+            working_roster_image.get_table(RosterManager.players_table).record_count, 
+            new_player_count
+        )
+        working_roster_image.resize_table(RosterManager.players_table, new_player_count)
+        working_roster_image.save(RosterManager.working_roster_path)
+        working_roster_image.close()
+        
+        # Reopen the resized file and read the PLAY table's properties just once.
+        self.db_index = self.tdbaccess_dll.TDBOpen(RosterManager.working_roster_path)
+        if self.db_index == -1:
+            sys.exit()
+        self.got_table_properties = self.tdbaccess_dll.TDBTableGetProperties(
+            self.db_index, 
+            self.players_table_index, 
+            byref(self.player_table_properties)
+        )
+        if not self.got_table_properties:
+            logging.critical("\tFailed to read properties of PLAY table! Exiting.")
+            raise RuntimeError
         logging.info("PLAY table now has %d player records.", self.player_table_properties.RecordCount)
     
     def compact_save_close_db(self):
-        """ Compacts, saves, and closes the DB via the self.tdbaccess_dll. """
+        """ Compacts, saves, and closes the DB via the self.tdbaccess_dll (or via our roster image). """
+        
+        # Write all of the staged player fields first.
+        self.flush_player_records()
+        
+        if self.backend == "image":
+            self.save_roster_image()
+            return
         
         # Compact the DB.
         compacted_database = self.tdbaccess_dll.TDBDatabaseCompact(self.db_index)
@@ -254,103 +405,232 @@ class RosterManager:
             # Invalidate our db_index so we don't try to do this again (if python calls __del__).
             self.db_index = -1
             logging.info("Closed the TDBDatabase.")
+        else:
+            logging.critical(
+                "\tFailed to close the TDBDatabase! %s was left as it was. Exiting.", 
+                RosterManager.current_roster_path
+            )
+            raise RuntimeError
+        
+        # If the save failed, the working file is incomplete, so we remove it (as close_db_without_saving does) and 
+        # fail, rather than let the run look like it succeeded.
+        if not saved_database:
+            os.remove(RosterManager.working_roster_path)
+            logging.critical(
+                "\tThe TDBDatabase was not saved; %s was left as it was. Exiting.", 
+                RosterManager.current_roster_path
+            )
+            raise RuntimeError
+        
+        # Only now that it is complete does the working file become current.ros. (The DLL doesn't record a manifest, 
+        # so the next incremental run will create every player.)
+        remove_manifest(RosterManager.current_roster_path)
+        os.replace(RosterManager.working_roster_path, RosterManager.current_roster_path)
+        logging.info("Replaced %s with the saved roster.", RosterManager.current_roster_path)
+    
+    def close_db_without_saving(self):
+        """ Closes the DB via the self.tdbaccess_dll without saving it, and removes our working file. """
+        
+        closed_database = self.tdbaccess_dll.TDBClose(self.db_index)
+        if closed_database:
+            self.db_index = -1
+            logging.info(
+                "Closed the TDBDatabase without saving; %s was left as it was.", 
+                RosterManager.current_roster_path
+            )
+            os.remove(RosterManager.working_roster_path)
         else:
             logging.error("\tFailed to close the TDBDatabase!")
     
-    def set_player_integer_field(self, field_name, player_index, field_int_value):
-        """ Sets a given field on a given player's record to a given integer value. """
-        value_was_set_as_int = self.tdbaccess_dll.TDBFieldSetValueAsInteger(
-            self.db_index, RosterManager.players_table, field_name, player_index, field_int_value)
-        if not value_was_set_as_int:
-            logging.error("\tFailed in setting player %d's %s field as integer!", player_index, field_name)
-    
-    def set_player_string_field(self, field_name, player_index, field_str_value):
-        """ Sets a given field on a given player's record to a given string value. """
-        value_was_set_as_string = self.tdbaccess_dll.TDBFieldSetValueAsString(
-            self.db_index, RosterManager.players_table, field_name, player_index, field_str_value)
-        if not value_was_set_as_string:
-            logging.error("\tFailed in setting player %d's %s field as string!", player_index, field_name)
-    
-    def get_team_id(self, team_name):
-        """ Returns the Madden ID corresponding to a given team name. """
-        # Use the generator expression 'next' to get the team with the given name, or None if not found.
-        team_dict = next((team for team in self.teams_list if team["name"].upper() in team_name.upper()), None)
-        if team_dict is not None:
-            return int(team_dict["id"])
-        return 1023
-    
-    def get_college_id(self, college_name):
-        """ Returns the Madden ID corresponding to a given college name. """
-        # Use the generator expression 'next' to get the college with the given name, or None if not found.
-        college_dict = next(
-            (college for college in self.colleges_list if college["name"].upper() == college_name.upper()), 
-            None
-        )
-        if college_dict is not None:
-            return int(college_dict["id"])
-        return 265
+    def save_roster_image(self):
+        """ Writes our roster image, with its CRCs updated, to current.ros with a single write (and a rename). """
+        
+        # Drop the old manifest first, so it can never be left next to a roster it doesn't describe.
+        remove_manifest(RosterManager.current_roster_path)
+        self.roster_image.save(RosterManager.current_roster_path)
+        logging.info("Saved %d player records to %s.", self.player_count, RosterManager.current_roster_path)
+        if self.manifest is not None:
+            self.manifest.save(RosterManager.current_roster_path)
+        
+        # Let go of the image so we don't try to do this again (if python calls __del__).
+        self.roster_image.close()
+        self.roster_image = None
     
-    def get_salary_adjustment(self, tier):
-        """ Returns the decimal corresponding to the percentage by which to decrease salary for a given tier. """
-        # Use the generator expression 'next' to get the SALARY row, or None if not found.
-        tier_dict = next(
-            (pay_type for pay_type in self.pay_adjustments_list if pay_type["type"].upper() == "SALARY"), 
-            None
-        )
-        if tier_dict is not None:
-            return float(tier_dict[tier])
-        return 0.0
+    def flush_player_records(self):
+        """ Writes all of the staged player fields to the roster at once, then logs any failures in a single report. """
+        
+        if self.backend == "image":
+            # Pack every player record into the image's PLAY table in one pass.
+            player_records = [self.player_records.get(index, {}) for index in range(self.player_count)]
+            failed_fields = self.roster_image.pack_records(RosterManager.players_table, player_records)
+        else:
+            failed_fields = self.write_player_records_through_dll()
+        
+        logging.info("Wrote the staged fields of %d player records.", len(self.player_records))
+        self.player_records = {}
+        if failed_fields:
+            logging.error(
+                "\tFailed in setting %d player fields:\n\t\t%s", 
+                len(failed_fields), 
+                "\n\t\t".join(failed_fields)
+            )
     
-    def get_bonus_adjustment(self, tier):
-        """ Returns the decimal corresponding to the percentage by which to decrease bonus for a given tier. """
-        # Use the generator expression 'next' to get the BONUS row, or None if not found.
-        tier_dict = next(
-            (pay_type for pay_type in self.pay_adjustments_list if pay_type["type"].upper() == "BONUS"), 
-            None
+    def write_player_records_through_dll(self):
+        """ Sets each staged player field through the DLL, skipping any whose value is unchanged from base.ros. """
+        
+        # Read the PLAY table of base.ros, so we can tell which staged values would not change anything.
+        with TDBFile(RosterManager.base_roster_path) as base_roster:
+            base_players = TDBColumns(base_roster.get_table(RosterManager.players_table))
+        base_values = {}
+        
+        failed_fields = []
+        unchanged_field_count = 0
+        for player_index in sorted(self.player_records):
+            for field_name, value in self.player_records[player_index].items():
+                
+                # Records past the ones still as they were in base.ros were added by us, so always need writing.
+                if player_index < self.unchanged_player_count and field_name in base_players:
+                    if field_name not in base_values:
+                        base_values[field_name] = base_players[field_name].tolist()
+                    if base_values[field_name][player_index] == value:
+                        unchanged_field_count += 1
+                        continue
+                
+                # Pass our prepared handles rather than the names. (An unknown field name will just fail below.)
+                field_handle = self.player_field_handles.get(field_name, field_name)
+                if isinstance(value, str):
+                    value_was_set = self.tdbaccess_dll.TDBFieldSetValueAsString(
+                        self.db_index, self.players_table_handle, field_handle, player_index, value)
+                    if not value_was_set:
+                        failed_fields.append("Player {0}'s {1} field as string".format(player_index, field_name))
+                else:
+                    value_was_set = self.tdbaccess_dll.TDBFieldSetValueAsInteger(
+                        self.db_index, self.players_table_handle, field_handle, player_index, value)
+                    if not value_was_set:
+                        failed_fields.append("Player {0}'s {1} field as integer".format(player_index, field_name))
+        
+        logging.info("Skipped %d player fields that were unchanged from base.ros.", unchanged_field_count)
+        return failed_fields
+    
+    def create_player(self, player_dict, index, run_seed, key):
+        """ Stages all of the fields of the given player's record, as worked out by the spec for his position. """
+        # The key must be his one from player_keys (numbered, if others share his identity), the same one
+        # create_players would give him, so he gets the same stream, and so the same record, either way.
+        position_spec = RosterManager.position_specs[player_dict["position"].upper()]
+        streams = PlayerStreams(run_seed, [key], position_spec.distribution_count)
+        self.set_player_fields(index, position_spec.evaluate(self.lookups, player_dict, index, streams))
+    
+    def create_players(self, player_attributes, run_seed=None):
+        """ Works out every player's fields in a pool of worker processes, then stages them all, in index order. """
+        
+        # Every player's random picks come from his own stream, keyed by the run seed and who he is (see 
+        # "player_streams.py"), so they are the same however the players are split up. Log the seed, so the run can
+        # be repeated. (When patching current.ros, we carry on with the seed it was made with.)
+        if run_seed is None:
+            if self.previous_manifest is not None:
+                run_seed = self.previous_manifest.run_seed
+            else:
+                run_seed = np.random.SeedSequence().entropy
+        logging.info("Creating the players with run seed %d.", run_seed)
+        keys = player_keys(player_attributes)
+        
+        # Record what this roster is made from, and work out which players we need to create: all of them, or, when 
+        # patching current.ros, only the ones whose rows (or record indexes) have changed, and any new ones.
+        player_hashes = row_hashes(player_attributes, keys)
+        self.manifest = RosterManifest(self.version, run_seed, player_hashes)
+        if self.previous_manifest is not None and self.previous_manifest.run_seed == run_seed:
+            creating = self.previous_manifest.changed_indexes(player_hashes)
+            logging.info(
+                "Patching current.ros: creating %d of the %d players; the rest are unchanged.", 
+                creating.sum(), 
+                len(creating)
+            )
+        else:
+            creating = np.ones(len(player_attributes), dtype=bool)
+        
+        # Sum up, just once, the colleges and teams of the players we are creating that we couldn't find (or only 
+        # nearly could, or found more than one of).
+        for column_name, lookup in (("college", self.lookups.colleges), ("team", self.lookups.teams)):
+            if column_name in player_attributes:
+                lookup_summary = lookup.summary(player_attributes[column_name][creating])
+                if lookup_summary is not None:
+                    logging.warning(lookup_summary)
+        
+        # Split each position's players into chunks, taking the positions in the order each first appears.
+        positions = np.char.upper(player_attributes["position"])
+        chunks = []
+        for position in dict.fromkeys(positions.tolist()):
+            indexes = np.flatnonzero(positions == position)
+            if position not in RosterManager.position_specs:
+                for index in indexes:
+                    logging.error("Player %d's position was not recognized: %s", index, position)
+                continue
+            indexes = indexes[creating[indexes]]
+            for start in range(0, len(indexes), RosterManager.players_per_chunk):
+                chunks.append((position, indexes[start:start + RosterManager.players_per_chunk]))
+        
+        chunk_arguments = (
+            [self.lookups] * len(chunks),
+            [position for position, _ in chunks],
+            [player_attributes.take(indexes) for _, indexes in chunks],
+            [indexes for _, indexes in chunks],
+            [run_seed] * len(chunks),
+            [[keys[index] for index in indexes] for _, indexes in chunks]
         )
-        if tier_dict is not None:
-            return float(tier_dict[tier])
-        return 0.0
-    
-    from ._quarterback import create_quarterback
-    
-    from ._halfback import create_halfback
-    
-    from ._fullback import create_fullback
-    
-    from ._wide_receiver import create_wide_receiver
-    
-    from ._tight_end import create_tight_end
-    
-    from ._left_tackle import create_left_tackle
-    
-    from ._left_guard import create_left_guard
-    
-    from ._center import create_center
-    
-    from ._right_guard import create_right_guard
-    
-    from ._right_tackle import create_right_tackle
-    
-    from ._left_end import create_left_end
-    
-    from ._right_end import create_right_end
-    
-    from ._defensive_tackle import create_defensive_tackle
-    
-    from ._left_outside_linebacker import create_left_outside_linebacker
-    
-    from ._middle_linebacker import create_middle_linebacker
-    
-    from ._right_outside_linebacker import create_right_outside_linebacker
-    
-    from ._cornerback import create_cornerback
-    
-    from ._free_safety import create_free_safety
-    
-    from ._strong_safety import create_strong_safety
-    
-    from ._kicker import create_kicker
+        
+        # Compute the chunks' records in parallel (or, with just one worker, right here).
+        worker_count = min(len(chunks), RosterManager.compute_workers)
+        if worker_count > 1:
+            with ProcessPoolExecutor(max_workers=worker_count) as executor:
+                chunk_records = list(executor.map(compute_player_records, *chunk_arguments))
+        else:
+            chunk_records = list(map(compute_player_records, *chunk_arguments))
+        
+        # When patching, copy the finished records of the players we aren't creating from current.ros, so that the 
+        # rest of the roster is just as a full run would leave it.
+        if self.previous_manifest is not None:
+            with TDBFile(RosterManager.current_roster_path) as current_roster:
+                self.roster_image.copy_records(
+                    RosterManager.players_table, 
+                    current_roster.get_table(RosterManager.players_table), 
+                    np.flatnonzero(~creating).tolist()
+                )
+        
+        # Stage the records in index order, as the single writer of the roster.
+        player_records = {}
+        for indexes, field_names, value_rows in chunk_records:
+            for index, values in zip(indexes, value_rows):
+                player_records[index] = dict(zip(field_names, values))
+        for index in sorted(player_records):
+            self.set_player_fields(index, player_records[index])
+    
+    def set_player_fields(self, player_index, field_values):
+        """ Stages a dict of {field name: value} for a given player's record, to be written by flush_player_records. """
+        self.player_records.setdefault(player_index, {}).update(field_values)
     
-    from ._punter import create_punter
+    def set_player_integer_field(self, field_name, player_index, field_int_value):
+        """ Sets a given field on a given player's record to a given integer value. """
+        self.player_records.setdefault(player_index, {})[field_name] = field_int_value
     
+    def set_player_string_field(self, field_name, player_index, field_str_value):
+        """ Sets a given field on a given player's record to a given string value. """
+        self.player_records.setdefault(player_index, {})[field_name] = field_str_value
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def loaded_module_paths(package_name):
+    """ Returns the paths of the source files of all of a package's modules that have been imported, by module name. """
+    package_prefix = package_name + "."
+    return [
+        module.__file__ for module_name, module in sorted(sys.modules.copy().items()) 
+        if module_name.startswith(package_prefix) and getattr(module, "__file__", None)
+    ]
+
+def compute_player_records(lookups, position, players, indexes, run_seed, keys):
+    """ Works out the fields of a chunk of players at one position; returns their indexes, field names, and values. """
+    position_spec = RosterManager.position_specs[position]
+    streams = PlayerStreams(run_seed, keys, position_spec.distribution_count)
+    field_columns = position_spec.evaluate_player_columns(lookups, players, indexes, streams)
+    return indexes.tolist(), list(field_columns), list(zip(*field_columns.values()))
@@ -0,0 +1,161 @@
+r"""roster_manifest.py
+
+    This module contains the RosterManifest class, which records what went into a roster file made by step 5, in a JSON
+    file next to it (eg. "[BASE_MADDEN_PATH]\process\outputs\step5\current.ros.manifest.json"):
+        1) A hash of the version of everything that decides what a player's record holds, other than his own row of
+            "Current Player Attributes.csv": the position specs, the code that runs them, the lookup CSV files, and
+            base.ros (see source_version).
+        2) The run seed his random picks were made with (see "player_streams.py").
+        3) A hash of each player's row, along with his record index and identity, in record order (see row_hashes).
+        4) A hash (and the size) of the roster file itself, as step 5 wrote it (see roster_digest).
+
+    When step 5 runs again with the same version and seed, only the players whose hashes changed (or who are new) need
+    to be created again, and patched into the existing roster; see RosterManager.create_players. That is only done if
+    the roster file is still the one the manifest describes: if it has been replaced (eg. by a restored backup) or
+    edited (eg. in a roster editor) since, its other players' records can't be trusted, so every player is created.
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import hashlib, json, logging, os
+
+
+# 1.2 - Third-party imports
+
+import numpy as np
+
+
+# 1.3 - Application-specific imports
+
+
+# 1.4 - Global settings
+
+
+# 1.5 - Global constants
+
+# The suffix added to a roster file's path to get its manifest's path.
+MANIFEST_SUFFIX = ".manifest.json"
+
+# The suffix added to a manifest's path to get the temporary file we write before replacing it.
+TEMP_FILE_SUFFIX = ".tmp"
+
+# Goes between the cells of a row when we hash it, since it can't appear in a cell.
+CELL_SEPARATOR = "\x1f"
+
+# The number of bytes of a roster file we hash at a time.
+READ_BLOCK_SIZE = 1 << 20
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+class RosterManifest:
+    """ The version, run seed, and player row hashes a roster file was made from, and the hash of the file itself. """
+
+    def __init__(self, version, run_seed, player_hashes, roster_hash=None, roster_size=None):
+        self.version = version
+        self.run_seed = run_seed
+        self.player_hashes = player_hashes
+        # These are set by save, from the roster file it goes with.
+        self.roster_hash = roster_hash
+        self.roster_size = roster_size
+
+    def __repr__(self):
+        return "RosterManifest(version={0!r}, run_seed={1}, players={2})".format(
+            self.version, self.run_seed, len(self.player_hashes))
+
+    @classmethod
+    def load(cls, roster_path):
+        """ Reads the manifest of a roster file; returns None if it has none (or it can't be read). """
+        try:
+            with open(roster_path + MANIFEST_SUFFIX) as manifest_file:
+                manifest = json.load(manifest_file)
+            return cls(
+                manifest["version"], manifest["run_seed"], manifest["player_hashes"], 
+                manifest.get("roster_hash"), manifest.get("roster_size")
+            )
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as error:
+            logging.warning("Ignoring the unreadable manifest of %s: %s", roster_path, error)
+            return None
+
+    def save(self, roster_path):
+        """ Writes the manifest of a just-written roster file, and its hash, atomically (via a temporary file). """
+        self.roster_hash, self.roster_size = roster_digest(roster_path)
+        manifest_path = roster_path + MANIFEST_SUFFIX
+        temp_path = manifest_path + TEMP_FILE_SUFFIX
+        try:
+            with open(temp_path, "w") as manifest_file:
+                json.dump(
+                    {
+                        "version": self.version, "run_seed": self.run_seed, "roster_hash": self.roster_hash, 
+                        "roster_size": self.roster_size, "player_hashes": self.player_hashes
+                    },
+                    manifest_file,
+                    indent=1
+                )
+            os.replace(temp_path, manifest_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def describes(self, roster_path):
+        """ Returns whether a roster file is still exactly the one this manifest was saved with. """
+        if self.roster_hash is None or self.roster_size is None:
+            return False
+        # Check the size first, which is cheap, and only hash the file if it matches.
+        return (os.path.getsize(roster_path) == self.roster_size 
+                and roster_digest(roster_path) == (self.roster_hash, self.roster_size))
+
+    def changed_indexes(self, player_hashes):
+        """ Returns a boolean array that is True for each player whose hash differs from ours (or who is new). """
+        old_hashes = self.player_hashes[:len(player_hashes)]
+        changed = np.ones(len(player_hashes), dtype=bool)
+        changed[:len(old_hashes)] = np.array(player_hashes[:len(old_hashes)]) != np.array(old_hashes)
+        return changed
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def remove_manifest(roster_path):
+    """ Removes the manifest of a roster file, if it has one (eg. before the roster is replaced). """
+    if os.path.exists(roster_path + MANIFEST_SUFFIX):
+        os.remove(roster_path + MANIFEST_SUFFIX)
+
+def source_version(source_paths):
+    """ Returns a hash of the contents of the given files (in the given order). """
+    version_hash = hashlib.blake2b(digest_size=16)
+    for source_path in source_paths:
+        with open(source_path, "rb") as source_file:
+            version_hash.update(hashlib.blake2b(source_file.read(), digest_size=16).digest())
+    return version_hash.hexdigest()
+
+def roster_digest(roster_path):
+    """ Returns the blake2b hash of a roster file's bytes, and its size. """
+    roster_hash = hashlib.blake2b(digest_size=16)
+    roster_size = 0
+    with open(roster_path, "rb") as roster_file:
+        for block in iter(lambda: roster_file.read(READ_BLOCK_SIZE), b""):
+            roster_hash.update(block)
+            roster_size += len(block)
+    return roster_hash.hexdigest(), roster_size
+
+def row_hashes(player_attributes, keys):
+    """ Returns a hash of each player's row in a PlayerAttributes, along with his record index and identity key. """
+    columns = []
+    for column_name in player_attributes.column_names:
+        column = player_attributes[column_name]
+        if isinstance(column, np.ma.MaskedArray):
+            # Empty cells hash as empty, rather than as the 0 the loader filled them with.
+            column = np.where(np.ma.getmaskarray(column), "", column.data.astype(str))
+        columns.append(column.tolist())
+    return [
+        hashlib.blake2b(
+            CELL_SEPARATOR.join([str(index), key] + list(cells)).encode("utf-8"), digest_size=16).hexdigest()
+        for index, (key, cells) in enumerate(zip(keys, zip(*columns)))
+    ]
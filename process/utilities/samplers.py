@@ -0,0 +1,157 @@
+r"""samplers.py
+
+    This module contains the AliasSampler class, which makes weighted random picks from one distribution (a list of
+    values, and a weight for each) in constant time per pick, using Vose's alias method: the weights are turned once,
+    up front, into a table with one column per value, holding the chance of keeping that value and the value (its
+    "alias") to take otherwise. A pick then needs just one number in [0, 1): its whole part (times the number of
+    values) chooses the column, and what is left over decides between the column's value and its alias.
+
+    Building a table takes longer than one pick, so samplers are cached: sampler_for returns the same AliasSampler for
+    every distribution with the same values and chances (found by a hash of its contents; see distribution_hash, so
+    weights of [1, 3] and [25, 75] share one), however many position specs (or calls) use it. The specs build their
+    samplers once, when they are compiled (see "position_specs.py" and "distributions.py").
+
+    Each sampler can also make a whole block of picks at once, with a single NumPy call for each step:
+    sample(content_hash, count, generator) draws count values (eg. the PSBS of every WR) from a NumPy Generator, and
+    AliasSampler.picks does the same with numbers already drawn (eg. one from each player's own stream, as the batch
+    position specs do). sample finds its sampler by the distribution's content hash, which is the same in every process
+    (eg. step 5's workers), as long as that process has built the sampler too. Each sampler also has a sampler_id (its
+    place in SAMPLERS), but that only numbers the samplers in the order one process happened to build them, so it means
+    nothing to any other process.
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import hashlib
+
+
+# 1.2 - Third-party imports
+
+import numpy as np
+
+
+# 1.3 - Application-specific imports
+
+
+# 1.4 - Global settings
+
+
+# 1.5 - Global constants
+
+# Every sampler built so far: by the values and weights it was asked for with, by its distribution's content hash, and
+# in the order built in this process (by sampler ID).
+SAMPLER_CACHE = {}
+SAMPLERS_BY_HASH = {}
+SAMPLERS = []
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+class AliasSampler:
+    """ Makes weighted random picks from one distribution, in constant time per pick. """
+
+    def __init__(self, values, weights, sampler_id=None):
+        weights = np.asarray(weights, dtype=float)
+        if len(values) != len(weights):
+            raise ValueError("{0} values but {1} weights".format(len(values), len(weights)))
+        if len(weights) == 0 or (weights < 0).any() or not weights.sum() > 0:
+            raise ValueError("The weights must be non-negative, with a positive total.")
+        # Its place in SAMPLERS, in this process only; see sample for an ID that other processes can use.
+        self.sampler_id = sampler_id
+        self.content_hash = distribution_hash(values, weights)
+        self.size = len(weights)
+        self.values = np.array(values)
+        self.probabilities = weights / weights.sum()
+        self.keep_chances, self.aliases = build_alias_table(self.probabilities)
+        # Lists of the same, since indexing a list is much faster than indexing an array for a single pick.
+        self.value_list = self.values.tolist()
+        self.keep_chance_list = self.keep_chances.tolist()
+        self.alias_list = self.aliases.tolist()
+
+    def __repr__(self):
+        return "AliasSampler(sampler_id={0}, values={1})".format(self.sampler_id, self.size)
+
+    def pick_index(self, uniform):
+        """ Turns one number in [0, 1) into the index of a weighted pick. """
+        scaled = uniform * self.size
+        column = min(int(scaled), self.size - 1)
+        if scaled - column < self.keep_chance_list[column]:
+            return column
+        return self.alias_list[column]
+
+    def pick(self, uniform):
+        """ Turns one number in [0, 1) into a weighted pick of one of the values. """
+        return self.value_list[self.pick_index(uniform)]
+
+    def pick_indexes(self, uniforms):
+        """ Turns an array of numbers in [0, 1) into the indexes of as many weighted picks. """
+        scaled = np.asarray(uniforms) * self.size
+        columns = np.minimum(scaled.astype(np.int64), self.size - 1)
+        return np.where(scaled - columns < self.keep_chances[columns], columns, self.aliases[columns])
+
+    def picks(self, uniforms):
+        """ Turns an array of numbers in [0, 1) into an array of as many weighted picks of the values. """
+        return self.values[self.pick_indexes(uniforms)]
+
+    def sample(self, count, generator):
+        """ Returns an array of count weighted picks of the values, using numbers from a NumPy Generator. """
+        return self.picks(generator.random(count))
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def build_alias_table(probabilities):
+    """ Returns the keep chance and alias of each column of the alias table for some probabilities (which sum to 1). """
+    size = len(probabilities)
+    scaled = (probabilities * size).tolist()
+    keep_chances = [1.0] * size
+    aliases = list(range(size))
+    small = [column for column, chance in enumerate(scaled) if chance < 1.0]
+    large = [column for column, chance in enumerate(scaled) if chance >= 1.0]
+    while small and large:
+        small_column, large_column = small.pop(), large.pop()
+        # The small column keeps its own value with its chance, and gives the rest of its space to the large one.
+        keep_chances[small_column] = scaled[small_column]
+        aliases[small_column] = large_column
+        scaled[large_column] -= 1.0 - scaled[small_column]
+        if scaled[large_column] < 1.0:
+            small.append(large_column)
+        else:
+            large.append(large_column)
+    # Whatever is left over (only off from 1 by rounding) always keeps its own value.
+    return np.array(keep_chances), np.array(aliases, dtype=np.int64)
+
+def distribution_hash(values, weights):
+    """ Returns a hash of a distribution's values and the chance of each (its weights divided by their total). """
+    weights = np.asarray(weights, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        probabilities = weights / weights.sum()
+    content_hash = hashlib.blake2b(repr(list(values)).encode("utf-8"), digest_size=16)
+    content_hash.update(probabilities.tobytes())
+    return content_hash.hexdigest()
+
+def sampler_for(values, weights):
+    """ Returns the (cached) AliasSampler for a distribution, building it the first time it is asked for. """
+    cache_key = (tuple(values), tuple(weights))
+    sampler = SAMPLER_CACHE.get(cache_key)
+    if sampler is None:
+        content_hash = distribution_hash(values, weights)
+        sampler = SAMPLERS_BY_HASH.get(content_hash)
+        if sampler is None:
+            sampler = SAMPLERS_BY_HASH[content_hash] = AliasSampler(values, weights, len(SAMPLERS))
+            SAMPLERS.append(sampler)
+        SAMPLER_CACHE[cache_key] = sampler
+    return sampler
+
+def sample(content_hash, count, generator):
+    """ Returns an array of count weighted picks from the distribution with the given hash, using a NumPy Generator. """
+    sampler = SAMPLERS_BY_HASH.get(content_hash)
+    if sampler is None:
+        raise ValueError("No sampler has been built (with sampler_for) in this process for distribution {0}".format(
+            content_hash))
+    return sampler.sample(count, generator)
@@ -0,0 +1,128 @@
+r"""tdb_columns.py
+
+    This module contains the TDBColumns class, a columnar view of one table of a TDB file (eg. the "PLAY" table of a
+    .ros roster file), built on the reader in "tdb_file.py". Each field is decoded for every record at once, with
+    vectorized bit-unpacking in NumPy, into an array with one element per record. That turns questions about the whole
+    roster into single array expressions instead of Python loops over per-player dicts. For example:
+
+        with TDBFile(path) as roster_file:
+            players = TDBColumns(roster_file.get_table("PLAY"))
+        fast_players = players["PSPD"] > 90
+        average_povr_by_position = (
+            np.bincount(players["PPOS"], weights=players["POVR"]) / np.bincount(players["PPOS"]))
+
+    Integer fields come back as int64 arrays (so signed fields and arithmetic both just work), floats as float32, and
+    strings as unicode arrays. Columns are decoded the first time they are asked for and cached after that.
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+
+# 1.2 - Third-party imports
+
+import numpy as np
+
+
+# 1.3 - Application-specific imports
+
+# This module is used both from the utilities package (by roster_manager.py) and from scripts run inside the utilities
+# folder (like dump_roster_to_csv.py), so allow for either.
+try:
+    from .tdb_file import TDB_BINARY, TDB_FLOAT, TDB_SINT, TDB_STRING, TDB_STRING_ENCODING
+except ImportError:
+    from tdb_file import TDB_BINARY, TDB_FLOAT, TDB_SINT, TDB_STRING, TDB_STRING_ENCODING
+
+
+# 1.4 - Global settings
+
+
+# 1.5 - Global constants
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+class TDBColumns:
+    """ A columnar view of a TDB table: one NumPy array per field, with one element per record. """
+
+    def __init__(self, table):
+        self.table = table
+        self.fields = table.fields
+        self.field_names = [field.name for field in table.fields]
+        self.record_count = table.record_count
+        # Take one copy of the table's records as a 2-D array of bytes (one row per record), so that the columns stay
+        # usable after the file they came from is closed.
+        self.records = np.frombuffer(table.records_view(), dtype=np.uint8).reshape(
+            self.record_count, table.record_bytes).copy()
+        self.columns = {}
+
+    def __repr__(self):
+        return "TDBColumns({0!r}, records={1}, decoded={2})".format(
+            self.table.name, self.record_count, len(self.columns))
+
+    def __len__(self):
+        return self.record_count
+
+    def __contains__(self, field_name):
+        return field_name in self.table.fields_by_name
+
+    def __getitem__(self, field_name):
+        return self.column(field_name)
+
+    def keys(self):
+        """ Returns the names of the table's fields, in order. """
+        return list(self.field_names)
+
+    def column(self, field):
+        """ Returns the array of values of a given field (by name or TDBField) for every record. """
+        field = self.table.get_field(field)
+        if field.name not in self.columns:
+            self.columns[field.name] = decode_column(self.records, field)
+        return self.columns[field.name]
+
+    def as_dict(self, field_names=None):
+        """ Returns a dict of {field name: array} for the given fields (or for all of them). """
+        if field_names is None:
+            field_names = self.field_names
+        return {field_name: self.column(field_name) for field_name in field_names}
+
+    def iter_rows(self, field_names=None):
+        """ Yields a tuple of plain Python values for each record, one per field, in the order given. """
+        if field_names is None:
+            field_names = self.field_names
+        return zip(*(self.column(field_name).tolist() for field_name in field_names))
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def decode_column(records, field):
+    """ Decodes one field out of a 2-D array of raw records (one row per record), for every record at once. """
+    field_bytes = records[:, field.byte_offset:field.byte_offset + field.byte_count]
+
+    if field.field_type in (TDB_STRING, TDB_BINARY):
+        # These are byte-aligned, so we can just reinterpret each record's slice as a fixed-size bytes value.
+        size = field.bits // 8
+        if field.field_type == TDB_BINARY:
+            return np.ascontiguousarray(field_bytes[:, :size]).view('V{0}'.format(size)).reshape(len(records))
+        # Strings end at their first null; the game leaves old characters behind it, so blank out everything after.
+        string_bytes = field_bytes[:, :size].copy()
+        string_bytes[np.cumsum(string_bytes == 0, axis=1) > 0] = 0
+        return np.char.decode(string_bytes.view('S{0}'.format(size)).reshape(len(records)), TDB_STRING_ENCODING)
+
+    # Assemble the bytes spanning the field into one little-endian integer per record, then shift and mask.
+    values = np.zeros(len(records), dtype=np.uint64)
+    for byte_index in range(field.byte_count):
+        values |= field_bytes[:, byte_index].astype(np.uint64) << np.uint64(8 * byte_index)
+    values = (values >> np.uint64(field.shift)) & np.uint64(field.mask)
+
+    if field.field_type == TDB_FLOAT:
+        return values.astype(np.uint32).view(np.float32)
+    values = values.astype(np.int64)
+    if field.field_type == TDB_SINT:
+        # Signed integers are stored in two's complement using the field's full bit count.
+        values[values >> (field.bits - 1) != 0] -= 1 << field.bits
+    return values
@@ -0,0 +1,359 @@
+r"""tdb_file.py
+
+    This module contains a pure-Python reader for the TDB databases that Madden NFL '08 uses for its roster files, like
+    "base.ros" and "current.ros". It gives us the same information the TDBAccess DLL does through the functions
+    TDBTableGetProperties, TDBFieldGetProperties, TDBFieldGetValueAsInteger, and TDBFieldGetValueAsString, but it
+    works on any OS and reads the values straight out of a memory-mapped view of the file instead of making one ctypes
+    call per field per record.
+
+    The layout of a TDB file, as worked out from the roster files themselves, is:
+        1) A 24-byte file header: the magic b"DB", a version, the total DB size, the table count and a header CRC.
+        2) A table directory with one 8-byte entry per table: the 4-character table name and the table's offset,
+            relative to the end of the directory.
+        3) The tables themselves. Each one is a 40-byte table header (record size in bytes and bits, capacity, record
+            count, deleted count, etc.), followed by a 16-byte definition for each field (type, bit offset, 4-character
+            name, and bit count), followed by 'capacity' fixed-size records.
+    Within a record, fields are bit-packed and little-endian: a field's value is found by reading the bytes spanning
+    its bits as a little-endian integer, shifting right by (bit_offset % 8), and masking off 'bits' bits. String fields
+    are always byte-aligned and null-terminated.
+
+    Since the same few roster files (and copies of them) get opened over and over, the schema of each file (its tables
+    and their field definitions) is cached in a JSON sidecar next to it, eg. "base.ros.schema.json". The sidecar is
+    keyed by a hash of the file header and table directory, so later opens of a file with the same layout build their
+    tables from the sidecar instead of parsing every field definition again; a stale sidecar is simply rewritten.
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import hashlib, json, mmap, struct
+
+
+# 1.2 - Third-party imports
+
+
+# 1.3 - Application-specific imports
+
+
+# 1.4 - Global settings
+
+
+# 1.5 - Global constants
+
+# The field types, as numbered by the TDBAccess DLL in TDBFieldPropertiesStruct.FieldType.
+TDB_STRING = 0
+TDB_BINARY = 1
+TDB_SINT = 2
+TDB_UINT = 3
+TDB_FLOAT = 4
+
+# The magic bytes every TDB file starts with.
+TDB_MAGIC = b'DB'
+
+# The encoding used for the names stored in string fields.
+TDB_STRING_ENCODING = 'latin-1'
+
+# File header: magic, version, unknown, DB size, unknown, table count, header CRC.
+FILE_HEADER = struct.Struct('<2sHIIIII')
+# Table directory entry: table name, table offset (relative to the end of the directory).
+DIRECTORY_ENTRY = struct.Struct('<4sI')
+# Table header: CRC of the previous block, flags, record bytes, record bits, unknown, capacity, record count, deleted
+# count, next deleted record, field count, index count, unknown, unknown, table header CRC.
+TABLE_HEADER = struct.Struct('<IIIIIHHHHBBHII')
+# Field definition: field type, bit offset within the record, field name, bit count.
+FIELD_DEFINITION = struct.Struct('<II4sI')
+
+# The suffix added to a TDB file's path to get the path of its schema cache sidecar.
+SCHEMA_CACHE_SUFFIX = '.schema.json'
+
+# The schemas already loaded by this process, as {schema key: [(fields, fields_by_name) for each table]}, so opening
+# another file with the same layout doesn't even need to read the sidecar.
+LOADED_SCHEMAS = {}
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+class TDBField:
+    """ Holds the properties of one field of a table in a TDB file, plus what we need to decode it quickly. """
+
+    __slots__ = ('name', 'index', 'field_type', 'bit_offset', 'bits', 'byte_offset', 'byte_count', 'shift', 'mask')
+
+    def __init__(self, name, index, field_type, bit_offset, bits):
+        self.name = name
+        self.index = index
+        self.field_type = field_type
+        self.bit_offset = bit_offset
+        self.bits = bits
+        # Precompute the span of bytes holding this field, and how to pull the value out of them.
+        self.byte_offset = bit_offset // 8
+        self.byte_count = ((bit_offset + bits + 7) // 8) - self.byte_offset
+        self.shift = bit_offset % 8
+        self.mask = (1 << bits) - 1
+
+    def __repr__(self):
+        return "TDBField({0!r}, type={1}, bit_offset={2}, bits={3})".format(
+            self.name, self.field_type, self.bit_offset, self.bits)
+
+    @property
+    def size(self):
+        """ Returns the size of the field in bits, as reported by TDBFieldGetProperties. """
+        return self.bits
+
+    @property
+    def is_string(self):
+        """ Returns whether this field holds a string. """
+        return self.field_type == TDB_STRING
+
+
+class TDBTable:
+    """ A view of one table in a TDB file. Values are decoded straight from the underlying buffer on request. """
+
+    def __init__(self, buffer, index, name, offset, schema=None):
+        # The buffer is a memoryview over the whole file; we never copy out of it except to decode a value.
+        self.buffer = buffer
+        self.index = index
+        self.name = name
+        self.offset = offset
+        self.read_header()
+
+        # Use the fields from a schema cache if we were given them, otherwise read the field definitions that follow
+        # the table header.
+        if schema is not None and len(schema[0]) == self.field_count:
+            self.fields, self.fields_by_name = schema
+        else:
+            self.fields = []
+            self.fields_by_name = {}
+            for field_index in range(self.field_count):
+                field_type, bit_offset, raw_name, bits = FIELD_DEFINITION.unpack_from(
+                    buffer,
+                    offset + TABLE_HEADER.size + (field_index * FIELD_DEFINITION.size)
+                )
+                field = TDBField(raw_name.decode('ascii'), field_index, field_type, bit_offset, bits)
+                self.fields.append(field)
+                self.fields_by_name[field.name] = field
+
+        # The records start right after the last field definition.
+        self.records_offset = offset + TABLE_HEADER.size + (self.field_count * FIELD_DEFINITION.size)
+
+    def __repr__(self):
+        return "TDBTable({0!r}, records={1}, capacity={2}, fields={3})".format(
+            self.name, self.record_count, self.capacity, self.field_count)
+
+    def read_header(self):
+        """ (Re-)reads the table header values from the buffer. """
+        (
+            self.prior_crc,
+            self.flags,
+            self.record_bytes,
+            self.record_bits,
+            _,
+            self.capacity,
+            self.record_count,
+            self.deleted_count,
+            self.next_deleted_record,
+            self.field_count,
+            self.index_count,
+            _,
+            _,
+            self.header_crc
+        ) = TABLE_HEADER.unpack_from(self.buffer, self.offset)
+
+    @property
+    def end_offset(self):
+        """ Returns the offset just past the last record slot of this table. """
+        return self.records_offset + (self.capacity * self.record_bytes)
+
+    def get_field(self, field):
+        """ Returns the TDBField for a given field name (or the field itself, if one is passed in). """
+        if isinstance(field, TDBField):
+            return field
+        try:
+            return self.fields_by_name[field]
+        except KeyError:
+            raise KeyError("Table {0} has no field named {1!r}.".format(self.name, field)) from None
+
+    def record_start(self, record_index):
+        """ Returns the offset into the buffer of the first byte of a given record. """
+        if not 0 <= record_index < self.capacity:
+            raise IndexError("Record {0} is out of range for table {1}.".format(record_index, self.name))
+        return self.records_offset + (record_index * self.record_bytes)
+
+    def record_view(self, record_index):
+        """ Returns a memoryview of the raw bytes of a given record (without copying them). """
+        start = self.record_start(record_index)
+        return self.buffer[start:start + self.record_bytes]
+
+    def records_view(self):
+        """ Returns a memoryview of the raw bytes of all of the table's current records. """
+        return self.buffer[self.records_offset:self.records_offset + (self.record_count * self.record_bytes)]
+
+    def get_integer(self, field, record_index):
+        """ Returns the integer value of a given field on a given record. """
+        field = self.get_field(field)
+        start = self.record_start(record_index) + field.byte_offset
+        value = (int.from_bytes(self.buffer[start:start + field.byte_count], 'little') >> field.shift) & field.mask
+        # Signed integers are stored in two's complement using the field's full bit count.
+        if field.field_type == TDB_SINT and value >> (field.bits - 1):
+            value -= 1 << field.bits
+        return value
+
+    def get_string(self, field, record_index):
+        """ Returns the string value of a given field on a given record. """
+        field = self.get_field(field)
+        start = self.record_start(record_index) + field.byte_offset
+        raw_value = bytes(self.buffer[start:start + (field.bits // 8)])
+        return raw_value.split(b'\0', 1)[0].decode(TDB_STRING_ENCODING)
+
+    def get_value(self, field, record_index):
+        """ Returns the value of a given field on a given record, decoded according to the field's type. """
+        field = self.get_field(field)
+        if field.field_type == TDB_STRING:
+            return self.get_string(field, record_index)
+        if field.field_type == TDB_BINARY:
+            start = self.record_start(record_index) + field.byte_offset
+            return bytes(self.buffer[start:start + (field.bits // 8)])
+        if field.field_type == TDB_FLOAT:
+            return struct.unpack('<f', self.get_integer(field, record_index).to_bytes(4, 'little'))[0]
+        return self.get_integer(field, record_index)
+
+    def get_schema(self):
+        """ Returns the table's name and field definitions as plain lists, as stored in a schema cache. """
+        return {
+            'name': self.name,
+            'fields': [[field.name, field.field_type, field.bit_offset, field.bits] for field in self.fields]
+        }
+
+    def get_record(self, record_index):
+        """ Returns a dict of all of the field values of a given record, keyed by field name. """
+        return {field.name: self.get_value(field, record_index) for field in self.fields}
+
+    def iter_records(self):
+        """ Yields a dict of field values for each of the table's current records, in order. """
+        for record_index in range(self.record_count):
+            yield self.get_record(record_index)
+
+
+class TDBFile:
+    """ A read-only, memory-mapped TDB file (eg. a .ros roster file) and the tables in it. """
+
+    def __init__(self, path, use_schema_cache=True):
+        self.path = path
+        self.use_schema_cache = use_schema_cache
+        with open(path, 'rb') as tdb_file:
+            self.mmap = mmap.mmap(tdb_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.load(memoryview(self.mmap))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self.tables)
+
+    def load(self, buffer):
+        """ Parses the file header, the table directory, and each table's header and field definitions. """
+        self.buffer = buffer
+        (
+            magic,
+            self.version,
+            _,
+            self.db_size,
+            _,
+            table_count,
+            self.header_crc
+        ) = FILE_HEADER.unpack_from(buffer, 0)
+        if magic != TDB_MAGIC:
+            raise ValueError("{0} is not a TDB file.".format(self.path))
+
+        # Table offsets are relative to the end of the table directory.
+        self.directory_offset = FILE_HEADER.size
+        self.tables_offset = self.directory_offset + (table_count * DIRECTORY_ENTRY.size)
+
+        # Files with the same header and table directory have the same layout, so that is what the schema is keyed by.
+        self.schema_key = hashlib.sha1(buffer[:self.tables_offset]).hexdigest()
+        cached_schema = None
+        if self.use_schema_cache:
+            cached_schema = LOADED_SCHEMAS.get(self.schema_key) or self.read_schema_cache(table_count)
+
+        self.tables = []
+        self.tables_by_name = {}
+        for table_index in range(table_count):
+            raw_name, table_offset = DIRECTORY_ENTRY.unpack_from(
+                buffer, self.directory_offset + (table_index * DIRECTORY_ENTRY.size))
+            table = TDBTable(
+                buffer,
+                table_index,
+                raw_name.decode('ascii'),
+                self.tables_offset + table_offset,
+                cached_schema[table_index] if cached_schema is not None else None
+            )
+            self.tables.append(table)
+            self.tables_by_name[table.name] = table
+
+        if self.use_schema_cache:
+            if cached_schema is None:
+                self.write_schema_cache()
+            LOADED_SCHEMAS[self.schema_key] = [(table.fields, table.fields_by_name) for table in self.tables]
+
+    @property
+    def schema_cache_path(self):
+        """ Returns the path of this file's schema cache sidecar. """
+        return self.path + SCHEMA_CACHE_SUFFIX
+
+    def read_schema_cache(self, table_count):
+        """ Returns [(fields, fields_by_name) for each table] from this file's sidecar, or None if it's not current. """
+        try:
+            with open(self.schema_cache_path) as schema_file:
+                schema = json.load(schema_file)
+        except (OSError, ValueError):
+            return None
+        if schema.get('key') != self.schema_key or len(schema.get('tables', [])) != table_count:
+            return None
+        cached_schema = []
+        for table_schema in schema['tables']:
+            fields = [
+                TDBField(field_name, field_index, field_type, bit_offset, bits)
+                for field_index, (field_name, field_type, bit_offset, bits) in enumerate(table_schema['fields'])
+            ]
+            cached_schema.append((fields, {field.name: field for field in fields}))
+        return cached_schema
+
+    def write_schema_cache(self):
+        """ Writes this file's schema to its sidecar, if we can (a read-only folder just means no caching). """
+        schema = {'key': self.schema_key, 'tables': [table.get_schema() for table in self.tables]}
+        try:
+            with open(self.schema_cache_path, 'w') as schema_file:
+                json.dump(schema, schema_file)
+        except OSError:
+            pass
+
+    @property
+    def table_count(self):
+        """ Returns the number of tables in the file, as TDBDatabaseGetTableCount does. """
+        return len(self.tables)
+
+    def get_table(self, table):
+        """ Returns the TDBTable with a given name or index (or the table itself, if one is passed in). """
+        if isinstance(table, TDBTable):
+            return table
+        if isinstance(table, int):
+            return self.tables[table]
+        try:
+            return self.tables_by_name[table]
+        except KeyError:
+            raise KeyError("{0} has no table named {1!r}.".format(self.path, table)) from None
+
+    def close(self):
+        """ Releases our views of the file and unmaps it. """
+        if self.buffer is None:
+            return
+        for table in self.tables:
+            table.buffer = None
+        self.buffer.release()
+        self.buffer = None
+        self.mmap.close()
@@ -0,0 +1,251 @@
+r"""tdb_image.py
+
+    This module contains the TDBImage class, a writable in-memory copy of a TDB file (eg. a .ros roster file). It
+    builds on the reader in "tdb_file.py", adding what we need to write a roster without the TDBAccess DLL:
+        1) Packing a whole table's worth of records, including their bit-packed fields, into the image in one pass.
+        2) Recomputing the CRCs the game checks when it loads a roster.
+        3) Writing the finished image out with a single write call, to a temporary file that then replaces the
+            destination file, so the destination is never left half-written.
+
+    The CRCs are CRC-32/MPEG-2 (the non-reflected polynomial 0x04C11DB7, initial value 0xFFFFFFFF, no final XOR),
+    stored little-endian. The file header's CRC covers the 20 bytes before it; the first table's leading CRC covers
+    the table directory; each table header's CRC covers its bytes 4 - 35; and the CRC of each table's field
+    definitions and records is stored in the first 4 bytes of the next table, or at the very end of the file for the
+    last table.
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import os, struct, zlib
+
+
+# 1.2 - Third-party imports
+
+
+# 1.3 - Application-specific imports
+
+from .tdb_file import FILE_HEADER, TABLE_HEADER, TDB_BINARY, TDB_FLOAT, TDB_SINT, TDB_STRING, TDB_STRING_ENCODING, \
+    TDBFile
+
+
+# 1.4 - Global settings
+
+
+# 1.5 - Global constants
+
+# The value stored in a table's 'next deleted record' slot when there are no deleted records.
+NO_DELETED_RECORD = 0xFFFF
+
+# A translation table that reverses the bit order of each byte. Feeding bit-reversed bytes through zlib's (reflected)
+# CRC-32 gives us the bit-reversed register of the non-reflected CRC-32/MPEG-2, at C speed.
+BIT_REVERSED_BYTES = bytes(int('{0:08b}'.format(value)[::-1], 2) for value in range(256))
+
+CRC_FORMAT = struct.Struct('<I')
+
+# The suffix added to a file's path to get the temporary file we write before replacing it.
+TEMP_FILE_SUFFIX = '.tmp'
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+class TDBImage(TDBFile):
+    """ A writable, in-memory copy of a TDB file. """
+
+    def __init__(self, path, use_schema_cache=True):
+        # Read the whole file into one bytearray; all of our edits happen there until we save.
+        self.path = path
+        self.use_schema_cache = use_schema_cache
+        self.mmap = None
+        with open(path, 'rb') as tdb_file:
+            self.data = bytearray(tdb_file.read())
+        self.load(memoryview(self.data))
+
+    def close(self):
+        """ Releases our view of the image. """
+        if self.buffer is None:
+            return
+        for table in self.tables:
+            table.buffer = None
+        self.buffer.release()
+        self.buffer = None
+
+    def set_integer(self, table, field, record_index, value):
+        """ Sets the integer value of a given field on a given record. """
+        table = self.get_table(table)
+        field = table.get_field(field)
+        start = table.record_start(record_index) + field.byte_offset
+        end = start + field.byte_count
+        raw_bits = int.from_bytes(self.data[start:end], 'little')
+        raw_bits &= ~(field.mask << field.shift)
+        raw_bits |= encode_integer(field, value) << field.shift
+        self.data[start:end] = raw_bits.to_bytes(field.byte_count, 'little')
+
+    def set_string(self, table, field, record_index, value):
+        """ Sets the string value of a given field on a given record. """
+        table = self.get_table(table)
+        field = table.get_field(field)
+        start = table.record_start(record_index) + field.byte_offset
+        self.data[start:start + (field.bits // 8)] = encode_string(field, value)
+
+    def set_record_count(self, table, record_count):
+        """ Sets the number of (live) records in a table, clearing any deleted-record bookkeeping. """
+        table = self.get_table(table)
+        if not 0 <= record_count <= table.capacity:
+            raise ValueError("Table {0} can only hold {1} records, not {2}.".format(
+                table.name, table.capacity, record_count))
+        header = list(TABLE_HEADER.unpack_from(self.data, table.offset))
+        header[6] = record_count
+        header[7] = 0
+        header[8] = NO_DELETED_RECORD
+        TABLE_HEADER.pack_into(self.data, table.offset, *header)
+        table.read_header()
+
+    def resize_table(self, table, record_count):
+        """
+        Resizes a table to a given number of (live) records in a single step: records past the old record count are
+        blanked (all zeros) and become live, and records past the new record count are dropped, as the DLL's record
+        deletion and compaction would leave them.
+        """
+        table = self.get_table(table)
+        old_record_count = table.record_count
+        self.set_record_count(table, record_count)
+        if record_count > old_record_count:
+            self.data[
+                table.records_offset + (old_record_count * table.record_bytes):
+                table.records_offset + (record_count * table.record_bytes)
+            ] = bytes((record_count - old_record_count) * table.record_bytes)
+
+    def copy_records(self, table, source_table, record_indexes):
+        """
+        Copies the given (live) records of a table from a table with the same layout in another TDB file, eg. to keep
+        records that are already finished in an older copy of the file. Any record the source table doesn't have is
+        blanked (all zeros).
+        """
+        table = self.get_table(table)
+        if source_table.record_bytes != table.record_bytes:
+            raise ValueError("Table {0} has {1}-byte records, but the source table's are {2} bytes.".format(
+                table.name, table.record_bytes, source_table.record_bytes))
+        blank_record = bytes(table.record_bytes)
+        for record_index in record_indexes:
+            if not 0 <= record_index < table.record_count:
+                raise ValueError("Table {0} has no record {1}.".format(table.name, record_index))
+            record_offset = table.records_offset + (record_index * table.record_bytes)
+            if record_index < source_table.record_count:
+                self.data[record_offset:record_offset + table.record_bytes] = source_table.record_view(record_index)
+            else:
+                self.data[record_offset:record_offset + table.record_bytes] = blank_record
+
+    def pack_records(self, table, records):
+        """
+        Packs a list of {field name: value} dicts into a table, one record per dict, in a single pass, and sets the
+        table's record count to match. Any field missing from a dict keeps the value it had in the image (or 0 for
+        records past the table's old record count). Returns a list of error messages for values that could not be
+        packed; those fields are left as they were.
+        """
+        table = self.get_table(table)
+        if len(records) > table.capacity:
+            raise ValueError("Table {0} can only hold {1} records, not {2}.".format(
+                table.name, table.capacity, len(records)))
+
+        errors = []
+        packed_records = []
+        blank_record = bytes(table.record_bytes)
+        for record_index, record in enumerate(records):
+            # Start from the record's current bytes as one big little-endian integer, so every field is a bit-op.
+            if record_index < table.record_count:
+                raw_record = int.from_bytes(table.record_view(record_index), 'little')
+            else:
+                raw_record = int.from_bytes(blank_record, 'little')
+            for field_name, value in record.items():
+                try:
+                    field = table.get_field(field_name)
+                    if field.field_type in (TDB_STRING, TDB_BINARY):
+                        raw_value = int.from_bytes(encode_string(field, value), 'little')
+                    else:
+                        raw_value = encode_integer(field, value)
+                except (KeyError, TypeError, ValueError) as error:
+                    errors.append("Record {0}, field {1}: {2}".format(record_index, field_name, error))
+                    continue
+                raw_record &= ~(field.mask << field.bit_offset)
+                raw_record |= raw_value << field.bit_offset
+            packed_records.append(raw_record.to_bytes(table.record_bytes, 'little'))
+
+        # Drop all of the packed records into the image at once.
+        records_bytes = b''.join(packed_records)
+        self.data[table.records_offset:table.records_offset + len(records_bytes)] = records_bytes
+        self.set_record_count(table, len(records))
+        return errors
+
+    def update_crcs(self):
+        """ Recomputes every CRC in the image so the game will accept it. """
+        # The file header CRC covers everything in the header before it.
+        CRC_FORMAT.pack_into(self.data, FILE_HEADER.size - CRC_FORMAT.size, crc32_mpeg2(self.data[:20]))
+        # The first table's leading CRC covers the table directory.
+        CRC_FORMAT.pack_into(
+            self.data, self.tables_offset, crc32_mpeg2(self.data[self.directory_offset:self.tables_offset]))
+        for table_index, table in enumerate(self.tables):
+            # Each table header's CRC covers the header, minus the leading CRC and the header CRC itself.
+            CRC_FORMAT.pack_into(
+                self.data,
+                table.offset + TABLE_HEADER.size - CRC_FORMAT.size,
+                crc32_mpeg2(self.data[table.offset + CRC_FORMAT.size:table.offset + TABLE_HEADER.size - 4])
+            )
+            # The CRC of the field definitions and records goes at the start of the next table (or the end of file).
+            if table_index + 1 < len(self.tables):
+                crc_offset = self.tables[table_index + 1].offset
+            else:
+                crc_offset = table.end_offset
+            CRC_FORMAT.pack_into(
+                self.data, crc_offset, crc32_mpeg2(self.data[table.offset + TABLE_HEADER.size:table.end_offset]))
+        for table in self.tables:
+            table.read_header()
+
+    def save(self, path):
+        """ Updates the CRCs and writes the whole image to the given path, atomically, with a single write. """
+        self.update_crcs()
+        # Write to a temporary file in the same folder, then swap it in for the real file in one step.
+        temp_path = path + TEMP_FILE_SUFFIX
+        try:
+            with open(temp_path, 'wb') as tdb_file:
+                tdb_file.write(self.data)
+                tdb_file.flush()
+                os.fsync(tdb_file.fileno())
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def crc32_mpeg2(data):
+    """ Returns the CRC-32/MPEG-2 of the given bytes, as used throughout TDB files. """
+    reflected_crc = zlib.crc32(bytes(data).translate(BIT_REVERSED_BYTES)) ^ 0xFFFFFFFF
+    return int('{0:032b}'.format(reflected_crc)[::-1], 2)
+
+def encode_integer(field, value):
+    """ Returns the raw (unsigned) bits to store for a given integer value in a given field. """
+    if field.field_type == TDB_FLOAT:
+        return int.from_bytes(struct.pack('<f', value), 'little') & field.mask
+    value = int(value)
+    if field.field_type == TDB_SINT:
+        if not -(1 << (field.bits - 1)) <= value < (1 << (field.bits - 1)):
+            raise ValueError("{0} does not fit in {1} signed bits.".format(value, field.bits))
+        return value & field.mask
+    if not 0 <= value <= field.mask:
+        raise ValueError("{0} does not fit in {1} unsigned bits.".format(value, field.bits))
+    return value
+
+def encode_string(field, value):
+    """ Returns the null-padded bytes to store for a given string value in a given string field. """
+    if isinstance(value, str):
+        value = value.encode(TDB_STRING_ENCODING)
+    size = field.bits // 8
+    if len(value) > size:
+        raise ValueError("{0!r} is longer than {1} bytes.".format(value, size))
+    return bytes(value) + bytes(size - len(value))
@@ -0,0 +1,133 @@
+r"""team_matcher.py
+
+    This module contains the TeamMatcher class, which finds the Madden ID of a player's team (TGID) from the team's
+    name in the player attributes CSV, using the nicknames and IDs in "teams_and_ids.csv". A name matches a team if the
+    team's nickname is anywhere in it, ignoring case, so "Eagles", "Philadelphia Eagles", and "eagles" all find the
+    Eagles. It is built once (by RosterLookups; see "roster_manager.py"), and the position specs look a player's team
+    up with "roster.teams.team_id(player['team'])", which works on a single name, or just as well on a NumPy array of
+    them (one element per player).
+
+    All of the nicknames are compiled into a single regular expression, so a name is searched for every one of them in
+    one scan, and each name is only matched once (they are cached). A name with none of the nicknames in it gets
+    DEFAULT_TEAM_ID ("None"), as does one with the nicknames of more than one team in it (rather than whichever team
+    comes first in the file); RosterManager logs a summary of such names, rather than each player.
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import collections, csv, functools, os, re
+
+
+# 1.2 - Third-party imports
+
+import numpy as np
+
+
+# 1.3 - Application-specific imports
+
+
+# 1.4 - Global settings
+
+# The most names to remember the team ID of.
+CACHE_SIZE = 1024
+
+
+# 1.5 - Global constants
+
+# The file of teams' nicknames and IDs.
+TEAMS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "teams_and_ids.csv")
+
+# The team ID of a player whose team we can't tell ("None").
+DEFAULT_TEAM_ID = 1023
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+class TeamMatcher:
+    """ Finds teams' IDs by the nicknames in their names, and tells which names match no team, or several. """
+
+    def __init__(self, teams, default_id=DEFAULT_TEAM_ID):
+        self.default_id = default_id
+        # Each team's nickname and ID, by its uppercase nickname.
+        self.teams_by_nickname = {}
+        for nickname, team_id in teams:
+            if nickname.upper() in self.teams_by_nickname:
+                raise ValueError("there are two teams called {0!r}".format(nickname))
+            self.teams_by_nickname[nickname.upper()] = (nickname, team_id)
+        # One pattern for all of the nicknames (longest first). It is a lookahead, so that it finds every nickname in
+        # a name, even ones that overlap.
+        self.pattern = re.compile("(?=({0}))".format("|".join(
+            re.escape(nickname) for nickname in sorted(self.teams_by_nickname, key=len, reverse=True))))
+        self.cached_team_id = functools.lru_cache(maxsize=CACHE_SIZE)(self.find_team_id)
+
+    def __repr__(self):
+        return "TeamMatcher(teams={0})".format(len(self.teams_by_nickname))
+
+    def __getstate__(self):
+        # The cache can't be pickled (to send to the worker processes); they each start their own.
+        state = self.__dict__.copy()
+        del state["cached_team_id"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.cached_team_id = functools.lru_cache(maxsize=CACHE_SIZE)(self.find_team_id)
+
+    @classmethod
+    def from_csv(cls, teams_path=TEAMS_PATH):
+        """ Reads a CSV file with a "name" and an "id" column. """
+        with open(teams_path) as teams_file:
+            return cls([(row["name"], int(row["id"])) for row in csv.DictReader(teams_file)])
+
+    def matching_teams(self, team_name):
+        """ Returns the nickname and ID of each of the different teams whose nicknames are in a name. """
+        matches = []
+        for match in self.pattern.finditer(team_name.upper()):
+            team = self.teams_by_nickname[match.group(1)]
+            if team not in matches:
+                matches.append(team)
+        return matches
+
+    def find_team_id(self, team_name):
+        """ Returns the ID of the one team whose nickname is in a name, or else the default ID. """
+        matches = self.matching_teams(team_name)
+        return matches[0][1] if len(matches) == 1 else self.default_id
+
+    def team_id(self, team_names):
+        """ Returns the ID of a team by its name, or, given an array of names, an array of their IDs. """
+        if np.ndim(team_names) == 0:
+            return self.cached_team_id(str(team_names))
+        # Each different name is matched once.
+        unique_names, inverse = np.unique(np.asarray(team_names, dtype=str), return_inverse=True)
+        unique_ids = np.array([self.cached_team_id(name) for name in unique_names.tolist()], dtype=np.int64)
+        return unique_ids[inverse.reshape(-1)]
+
+    def summary(self, team_names):
+        """ Returns a description of the names (of a column of them) that matched no team, or several; or None. """
+        misses = collections.Counter()
+        ambiguous = {}
+        for team_name, count in collections.Counter(np.asarray(team_names, dtype=str).tolist()).items():
+            matches = self.matching_teams(team_name)
+            if not matches:
+                misses[team_name] += count
+            elif len(matches) > 1:
+                ambiguous[team_name] = ([nickname for nickname, _ in matches], count)
+        lines = []
+        if misses:
+            lines.append("{0} players' teams ({1} names) were not found, so got team ID {2}: {3}".format(
+                sum(misses.values()), len(misses), self.default_id,
+                ", ".join("{0!r} ({1})".format(name, count) for name, count in misses.most_common())))
+        if ambiguous:
+            lines.append("{0} players' teams matched more than one team, so got team ID {1}: {2}".format(
+                sum(count for _, count in ambiguous.values()), self.default_id,
+                ", ".join("{0!r} ({1}; {2})".format(team_name, " and ".join(nicknames), count)
+                          for team_name, (nicknames, count) in sorted(ambiguous.items()))))
+        return "\n".join(lines) or None
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
@@ -24,6 +24,10 @@ r"""test_curve_fit.py
     Later, in step 5,each player without contract info will get a slightly randomized value for their per-year-salary, 
     a reasonable number of years on the contract (taking into account their no. of years pro), the number of years 
     left on the contract (again, taking into account their no. of years pro), and their signing bonus figure. 
+    
+    The overall ratings are worked out with the same formulas, and rating ranges, step 5 uses (see 
+    "overall_ratings.py"), so run this script from the "process" folder with:
+        > python -m utilities.test_curve_fit
 """
 
 # ----------------------------------------------------- SECTION 1 -----------------------------------------------------
@@ -43,6 +47,7 @@ from scipy.optimize import curve_fit
 
 # 1.3 - Application-specific imports
 
+from .overall_ratings import formula_for, overall_rating
 
 # 1.4 - Global settings
 
@@ -53,6 +58,13 @@ from scipy.optimize import curve_fit
 # This will be the directory above the directory above the directory this file is in.
 BASE_MADDEN_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# The number added to the average of elusiveness and trucking, for the positions whose break_tackles gets a bonus.
+BREAK_TACKLES_BONUSES = {"QB": 7, "HB": 5, "FB": 5, "TE": 5}
+
+# The columns that a QB's throw_accuracy is made up of.
+THROW_ACCURACY_COLUMNS = (
+    "throw_accuracy_short", "throw_accuracy_mid", "throw_accuracy_deep", "throw_on_the_run", "playaction")
+
 # ----------------------------------------------------- SECTION 2 -----------------------------------------------------
 # ------------------------------------------------ Class Declarations -------------------------------------------------
 
@@ -67,401 +79,34 @@ def func(x, a, b, c):
     """
     return a + (b * x) + (c * x * x)
 
+def rating_value(player_dict, name, position):
+    """
+    This function returns the (unclamped) value of one of the ratings used in a player's overall_rating, working out 
+    the ones that are made up of several columns.
+    """
+    if name in ("pass_block", "run_block"):
+        return math.ceil(
+            (int(player_dict[name]) + int(player_dict[name + "_power"]) + int(player_dict[name + "_finesse"])) / 3)
+    if name == "break_tackles":
+        return (math.ceil((int(player_dict["elusiveness"]) + int(player_dict["trucking"])) / 2) + 
+                BREAK_TACKLES_BONUSES.get(position, 0))
+    if name == "throw_accuracy":
+        accuracies = [int(player_dict[column]) for column in THROW_ACCURACY_COLUMNS]
+        return math.ceil(((2 * sum(accuracies)) - (2 * min(accuracies))) / 8)
+    return int(player_dict[name])
+
 def calculate_overall_rating(player_dict):
     """
-    This function calculates the overall_rating of a player based on his position.
+    This function calculates the overall_rating of a player based on his position, with the formula (and the range 
+    each rating is clamped to) in "overall_ratings.py", the same one step 5 uses.
     """
-    if player_dict["position"].upper() == "QB":
-        throw_power = int(max(min(int(player_dict["throw_power"]), 99), 70))
-        throw_accuracy = int(max(min(math.ceil(
-            ((2 * (
-                int(player_dict["throw_accuracy_short"]) + 
-                int(player_dict["throw_accuracy_mid"]) + 
-                int(player_dict["throw_accuracy_deep"]) + 
-                int(player_dict["throw_on_the_run"]) + 
-                int(player_dict["playaction"])
-            )) - (2 * min(
-                int(player_dict["throw_accuracy_short"]), 
-                int(player_dict["throw_accuracy_mid"]), 
-                int(player_dict["throw_accuracy_deep"]), 
-                int(player_dict["throw_on_the_run"]), 
-                int(player_dict["playaction"])
-            ))
-            ) / 8
-        ), 99), 60))
-        break_tackles = int(max(min(
-            math.ceil(((int(player_dict["elusiveness"]) + int(player_dict["trucking"])) / 2) + 7), 
-            90), 20))
-        agility = int(max(min(int(player_dict["agility"]), 98), 45))
-        awareness = int(max(min(int(player_dict["awareness"]), 99), 40))
-        speed = int(max(min(int(player_dict["speed"]), 95), 55))
-        
-        overall_rating = 0.0
-        overall_rating += ((throw_power - 50.0) / 10.0) * 4.9
-        overall_rating += ((throw_accuracy - 50.0) / 10.0) * 5.8
-        overall_rating += ((break_tackles - 50.0) / 10.0) * 0.8
-        overall_rating += ((agility - 50.0) / 10.0) * 0.8
-        overall_rating += ((awareness - 50.0) / 10.0) * 4.0
-        overall_rating += ((speed - 50.0) / 10.0) * 2.0
-        overall_rating = int(max(min((round(overall_rating) + 28), 99), 40))
-        return overall_rating
-    
-    if player_dict["position"].upper() == "HB":
-        pass_block = int(max(min(math.ceil(
-            (
-                int(player_dict["pass_block"]) + 
-                int(player_dict["pass_block_power"]) + 
-                int(player_dict["pass_block_finesse"])
-            ) / 3
-        ), 70), 25))
-        break_tackles = int(max(min(
-            (math.ceil((int(player_dict["elusiveness"]) + int(player_dict["trucking"])) / 2) + 5), 
-            99), 50))
-        carrying = int(max(min(int(player_dict["carrying"]), 99), 60))
-        acceleration = int(max(min(int(player_dict["acceleration"]), 99), 80))
-        agility = int(max(min(int(player_dict["agility"]), 99), 70))
-        awareness = int(max(min(int(player_dict["awareness"]), 99), 45))
-        strength = int(max(min(int(player_dict["strength"]), 90), 45))
-        speed = int(max(min(int(player_dict["speed"]), 99), 80))
-        catching = int(max(min(int(player_dict["catching"]), 95), 50))
-        
-        overall_rating = 0.0
-        overall_rating += ((pass_block - 50.0) / 10.0) * 0.33
-        overall_rating += ((break_tackles - 50.0) / 10.0) * 0.8
-        overall_rating += ((carrying - 50.0) / 10.0) * 2.0
-        overall_rating += ((acceleration - 50.0) / 10.0) * 1.8
-        overall_rating += ((agility - 50.0) / 10.0) * 2.8
-        overall_rating += ((awareness - 50.0) / 10.0) * 2.0
-        overall_rating += ((strength - 50.0) / 10.0) * 0.6
-        overall_rating += ((speed - 50.0) / 10.0) * 3.3
-        overall_rating += ((catching - 50.0) / 10.0) * 1.4
-        overall_rating = int(max(min((round(overall_rating) + 27), 99), 40))
-        return overall_rating
-    
-    if player_dict["position"].upper() == "FB":
-        pass_block = int(max(min(math.ceil(
-            (
-                int(player_dict["pass_block"]) + 
-                int(player_dict["pass_block_power"]) + 
-                int(player_dict["pass_block_finesse"])
-            ) / 3
-        ), 75), 40))
-        run_block = int(max(min(math.ceil(
-            (
-                int(player_dict["run_block"]) + 
-                int(player_dict["run_block_power"]) + 
-                int(player_dict["run_block_finesse"])
-            ) / 3
-        ), 85), 45))
-        break_tackles = int(max(min(
-            (math.ceil((int(player_dict["elusiveness"]) + int(player_dict["trucking"])) / 2) + 5), 
-            99), 55))
-        carrying = int(max(min(int(player_dict["carrying"]), 99), 60))
-        acceleration = int(max(min(int(player_dict["acceleration"]), 95), 65))
-        agility = int(max(min(int(player_dict["agility"]), 95), 55))
-        awareness = int(max(min(int(player_dict["awareness"]), 99), 45))
-        strength = int(max(min(int(player_dict["strength"]), 95), 60))
-        speed = int(max(min(int(player_dict["speed"]), 95), 60))
-        catching = int(max(min(int(player_dict["catching"]), 95), 45))
-        
-        overall_rating = 0.0
-        overall_rating += ((pass_block - 50.0) / 10.0) * 1.0
-        overall_rating += ((run_block - 50.0) / 10.0) * 7.2
-        overall_rating += ((break_tackles - 50.0) / 10.0) * 1.8
-        overall_rating += ((carrying - 50.0) / 10.0) * 1.8
-        overall_rating += ((acceleration - 50.0) / 10.0) * 1.8
-        overall_rating += ((agility - 50.0) / 10.0) * 1.0
-        overall_rating += ((awareness - 50.0) / 10.0) * 2.8
-        overall_rating += ((strength - 50.0) / 10.0) * 1.8
-        overall_rating += ((speed - 50.0) / 10.0) * 1.8
-        overall_rating += ((catching - 50.0) / 10.0) * 5.2
-        overall_rating = int(max(min((round(overall_rating) + 39), 99), 40))
-        return overall_rating
-    
-    if player_dict["position"].upper() == "WR":
-        break_tackles = int(max(min(
-            math.ceil((int(player_dict["elusiveness"]) + int(player_dict["trucking"])) / 2), 
-            80), 35))
-        acceleration = int(max(min(int(player_dict["acceleration"]), 99), 75))
-        agility = int(max(min(int(player_dict["agility"]), 99), 75))
-        awareness = int(max(min(int(player_dict["awareness"]), 99), 35))
-        strength = int(max(min(int(player_dict["strength"]), 85), 35))
-        speed = int(max(min(int(player_dict["speed"]), 99), 80))
-        catching = int(max(min(int(player_dict["catching"]), 99), 65))
-        jumping = int(max(min(int(player_dict["jumping"]), 99), 65))
-        
-        overall_rating = 0.0
-        overall_rating += ((break_tackles - 50.0) / 10.0) * 0.8
-        overall_rating += ((acceleration - 50.0) / 10.0) * 2.3
-        overall_rating += ((agility - 50.0) / 10.0) * 2.3
-        overall_rating += ((awareness - 50.0) / 10.0) * 2.3
-        overall_rating += ((strength - 50.0) / 10.0) * 0.8
-        overall_rating += ((speed - 50.0) / 10.0) * 2.3
-        overall_rating += ((catching - 50.0) / 10.0) * 4.75
-        overall_rating += ((jumping - 50.0) / 10.0) * 1.4
-        overall_rating = int(max(min((round(overall_rating) + 26), 99), 40))
-        return overall_rating
-    
-    if player_dict["position"].upper() == "TE":
-        speed = int(max(min(int(player_dict["speed"]), 95), 55))
-        strength = int(max(min(int(player_dict["strength"]), 90), 55))
-        awareness = int(max(min(int(player_dict["awareness"]), 99), 35))
-        agility = int(max(min(int(player_dict["agility"]), 95), 55))
-        acceleration = int(max(min(int(player_dict["acceleration"]), 95), 60))
-        catching = int(max(min(int(player_dict["catching"]), 99), 45))
-        break_tackles = int(max(min(
-            (math.ceil((int(player_dict["elusiveness"]) + int(player_dict["trucking"])) / 2) + 5), 
-            95), 20))
-        pass_block = int(max(min(math.ceil(
-            (
-                int(player_dict["pass_block"]) + 
-                int(player_dict["pass_block_power"]) + 
-                int(player_dict["pass_block_finesse"])
-            ) / 3
-        ), 80), 35))
-        run_block = int(max(min(math.ceil(
-            (
-                int(player_dict["run_block"]) + 
-                int(player_dict["run_block_power"]) + 
-                int(player_dict["run_block_finesse"])
-            ) / 3
-        ), 85), 35))
-        
-        overall_rating = 0.0
-        overall_rating += ((speed - 50.0) / 10.0) * 2.65
-        overall_rating += ((strength - 50.0) / 10.0) * 2.65
-        overall_rating += ((awareness - 50.0) / 10.0) * 2.65
-        overall_rating += ((agility - 50.0) / 10.0) * 1.25
-        overall_rating += ((acceleration - 50.0) / 10.0) * 1.25
-        overall_rating += ((catching - 50.0) / 10.0) * 5.4
-        overall_rating += ((break_tackles - 50.0) / 10.0) * 1.2
-        overall_rating += ((pass_block - 50.0) / 10.0) * 1.2
-        overall_rating += ((run_block - 50.0) / 10.0) * 5.4
-        overall_rating = int(max(min((round(overall_rating) + 35), 99), 40))
-        return overall_rating
-    
-    if player_dict["position"].upper() == "LT" or player_dict["position"].upper() == "RT":
-        speed = int(max(min(int(player_dict["speed"]), 85), 45))
-        strength = int(max(min(int(player_dict["strength"]), 99), 70))
-        awareness = int(max(min(int(player_dict["awareness"]), 99), 40))
-        agility = int(max(min(int(player_dict["agility"]), 85), 40))
-        acceleration = int(max(min(int(player_dict["acceleration"]), 90), 60))
-        pass_block = int(max(min(math.ceil(
-            (
-                int(player_dict["pass_block"]) + 
-                int(player_dict["pass_block_power"]) + 
-                int(player_dict["pass_block_finesse"])
-            ) / 3
-        ), 99), 60))
-        run_block = int(max(min(math.ceil(
-            (
-                int(player_dict["run_block"]) + 
-                int(player_dict["run_block_power"]) + 
-                int(player_dict["run_block_finesse"])
-            ) / 3
-        ), 99), 60))
-        
-        overall_rating = 0.0
-        overall_rating += ((speed - 50.0) / 10.0) * 0.8
-        overall_rating += ((strength - 50.0) / 10.0) * 3.3
-        overall_rating += ((awareness - 50.0) / 10.0) * 3.3
-        overall_rating += ((agility - 50.0) / 10.0) * 0.8
-        overall_rating += ((acceleration - 50.0) / 10.0) * 0.8
-        overall_rating += ((pass_block - 50.0) / 10.0) * 4.75
-        overall_rating += ((run_block - 50.0) / 10.0) * 3.75
-        overall_rating = int(max(min((round(overall_rating) + 26), 99), 40))
-        return overall_rating
-    
-    if (player_dict["position"].upper() == "LG" or player_dict["position"].upper() == "RG" or 
-            player_dict["position"].upper() == "C"):
-        speed = int(max(min(int(player_dict["speed"]), 85), 45))
-        strength = int(max(min(int(player_dict["strength"]), 99), 70))
-        awareness = int(max(min(int(player_dict["awareness"]), 99), 40))
-        agility = int(max(min(int(player_dict["agility"]), 85), 40))
-        acceleration = int(max(min(int(player_dict["acceleration"]), 90), 60))
-        pass_block = int(max(min(math.ceil(
-            (
-                int(player_dict["pass_block"]) + 
-                int(player_dict["pass_block_power"]) + 
-                int(player_dict["pass_block_finesse"])
-            ) / 3
-        ), 99), 65))
-        run_block = int(max(min(math.ceil(
-            (
-                int(player_dict["run_block"]) + 
-                int(player_dict["run_block_power"]) + 
-                int(player_dict["run_block_finesse"])
-            ) / 3
-        ), 99), 65))
-        
-        overall_rating = 0.0
-        overall_rating += ((speed - 50.0) / 10.0) * 1.7
-        overall_rating += ((strength - 50.0) / 10.0) * 3.25
-        overall_rating += ((awareness - 50.0) / 10.0) * 3.25
-        overall_rating += ((agility - 50.0) / 10.0) * 0.8
-        overall_rating += ((acceleration - 50.0) / 10.0) * 1.7
-        overall_rating += ((pass_block - 50.0) / 10.0) * 3.25
-        overall_rating += ((run_block - 50.0) / 10.0) * 4.8
-        overall_rating = int(max(min((round(overall_rating) + 28), 99), 40))
-        return overall_rating
-    
-    if player_dict["position"].upper() == "LE" or player_dict["position"].upper() == "RE":
-        speed = int(max(min(int(player_dict["speed"]), 90), 55))
-        strength = int(max(min(int(player_dict["strength"]), 99), 60))
-        awareness = int(max(min(int(player_dict["awareness"]), 99), 40))
-        agility = int(max(min(int(player_dict["agility"]), 90), 45))
-        acceleration = int(max(min(int(player_dict["acceleration"]), 95), 65))
-        tackle = int(max(min(int(player_dict["tackle"]), 99), 60))
-        
-        overall_rating = 0.0
-        overall_rating += ((speed - 50.0) / 10.0) * 3.75
-        overall_rating += ((strength - 50.0) / 10.0) * 3.75
-        overall_rating += ((awareness - 50.0) / 10.0) * 1.75
-        overall_rating += ((agility - 50.0) / 10.0) * 1.75
-        overall_rating += ((acceleration - 50.0) / 10.0) * 3.8
-        overall_rating += ((tackle - 50.0) / 10.0) * 5.5
-        overall_rating = int(max(min((round(overall_rating) + 30), 99), 40))
-        return overall_rating
-    
-    if player_dict["position"].upper() == "DT":
-        speed = int(max(min(int(player_dict["speed"]), 90), 45))
-        strength = int(max(min(int(player_dict["strength"]), 99), 70))
-        awareness = int(max(min(int(player_dict["awareness"]), 99), 40))
-        agility = int(max(min(int(player_dict["agility"]), 90), 40))
-        acceleration = int(max(min(int(player_dict["acceleration"]), 95), 65))
-        tackle = int(max(min(int(player_dict["tackle"]), 99), 65))
-        
-        overall_rating = 0.0
-        overall_rating += ((speed - 50.0) / 10.0) * 1.8
-        overall_rating += ((strength - 50.0) / 10.0) * 5.5
-        overall_rating += ((awareness - 50.0) / 10.0) * 3.8
-        overall_rating += ((agility - 50.0) / 10.0) * 1
-        overall_rating += ((acceleration - 50.0) / 10.0) * 2.8
-        overall_rating += ((tackle - 50.0) / 10.0) * 4.55
-        overall_rating = int(max(min((round(overall_rating) + 29), 99), 40))
-        return overall_rating
-    
-    if player_dict["position"].upper() == "LOLB" or player_dict["position"].upper() == "ROLB":
-        speed = int(max(min(int(player_dict["speed"]), 95), 70))
-        strength = int(max(min(int(player_dict["strength"]), 99), 60))
-        awareness = int(max(min(int(player_dict["awareness"]), 99), 40))
-        agility = int(max(min(int(player_dict["agility"]), 95), 65))
-        acceleration = int(max(min(int(player_dict["acceleration"]), 95), 75))
-        catching = int(max(min(int(player_dict["catching"]), 90), 20))
-        tackle = int(max(min(int(player_dict["tackle"]), 99), 60))
-        
-        overall_rating = 0.0
-        overall_rating += ((speed - 50.0) / 10.0) * 3.75
-        overall_rating += ((strength - 50.0) / 10.0) * 2.4
-        overall_rating += ((awareness - 50.0) / 10.0) * 3.6
-        overall_rating += ((agility - 50.0) / 10.0) * 2.4
-        overall_rating += ((acceleration - 50.0) / 10.0) * 1.3
-        overall_rating += ((catching - 50.0) / 10.0) * 1.3
-        overall_rating += ((tackle - 50.0) / 10.0) * 4.8
-        overall_rating = int(max(min((round(overall_rating) + 29), 99), 40))
-        return overall_rating
-    
-    if player_dict["position"].upper() == "MLB":
-        speed = int(max(min(int(player_dict["speed"]), 95), 65))
-        strength = int(max(min(int(player_dict["strength"]), 99), 60))
-        awareness = int(max(min(int(player_dict["awareness"]), 99), 35))
-        agility = int(max(min(int(player_dict["agility"]), 95), 65))
-        acceleration = int(max(min(int(player_dict["acceleration"]), 95), 75))
-        tackle = int(max(min(int(player_dict["tackle"]), 99), 65))
-        
-        overall_rating = 0.0
-        overall_rating += ((speed - 50.0) / 10.0) * 0.75
-        overall_rating += ((strength - 50.0) / 10.0) * 3.4
-        overall_rating += ((awareness - 50.0) / 10.0) * 5.2
-        overall_rating += ((agility - 50.0) / 10.0) * 1.65
-        overall_rating += ((acceleration - 50.0) / 10.0) * 1.75
-        overall_rating += ((tackle - 50.0) / 10.0) * 5.2
-        overall_rating = int(max(min((round(overall_rating) + 27), 99), 40))
-        return overall_rating
-    
-    if player_dict["position"].upper() == "CB":
-        speed = int(max(min(int(player_dict["speed"]), 99), 80))
-        strength = int(max(min(int(player_dict["strength"]), 85), 40))
-        awareness = int(max(min(int(player_dict["awareness"]), 99), 35))
-        agility = int(max(min(int(player_dict["agility"]), 99), 75))
-        acceleration = int(max(min(int(player_dict["acceleration"]), 99), 80))
-        catching = int(max(min(int(player_dict["catching"]), 95), 40))
-        jumping = int(max(min(int(player_dict["jumping"]), 99), 65))
-        tackle = int(max(min(int(player_dict["tackle"]), 85), 30))
-        
-        overall_rating = 0.0
-        overall_rating += ((speed - 50.0) / 10.0) * 3.85
-        overall_rating += ((strength - 50.0) / 10.0) * 0.9
-        overall_rating += ((awareness - 50.0) / 10.0) * 3.85
-        overall_rating += ((agility - 50.0) / 10.0) * 1.55
-        overall_rating += ((acceleration - 50.0) / 10.0) * 2.35
-        overall_rating += ((catching - 50.0) / 10.0) * 3
-        overall_rating += ((jumping - 50.0) / 10.0) * 1.55
-        overall_rating += ((tackle - 50.0) / 10.0) * 1.55
-        overall_rating = int(max(min((round(overall_rating) + 28), 99), 40))
-        return overall_rating
-    
-    if player_dict["position"].upper() == "FS":
-        speed = int(max(min(int(player_dict["speed"]), 99), 75))
-        strength = int(max(min(int(player_dict["strength"]), 85), 45))
-        awareness = int(max(min(int(player_dict["awareness"]), 99), 40))
-        agility = int(max(min(int(player_dict["agility"]), 99), 70))
-        acceleration = int(max(min(int(player_dict["acceleration"]), 99), 80))
-        catching = int(max(min(int(player_dict["catching"]), 95), 35))
-        jumping = int(max(min(int(player_dict["jumping"]), 99), 65))
-        tackle = int(max(min(int(player_dict["tackle"]), 90), 45))
-        
-        overall_rating = 0.0
-        overall_rating += ((speed - 50.0) / 10.0) * 3.0
-        overall_rating += ((strength - 50.0) / 10.0) * 0.9
-        overall_rating += ((awareness - 50.0) / 10.0) * 4.85
-        overall_rating += ((agility - 50.0) / 10.0) * 1.5
-        overall_rating += ((acceleration - 50.0) / 10.0) * 2.5
-        overall_rating += ((catching - 50.0) / 10.0) * 3.0
-        overall_rating += ((jumping - 50.0) / 10.0) * 1.5
-        overall_rating += ((tackle - 50.0) / 10.0) * 2.5
-        overall_rating = int(max(min((round(overall_rating) + 30), 99), 40))
-        return overall_rating
-    
-    if player_dict["position"].upper() == "SS":
-        speed = int(max(min(int(player_dict["speed"]), 99), 75))
-        strength = int(max(min(int(player_dict["strength"]), 90), 45))
-        awareness = int(max(min(int(player_dict["awareness"]), 99), 40))
-        agility = int(max(min(int(player_dict["agility"]), 99), 70))
-        acceleration = int(max(min(int(player_dict["acceleration"]), 99), 80))
-        catching = int(max(min(int(player_dict["catching"]), 95), 35))
-        jumping = int(max(min(int(player_dict["jumping"]), 99), 65))
-        tackle = int(max(min(int(player_dict["tackle"]), 90), 45))
-        
-        overall_rating = 0.0
-        overall_rating += ((speed - 50.0) / 10.0) * 3.2
-        overall_rating += ((strength - 50.0) / 10.0) * 1.7
-        overall_rating += ((awareness - 50.0) / 10.0) * 4.75
-        overall_rating += ((agility - 50.0) / 10.0) * 1.7
-        overall_rating += ((acceleration - 50.0) / 10.0) * 1.7
-        overall_rating += ((catching - 50.0) / 10.0) * 3.2
-        overall_rating += ((jumping - 50.0) / 10.0) * 0.9
-        overall_rating += ((tackle - 50.0) / 10.0) * 3.2
-        overall_rating = int(max(min((round(overall_rating) + 30), 99), 40))
-        return overall_rating
-    
-    if player_dict["position"].upper() == "K":
-        awareness = int(max(min(int(player_dict["awareness"]), 85), 35))
-        kick_power = int(max(min(int(player_dict["kick_power"]), 99), 80))
-        kick_accuracy = int(max(min(int(player_dict["kick_accuracy"]), 99), 70))
-        
-        overall_rating = (-177 + (0.218 * awareness) + (1.28 * kick_power) + (1.47 * kick_accuracy))
-        overall_rating = int(max(min(round(overall_rating), 99), 40))
-        return overall_rating
-    
-    if player_dict["position"].upper() == "P":
-        awareness = int(max(min(int(player_dict["awareness"]), 85), 40))
-        kick_power = int(max(min(int(player_dict["kick_power"]), 99), 80))
-        kick_accuracy = int(max(min(int(player_dict["kick_accuracy"]), 99), 70))
-        
-        overall_rating = (-183 + (0.218 * awareness) + (1.5 * kick_power) + (1.33 * kick_accuracy))
-        overall_rating = int(max(min(round(overall_rating), 99), 40))
-        return overall_rating
+    position = player_dict["position"].upper()
+    formula = formula_for(position)
+    ratings = {}
+    for name in formula.names:
+        low, high = formula.ranges[name]
+        ratings[name] = int(max(min(rating_value(player_dict, name, position), high), low))
+    return overall_rating(position, **ratings)
     
 
 # ----------------------------------------------------- SECTION 4 -----------------------------------------------------
@@ -0,0 +1,213 @@
+r"""validate_samplers.py
+
+    This script checks that each way of making weighted random picks really picks with the chances its distribution's
+    weights declare, and measures how fast it does so. It loads the position specs (which builds a sampler for every
+    distinct distribution they use, named or not; see "distributions.py" and "samplers.py"), and goes through every
+    Distribution: each one named in the registry, and each one listed in a spec's steps. Then, for each of these ways
+    (or "implementations"):
+        1) numpy.random.choice with the probabilities (the old get_weighted_random, but asking for a block at a time).
+        2) get_weighted_random, one pick per call (see "randomizer_functions.py").
+        3) AliasSampler.pick, one pick per call, with numbers from a PCG64 Generator.
+        4) AliasSampler.pick_indexes, a block at a time, with numbers from a PCG64 Generator (as samplers.sample does).
+        5) AliasSampler.pick_indexes, a block at a time, with numbers from a Philox Generator (as the players' own
+            streams use; see "player_streams.py").
+    it draws many picks from every Distribution, with the sampler the Distribution was given, counts how often each
+    value came up, and runs a chi-square goodness-of-fit test of the counts against the chances the Distribution's own
+    weights declare (not the sampler's, since several Distributions with the same contents share a sampler, and a
+    sampler shared by mistake would pass a test against its own chances). Values with a weight of 0 must never come up
+    at all, and the sampler must pick from the Distribution's own values.
+
+    The block implementations draw BLOCK_SAMPLE_COUNT picks per distribution (millions in all); the one-at-a-time ones,
+    being far slower, draw SINGLE_SAMPLE_COUNT. With hundreds of distributions, a few p-values under 0.01 are expected
+    by chance alone, so we report how many there were next to how many to expect, and only count a distribution as a
+    failure when its p-value is under FAILURE_P_VALUE (which a real bias, with this many picks, would easily reach).
+    Run it from the "process" folder with:
+        > python -m utilities.validate_samplers
+"""
+
+# ----------------------------------------------------- SECTION 1 -----------------------------------------------------
+# ----------------------------------------- IMPORTS, SETTINGS, AND CONSTANTS ------------------------------------------
+
+# 1.1 - Standard library imports
+
+import math, sys, time
+
+
+# 1.2 - Third-party imports
+
+import numpy as np
+
+
+# 1.3 - Application-specific imports
+
+from .distributions import DISTRIBUTIONS
+from .position_specs import load_position_specs
+from .randomizer_functions import get_weighted_random
+
+
+# 1.4 - Global settings
+
+# The number of picks to draw from each distribution, for the implementations that pick a block at a time, and for
+# those that pick one at a time.
+BLOCK_SAMPLE_COUNT = 1000000
+SINGLE_SAMPLE_COUNT = 10000
+
+# The seed of the Generators, so a run can be repeated.
+SEED = 20080820
+
+
+# 1.5 - Global constants
+
+# A chi-square test is only reliable when every value is expected to come up at least this many times, so the least
+# likely values are pooled together until they are.
+MIN_EXPECTED_COUNT = 5
+
+# The p-value under which a distribution counts as failed, and the one we count (and compare with the number to expect).
+FAILURE_P_VALUE = 1e-6
+REPORT_P_VALUE = 0.01
+
+
+# ----------------------------------------------------- SECTION 2 -----------------------------------------------------
+# ------------------------------------------------ Class Declarations -------------------------------------------------
+
+
+# ----------------------------------------------------- SECTION 3 -----------------------------------------------------
+# ------------------------------------------------- Helper Functions --------------------------------------------------
+
+def declared_values(distribution):
+    """ Returns the values a Distribution's sampler picks from: its own, or the index of each if they vary. """
+    return list(distribution.values) if distribution.constant_values else list(range(len(distribution.values)))
+
+def declared_chances(distribution):
+    """ Returns the chance of each of a Distribution's values: its weights divided by their total. """
+    weights = np.asarray(distribution.weights, dtype=float)
+    return weights / weights.sum()
+
+def numpy_choice_indexes(distribution, count, generator):
+    """ Picks count indexes with numpy.random.choice and the Distribution's chances. """
+    return generator.choice(len(distribution.weights), count, p=declared_chances(distribution))
+
+def get_weighted_random_indexes(distribution, count, generator):
+    """ Picks count indexes one at a time with get_weighted_random, given the Distribution's values and weights. """
+    values_list, weights_list = declared_values(distribution), list(distribution.weights)
+    index_of_value = {value: index for index, value in enumerate(values_list)}
+    return np.array([index_of_value[get_weighted_random(values_list, weights_list)] for _ in range(count)])
+
+def pick_index_indexes(distribution, count, generator):
+    """ Picks count indexes one at a time with the Distribution's AliasSampler.pick_index. """
+    sampler = distribution.sampler
+    return np.array([sampler.pick_index(uniform) for uniform in generator.random(count).tolist()])
+
+def pick_indexes_indexes(distribution, count, generator):
+    """ Picks count indexes in one block with the Distribution's AliasSampler.pick_indexes. """
+    return distribution.sampler.pick_indexes(generator.random(count))
+
+# Each implementation: its name, the function that makes its picks, how many to make per distribution, and the
+# Generator it draws its numbers from.
+IMPLEMENTATIONS = (
+    ("numpy.random.choice", numpy_choice_indexes, BLOCK_SAMPLE_COUNT, np.random.PCG64),
+    ("get_weighted_random", get_weighted_random_indexes, SINGLE_SAMPLE_COUNT, np.random.PCG64),
+    ("AliasSampler.pick", pick_index_indexes, SINGLE_SAMPLE_COUNT, np.random.PCG64),
+    ("AliasSampler.pick_indexes", pick_indexes_indexes, BLOCK_SAMPLE_COUNT, np.random.PCG64),
+    ("pick_indexes with Philox", pick_indexes_indexes, BLOCK_SAMPLE_COUNT, np.random.Philox),
+)
+
+def chi_square_test(counts, probabilities):
+    """ Returns the chi-square statistic, degrees of freedom, and p-value of some counts against the chances. """
+    total = counts.sum()
+    expected = probabilities * total
+    # Pool the least likely values (in order, from the least likely up) until each group is expected often enough.
+    order = np.argsort(expected[probabilities > 0], kind="stable")
+    observed_groups, expected_groups = [], []
+    observed_sum = expected_sum = 0.0
+    for observed_count, expected_count in zip(
+            counts[probabilities > 0][order].tolist(), expected[probabilities > 0][order].tolist()):
+        observed_sum += observed_count
+        expected_sum += expected_count
+        if expected_sum >= MIN_EXPECTED_COUNT:
+            observed_groups.append(observed_sum)
+            expected_groups.append(expected_sum)
+            observed_sum = expected_sum = 0.0
+    if expected_sum > 0:
+        if expected_groups:
+            observed_groups[-1] += observed_sum
+            expected_groups[-1] += expected_sum
+        else:
+            observed_groups.append(observed_sum)
+            expected_groups.append(expected_sum)
+    observed_groups, expected_groups = np.array(observed_groups), np.array(expected_groups)
+    statistic = float((((observed_groups - expected_groups) ** 2) / expected_groups).sum())
+    degrees_of_freedom = len(expected_groups) - 1
+    return statistic, degrees_of_freedom, chi_square_p_value(statistic, degrees_of_freedom)
+
+def chi_square_p_value(statistic, degrees_of_freedom):
+    """ Returns the chance of a chi-square statistic at least this large, by the Wilson-Hilferty approximation. """
+    if degrees_of_freedom < 1:
+        return 1.0
+    # (statistic / degrees_of_freedom) ** (1 / 3) is close to normally distributed, with this mean and variance.
+    variance = 2 / (9 * degrees_of_freedom)
+    z_score = ((statistic / degrees_of_freedom) ** (1 / 3) - (1 - variance)) / math.sqrt(variance)
+    return 0.5 * math.erfc(z_score / math.sqrt(2))
+
+def spec_distributions(position_specs):
+    """ Returns each Distribution in the registry, then each one listed in a spec, with a name for each. """
+    distributions = list(DISTRIBUTIONS.items())
+    for position, position_spec in position_specs.items():
+        for sampler_name, distribution in position_spec.distribution_names.values():
+            if distribution.name is None:
+                distributions.append(("{0} {1} ({2} .. {3})".format(
+                    position, sampler_name, distribution.values[0], distribution.values[-1]), distribution))
+    return distributions
+
+def validate(implementation_name, pick_indexes, sample_count, bit_generator, distributions):
+    """ Runs one implementation against some Distributions; prints its speed and its goodness-of-fit results. """
+    generator = np.random.Generator(bit_generator(SEED))
+    seconds = 0.0
+    draw_count = low_p_count = 0
+    failures = []
+    for name, distribution in distributions:
+        if distribution.sampler.value_list != declared_values(distribution):
+            failures.append("{0}: its sampler picks from other values".format(name))
+            continue
+        chances = declared_chances(distribution)
+        start_time = time.perf_counter()
+        indexes = pick_indexes(distribution, sample_count, generator)
+        seconds += time.perf_counter() - start_time
+        draw_count += sample_count
+        counts = np.bincount(indexes, minlength=len(chances))
+        impossible_count = int(counts[chances == 0].sum())
+        statistic, degrees_of_freedom, p_value = chi_square_test(counts, chances)
+        if p_value < REPORT_P_VALUE:
+            low_p_count += 1
+        if impossible_count or p_value < FAILURE_P_VALUE:
+            failures.append("{0}: chi-square {1:.1f} with {2} degrees of freedom, p = {3:.2g}{4}".format(
+                name, statistic, degrees_of_freedom, p_value,
+                ", and {0} picks of values with no weight".format(impossible_count) if impossible_count else ""))
+
+    print("{0}: {1:,} picks, {2:,.0f} picks per second".format(
+        implementation_name, draw_count, draw_count / seconds if seconds else 0))
+    print("    {0} distributions with p < {1} ({2:.1f} expected by chance), {3} failed".format(
+        low_p_count, REPORT_P_VALUE, REPORT_P_VALUE * len(distributions), len(failures)))
+    for failure in failures:
+        print("        " + failure)
+    return not failures
+
+
+# ----------------------------------------------------- SECTION 4 -----------------------------------------------------
+# -------------------------------------------------- Main Function ----------------------------------------------------
+
+if __name__ == "__main__":
+
+    # Compiling the specs builds (and caches) a sampler for each of their distinct distributions.
+    POSITION_SPECS = load_position_specs()
+    SPEC_DISTRIBUTIONS = spec_distributions(POSITION_SPECS)
+    print("{0} distributions in {1} position specs ({2} of them named, with {3} distinct samplers):".format(
+        len(SPEC_DISTRIBUTIONS), len(POSITION_SPECS), len(DISTRIBUTIONS),
+        len({id(distribution.sampler) for _, distribution in SPEC_DISTRIBUTIONS})))
+
+    # get_weighted_random draws from NumPy's global generator.
+    np.random.seed(SEED)
+    ALL_PASSED = True
+    for IMPLEMENTATION in IMPLEMENTATIONS:
+        ALL_PASSED = validate(*IMPLEMENTATION, SPEC_DISTRIBUTIONS) and ALL_PASSED
+    sys.exit(0 if ALL_PASSED else 1)